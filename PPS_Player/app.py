@@ -6,16 +6,21 @@
 # v0.2.3 - 2025.04.26 - 디버깅 로그 시스템 추가 (logs/YYYY-MM-DD.log)
 # v0.2.4 - 2025.04.26 - 경로 처리 통일 (PyInstaller 대비 get_base_path 적용)
 # v0.3.0 - 2025.05.15 - PyQt6 호환 구조로 전환
+# v0.4.0 - 2026.10.18 - 기본 config 생성을 ConfigManager 로 일원화, 설정 파일 감시 시작
+# v0.5.0 - 2026.10.18 - 단계별 시작(지연 import/초기화), --startup-profile 시작 시간 측정
+# v0.6.0 - 2026.10.18 - 비동기 로그 파이프라인(LogPipeline) 적용: 백그라운드 일괄 쓰기, 회전/압축/용량 제한
 # ---------------------------
 
+import time
+_STARTED = time.perf_counter()
+
 import sys
 import os
-import json
 import logging
-from datetime import datetime
+from PyQt6.QtCore import Qt, QCoreApplication
 from PyQt6.QtWidgets import QApplication
-from PPS_Player.config.config_manager import ConfigManager
-from PPS_Player.ui.ui_main_window import MainWindow
+from PPS_Player.utils.log_pipeline import LogPipeline
+from PPS_Player.utils.startup_profiler import StartupProfiler
 
 # ✅ base 경로 함수 정의 (PyInstaller 대응)
 def get_base_path():
@@ -24,48 +29,67 @@ def get_base_path():
     return os.path.dirname(os.path.abspath(__file__))
 
 BASE_PATH = get_base_path()
+CONFIG_PATH = os.path.join(BASE_PATH, "config.json")
 
-# ✅ 로그 디렉토리 설정
-now = datetime.now()
-date_str = now.strftime("%Y-%m-%d")
-month_folder = now.strftime("%Y-%m")
-log_dir = os.path.join(BASE_PATH, "logs", month_folder)
-os.makedirs(log_dir, exist_ok=True)
-log_path = os.path.join(log_dir, f"{date_str}.log")
-
-# ✅ 로깅 설정
-logging.basicConfig(
-    filename=log_path,
-    filemode="a",
-    level=logging.DEBUG,
-    format="%(asctime)s [%(levelname)s] %(message)s"
-)
+# ✅ 로깅 설정 (logs/YYYY-MM/YYYY-MM-DD.log) - import 시점이 아닌 main() 에서 호출
+# 파일 쓰기는 백그라운드 스레드에서 일괄 처리. 설정 로딩 전까지는 기본값으로 동작
+def setup_logging():
+    return LogPipeline(os.path.join(BASE_PATH, "logs"),
+                       console="--console-log" in sys.argv).start()
 
-logging.info("💡 PPS_Player 실행 시작")
+# 설정 키 → LogPipeline.configure() 인자
+LOG_CONFIG_KEYS = {
+    "log_level": "level",
+    "log_max_mb": "max_mb",
+    "log_retention_days": "retention_days",
+    "log_total_cap_mb": "total_cap_mb",
+    "log_rate_burst": "rate_burst",
+    "log_rate_window": "rate_window",
+    "log_capture_stdio": "capture_stdio",
+}
 
-# ✅ config.json 자동 생성 로직
-CONFIG_PATH = os.path.join(BASE_PATH, "config.json")
-if not os.path.exists(CONFIG_PATH):
-    logging.warning("⚠️ config.json 없음. 기본값으로 생성합니다.")
-    with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-        json.dump({
-            "url": "https://www.naver.com",
-            "media_paths": [],
-            "bottom_height": 300,
-            "media_rolling": True
-        }, f, indent=2)
+def configure_logging(pipeline, config):
+    pipeline.configure(**{arg: config.get(key) for key, arg in LOG_CONFIG_KEYS.items()})
+    for key, arg in LOG_CONFIG_KEYS.items():
+        config.subscribe(key, lambda value, arg=arg: pipeline.configure(**{arg: value}))
 
 # ✅ 애플리케이션 진입점
 def main():
+    profiler = StartupProfiler("--startup-profile" in sys.argv, started=_STARTED)
+    pipeline = setup_logging()
     try:
-        config = ConfigManager().load_config(CONFIG_PATH)
+        logging.info("💡 PPS_Player 실행 시작")
+        profiler.mark("logging")
+
+        # QtWebEngine 을 QApplication 생성 후에 import 하기 위해 필요
+        QCoreApplication.setAttribute(Qt.ApplicationAttribute.AA_ShareOpenGLContexts)
         app = QApplication(sys.argv)
-        window = MainWindow(config)
+        profiler.mark("qapplication")
+
+        # config.json 이 없으면 기본값으로 생성 (기본값은 ConfigManager.SCHEMA 에서 관리)
+        from PPS_Player.config.config_manager import ConfigManager
+        config = ConfigManager(CONFIG_PATH)
+        config.ensure_exists()
+        config.load_config()
+        configure_logging(pipeline, config)
+        config.start_watching()
+        profiler.mark("config")
+
+        # QtWebEngine 등 무거운 모듈은 여기서 처음 로딩
+        from PPS_Player.ui.ui_main_window import MainWindow
+        profiler.mark("import_main_window")
+
+        window = MainWindow(config, profiler=profiler)
+        profiler.mark("main_window")
         window.show()
-        sys.exit(app.exec())  # ✅ PyQt6는 exec_() → exec()
+        exit_code = app.exec()  # ✅ PyQt6는 exec_() → exec()
+        logging.info("💡 PPS_Player 종료 (code %s)", exit_code)
     except Exception as e:
         logging.exception("🚨 예외 발생:")
         raise
+    finally:
+        pipeline.stop()  # 큐에 남은 로그를 모두 기록
+    sys.exit(exit_code)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
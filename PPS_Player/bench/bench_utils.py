@@ -0,0 +1,221 @@
+# PPS_Player/bench/bench_utils.py
+# ---------------------------
+# Version History
+# v0.1.0 - 2026.10.18 - 벤치마크 공용 도구 (로컬 HTTP 스텁 서버, 합성 미디어, 통계, 타이머 이벤트 계수)
+# v0.1.1 - 2026.10.18 - 스텁 서버: 명령 응답 지연(롱폴링 흉내), 범위를 벗어난 Range 는 416
+# v0.1.2 - 2026.10.18 - 스텁 서버: POST 응답 코드 지정(post_statuses)
+# ---------------------------
+
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from PyQt6.QtCore import QEvent, QObject, Qt
+from PyQt6.QtGui import QColor, QFont, QImage, QPainter
+
+DASHBOARD_HTML = b"""<!doctype html>
+<html><head><meta charset="utf-8"><title>stub dashboard</title></head>
+<body style="background:#123;color:#fff">
+<div id="n">0</div>
+<script>
+  var n = 0;
+  function dashboard_update() {
+    n += 1;
+    document.getElementById("n").textContent = n;
+    return new Promise(function (resolve) { setTimeout(resolve, 30); });
+  }
+</script>
+</body></html>
+"""
+
+
+class StubServer:
+    """폴링/대시보드/업로드 요청에 응답하는 로컬 HTTP 서버 (별도 스레드).
+
+    - GET  /commands/<store>  : ETag 지원, tts_every 번째 요청마다 tts 명령 반환, command_delay 초 지연
+    - GET  /dashboard         : dashboard_update() 가 있는 정적 페이지
+    - GET  /files/<name>      : files 에 등록한 바이트 (Range 지원, 범위 밖이면 416)
+    - GET  /json/<name>       : json_routes 에 등록한 객체
+    - POST /<any>             : 본문을 posts 목록에 저장하고 post_statuses 에서 하나씩 꺼낸 코드(없으면 200)
+    """
+
+    def __init__(self, tts_every=0):
+        self.tts_every = tts_every
+        self.command_delay = 0.0
+        self.requests = 0
+        self.command_requests = 0
+        self.files = {}
+        self.json_routes = {}
+        self.posts = []
+        self.post_statuses = []
+        self.lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status, body=b"", content_type="application/json", headers=None):
+                self.send_response(status)
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                if status != 304:
+                    self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                if body:
+                    self.wfile.write(body)
+
+            def do_GET(self):
+                with server.lock:
+                    server.requests += 1
+                path = self.path.split("?")[0]
+                if path.startswith("/commands/"):
+                    self._commands()
+                elif path == "/dashboard":
+                    self._send(200, DASHBOARD_HTML, "text/html; charset=utf-8")
+                elif path.startswith("/files/"):
+                    self._file(path[len("/files/"):])
+                elif path.startswith("/json/") and path[len("/json/"):] in server.json_routes:
+                    body = json.dumps(server.json_routes[path[len("/json/"):]]).encode("utf-8")
+                    self._send(200, body)
+                else:
+                    self._send(404)
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                body = self.rfile.read(length)
+                with server.lock:
+                    server.requests += 1
+                    server.posts.append((self.path, dict(self.headers), body))
+                    status = server.post_statuses.pop(0) if server.post_statuses else 200
+                self._send(status, b"{}")
+
+            def _commands(self):
+                with server.lock:
+                    server.command_requests += 1
+                    count = server.command_requests
+                if server.command_delay:
+                    time.sleep(server.command_delay)
+                if server.tts_every and count % server.tts_every == 0:
+                    body = json.dumps({"command": "tts", "text": f"벤치마크 {count}"}).encode("utf-8")
+                    self._send(200, body, headers={"ETag": f'"{count}"'})
+                elif self.headers.get("If-None-Match"):
+                    self._send(304, headers={"ETag": self.headers["If-None-Match"]})
+                else:
+                    self._send(200, b"[]", headers={"ETag": '"0"'})
+
+            def _file(self, name):
+                data = server.files.get(name)
+                if data is None:
+                    self._send(404)
+                    return
+                range_header = self.headers.get("Range")
+                if range_header and range_header.startswith("bytes="):
+                    start = int(range_header[6:].split("-")[0])
+                    if start >= len(data):
+                        self._send(416, headers={"Content-Range": f"bytes */{len(data)}"})
+                        return
+                    self._send(206, data[start:], "application/octet-stream",
+                               {"Content-Range": f"bytes {start}-{len(data) - 1}/{len(data)}"})
+                else:
+                    self._send(200, data, "application/octet-stream")
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name="StubServer", daemon=True)
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def make_synthetic_images(directory, count=6, size=(1920, 300)):
+    """서로 다른 색/문구의 PNG/JPG 이미지 생성. 경로 목록 반환."""
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    font = QFont()
+    font.setPointSize(48)
+    for i in range(count):
+        image = QImage(size[0], size[1], QImage.Format.Format_RGB32)
+        image.fill(QColor.fromHsv((i * 47) % 360, 160, 200))
+        painter = QPainter(image)
+        painter.setFont(font)
+        painter.setPen(QColor("white"))
+        painter.drawText(image.rect(), Qt.AlignmentFlag.AlignCenter, f"SLIDE {i + 1}")
+        painter.end()
+        ext = "png" if i % 2 == 0 else "jpg"
+        path = os.path.join(directory, f"slide_{i + 1:02d}.{ext}")
+        image.save(path)
+        paths.append(path)
+    return paths
+
+
+class TimerEventCounter(QObject):
+    """QApplication 전체의 QEvent.Timer 수(=타이머로 깨어난 횟수)를 센다. 벤치마크 전용."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.count = 0
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Timer:
+            self.count += 1
+        return False
+
+
+class FakeTTSEngine:
+    """pyttsx3 대체: 오디오 장치 없는 환경에서 발화 시간만 흉내."""
+
+    def __init__(self, seconds_per_char=0.005):
+        self.seconds_per_char = seconds_per_char
+        self._pending = []
+
+    def getProperty(self, name):
+        return {"voice": "fake", "rate": 200, "volume": 1.0}.get(name)
+
+    def say(self, text):
+        self._pending.append(text)
+
+    def runAndWait(self):
+        for text in self._pending:
+            time.sleep(len(text) * self.seconds_per_char)
+        self._pending = []
+
+
+def percentiles(values, points=(50, 95, 99)):
+    if not values:
+        return {"count": 0}
+    ordered = sorted(values)
+    result = {"count": len(ordered), "min": ordered[0], "max": ordered[-1],
+              "mean": sum(ordered) / len(ordered)}
+    for p in points:
+        index = min(len(ordered) - 1, int(round(p / 100.0 * (len(ordered) - 1))))
+        result[f"p{p}"] = ordered[index]
+    return result
+
+
+def linear_slope(xs, ys):
+    """최소제곱 기울기 (예: 롤링 1회당 RSS 증가량)."""
+    n = len(xs)
+    if n < 2:
+        return None
+    mean_x = sum(xs) / n
+    mean_y = sum(ys) / n
+    denom = sum((x - mean_x) ** 2 for x in xs)
+    if denom == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / denom
@@ -0,0 +1,162 @@
+# PPS_Player/bench/gif_benchmark.py
+# ---------------------------
+# Version History
+# v0.1.0 - 2026.10.18 - 애니메이션 GIF 프레임당 CPU 비교 (프레임 캐시 vs 매 프레임 스케일)
+# v0.1.1 - 2026.10.18 - processEvents 반복(바쁜 대기) 대신 QEventLoop.exec() 로 대기 → CPU 측정에 대기 루프가 섞이지 않음,
+#                       벽시계 시간/시간 초과 여부 기록
+# ---------------------------
+#
+# 실행 예:
+#   set QT_QPA_PLATFORM=offscreen
+#   python -m PPS_Player.bench.gif_benchmark --loops 5 --width 1920 --height 300
+# 재생 시간은 GIF 자체 프레임 지연을 따름 (기본 배너: 8프레임 x 6초 → 5회 반복에 방식별 약 4분)
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QEventLoop, QSize, Qt, QTimer
+from PyQt6.QtGui import QMovie
+from PyQt6.QtWidgets import QApplication, QLabel
+
+from PPS_Player.core.animated_image import AnimatedImagePlayer, FrameCache
+
+
+def default_gif():
+    base = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    found = glob.glob(os.path.join(base, "resources", "images", "*.gif"))
+    return found[0] if found else None
+
+
+def run_loop(start, timeout_s):
+    """start(finish) 호출 후 finish() 가 불리거나 timeout_s 가 지날 때까지 이벤트 루프에서 대기.
+
+    대기 중에는 이벤트가 올 때까지 잠들기 때문에 process_time() 에는 재생 작업만 잡힌다.
+    → (CPU 초, 벽시계 초, 시간 초과 여부)
+    """
+    loop = QEventLoop()
+    state = {"done": False}
+
+    def finish():
+        state["done"] = True
+        loop.quit()
+
+    timer = QTimer()
+    timer.setSingleShot(True)
+    timer.timeout.connect(loop.quit)
+    timer.start(int(timeout_s * 1000))
+    cpu, wall = time.process_time(), time.monotonic()
+    start(finish)
+    if not state["done"]:
+        loop.exec()
+    timer.stop()
+    return time.process_time() - cpu, time.monotonic() - wall, not state["done"]
+
+
+def summarize(state, cpu, wall, timed_out):
+    return {"frames": state["frames"], "loops": state["loops"], "cpu_s": cpu, "wall_s": wall,
+            "timed_out": timed_out, "cpu_ms_per_frame": cpu * 1000 / max(state["frames"], 1)}
+
+
+def bench_naive(path, size, loops, timeout_s):
+    """기존 방식: 원본 크기로 디코딩 후 매 프레임 SmoothTransformation 스케일."""
+    label = QLabel()
+    movie = QMovie(path)
+    movie.setCacheMode(QMovie.CacheMode.CacheNone)
+    state = {"frames": 0, "loops": 0, "seen": 0, "finish": None}
+
+    def on_frame(number):
+        if number == 0 and state["seen"]:
+            state["loops"] += 1
+            if state["loops"] >= loops:
+                movie.stop()
+                state["finish"]()
+                return
+        state["seen"] += 1
+        label.setPixmap(movie.currentPixmap().scaled(
+            size, Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.SmoothTransformation))
+        state["frames"] += 1
+
+    def on_finished():
+        state["loops"] += 1
+        if state["loops"] < loops:
+            movie.start()
+        else:
+            state["finish"]()
+
+    def start(finish):
+        state["finish"] = finish
+        movie.start()
+
+    movie.frameChanged.connect(on_frame)
+    movie.finished.connect(on_finished)
+    result = summarize(state, *run_loop(start, timeout_s))
+    movie.stop()
+    return result
+
+
+def bench_cached(path, size, loops, timeout_s, cache_mb):
+    """AnimatedImagePlayer: 디코딩 시 1회 스케일 + 프레임 캐시 재사용."""
+    label = QLabel()
+    player = AnimatedImagePlayer(label, FrameCache(cache_mb * 1024 * 1024))
+    state = {"frames": 0, "loops": 0, "finish": None}
+    player.frame_shown.connect(lambda: state.__setitem__("frames", state["frames"] + 1))
+
+    def on_loop(count):
+        state["loops"] = count
+        if count >= loops:
+            player.stop()
+            state["finish"]()
+
+    def start(finish):
+        state["finish"] = finish
+        player.play(path, size)
+
+    player.loop_finished.connect(on_loop)
+    result = summarize(state, *run_loop(start, timeout_s))
+    player.stop()
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="애니메이션 GIF 재생 CPU 벤치마크")
+    parser.add_argument("path", nargs="?", default=default_gif())
+    parser.add_argument("--loops", type=int, default=5)
+    parser.add_argument("--width", type=int, default=1920)
+    parser.add_argument("--height", type=int, default=300)
+    parser.add_argument("--cache-mb", type=int, default=256)
+    parser.add_argument("--timeout", type=float, default=300.0)
+    parser.add_argument("--output", help="결과 JSON 저장 경로 (기본: 표준출력)")
+    args = parser.parse_args(argv)
+    if not args.path or not os.path.exists(args.path):
+        parser.error("GIF 파일을 찾을 수 없습니다")
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    size = QSize(args.width, args.height)
+    result = {
+        "path": args.path,
+        "size": [args.width, args.height],
+        "loops": args.loops,
+        "naive": bench_naive(args.path, size, args.loops, args.timeout),
+        "cached": bench_cached(args.path, size, args.loops, args.timeout, args.cache_mb),
+    }
+    naive_ms = result["naive"]["cpu_ms_per_frame"]
+    cached_ms = result["cached"]["cpu_ms_per_frame"]
+    result["speedup"] = naive_ms / cached_ms if cached_ms else None
+
+    text = json.dumps(result, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        print(text)
+    return result
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,270 @@
+# PPS_Player/bench/soak.py
+# ---------------------------
+# Version History
+# v0.1.0 - 2026.10.18 - 오프스크린 QPA 기반 장시간(soak) 벤치마크: 전환 지연, RSS 증가, 타이머 깨어남, 폴링 왕복
+# v0.1.1 - 2026.10.18 - MainWindow 실행 시 인덱스/캐시/재생 증명/미디어 저장소 경로를 모두 임시 작업 디렉토리로 지정
+#                       (설치본의 캐시·인덱스·재생 증명 기록을 건드리지 않음), 재생 증명 업로드는 스텁 서버로만
+# ---------------------------
+#
+# 합성 이미지와 로컬 HTTP 스텁 서버로 MainWindow(또는 --no-window 시 MediaViewer 단독)를
+# 가속 롤링시키며 주기적으로 지표를 수집하고, 결과를 JSON 으로 남긴다.
+#
+# 실행 예:
+#   python -m PPS_Player.bench.soak --duration 3600 --interval 50 --output soak.json
+#   python -m PPS_Player.bench.soak --duration 120 --no-window
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QCoreApplication, Qt, QTimer, QT_VERSION_STR, PYQT_VERSION_STR
+from PyQt6.QtWidgets import QApplication
+
+from PPS_Player.bench.bench_utils import (FakeTTSEngine, StubServer, TimerEventCounter,
+                                          linear_slope, make_synthetic_images, percentiles)
+from PPS_Player.utils.utils import process_rss_bytes
+
+
+class SoakRun:
+    def __init__(self, args, app, server, media_paths, workdir):
+        self.args = args
+        self.app = app
+        self.server = server
+        self.media_paths = media_paths
+        self.workdir = workdir
+        self.window = None
+        self.viewer = None
+        self.tts_worker = None
+        self.network_client = None
+
+        self.switch_latencies = []
+        self.poll_rtts = []
+        self.poll_errors = 0
+        self.tts_latencies = []
+        self._tts_enqueued = {}
+        self.samples = []
+
+        self.timer_counter = TimerEventCounter()
+        app.installEventFilter(self.timer_counter)
+        self.started = time.monotonic()
+        self._last_sample = (self.started, 0)
+
+    # ---------- 구성 ----------
+    def setup(self):
+        if self.args.no_window:
+            self._setup_viewer_only()
+        else:
+            self._setup_main_window()
+
+    def _setup_viewer_only(self):
+        from PPS_Player.core.media_viewer import MediaViewer
+        from PPS_Player.core.network_client import NetworkClient
+        from PPS_Player.core.tts_worker import TTSWorker
+
+        self.viewer = MediaViewer(self.media_paths, interval=self.args.interval)
+        self.viewer.resize(1920, 300)
+        self.viewer.show()
+        self.tts_worker = TTSWorker()
+        self.tts_worker.create_engine = FakeTTSEngine
+        self.tts_worker.start()
+        self.network_client = NetworkClient(self.server.url, "bench", interval=self.args.poll_interval)
+        self.network_client.start_polling(self._on_commands)
+        self._instrument()
+
+    def _setup_main_window(self):
+        from PPS_Player.config.config_manager import ConfigManager
+
+        config_path = os.path.join(self.workdir, "config.json")
+        cache_dir = os.path.join(self.workdir, "cache")
+        with open(config_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "url": f"{self.server.url}/dashboard",
+                "media_paths": self.media_paths,
+                "media_interval": self.args.interval,
+                "web_refresh_interval": 5000,
+                # 상대 경로는 설치 경로 기준으로 풀리므로 모두 작업 디렉토리의 절대 경로로 지정
+                "media_index_path": os.path.join(cache_dir, "media_index.sqlite"),
+                "web_cache_dir": os.path.join(cache_dir, "web"),
+                "tts_cache_enabled": False,
+                "tts_cache_dir": os.path.join(cache_dir, "tts"),
+                "media_sync_enabled": False,
+                "media_store_dir": os.path.join(cache_dir, "media"),
+                # 재생 증명은 스텁 서버(server_url)로만 업로드
+                "pop_enabled": True,
+                "pop_dir": os.path.join(cache_dir, "pop"),
+                "metrics_enabled": False,
+                "server_url": self.server.url,
+                "store_id": "bench",
+                "poll_interval": self.args.poll_interval,
+            }, f, ensure_ascii=False, indent=2)
+        config = ConfigManager(config_path)
+        config.load_config()
+
+        from PPS_Player.ui.ui_main_window import MainWindow
+        self.window = MainWindow(config)
+        self.window.tts_worker.create_engine = FakeTTSEngine
+        self.tts_worker = self.window.tts_worker
+        self.window.show()
+
+        # MediaViewer/NetworkClient 는 첫 페인트 이후 생성됨
+        deadline = time.monotonic() + 30
+        while self.window.bottom_viewer is None and time.monotonic() < deadline:
+            self.app.processEvents()
+            time.sleep(0.01)
+        if self.window.bottom_viewer is None:
+            raise RuntimeError("MainWindow 지연 초기화가 끝나지 않음")
+        self.viewer = self.window.bottom_viewer
+        self.network_client = self.window.network_client
+        self._instrument()
+
+    def _instrument(self):
+        self.viewer.transition_measured.connect(lambda path, ms: self.switch_latencies.append(ms))
+
+        # 폴링 왕복 시간: 인스턴스 메서드를 감싸 워커 스레드에서 기록
+        original_poll = self.network_client.poll_once
+
+        def timed_poll():
+            started = time.perf_counter()
+            try:
+                return original_poll()
+            except Exception:
+                self.poll_errors += 1
+                raise
+            finally:
+                self.poll_rtts.append((time.perf_counter() - started) * 1000)
+
+        self.network_client.poll_once = timed_poll
+
+        # TTS: 대기열 투입 → 발화 종료까지
+        original_enqueue = self.tts_worker.enqueue
+
+        def timed_enqueue(text, *args, **kwargs):
+            self._tts_enqueued.setdefault(text.strip(), time.perf_counter())
+            return original_enqueue(text, *args, **kwargs)
+
+        self.tts_worker.enqueue = timed_enqueue
+        self.tts_worker.speech_finished.connect(self._on_tts_finished)
+
+    def _on_commands(self, data):
+        for command in data if isinstance(data, list) else [data]:
+            if isinstance(command, dict) and command.get("command") == "tts":
+                self.tts_worker.enqueue(command.get("text", ""))
+
+    def _on_tts_finished(self, text):
+        started = self._tts_enqueued.pop(text, None)
+        if started is not None:
+            self.tts_latencies.append((time.perf_counter() - started) * 1000)
+
+    # ---------- 수집 ----------
+    def sample(self):
+        now = time.monotonic()
+        last_time, last_timers = self._last_sample
+        timers = self.timer_counter.count
+        self._last_sample = (now, timers)
+        self.samples.append({
+            "t": round(now - self.started, 3),
+            "rss_bytes": process_rss_bytes(),
+            "rotations": len(self.switch_latencies),
+            "timer_wakeups_per_sec": (timers - last_timers) / max(now - last_time, 1e-6),
+            "tts_pending": self.tts_worker.pending_count(),
+            "server_requests": self.server.requests,
+        })
+
+    def summary(self):
+        # 초기 워밍업(캐시 채움 등) 구간은 RSS 기울기 계산에서 제외
+        steady = [s for s in self.samples if s["t"] >= self.args.warmup and s["rss_bytes"] is not None]
+        rss_slope = linear_slope([s["rotations"] for s in steady], [s["rss_bytes"] for s in steady])
+        wakeups = [s["timer_wakeups_per_sec"] for s in self.samples[1:]]
+        elapsed = time.monotonic() - self.started
+        return {
+            "elapsed_s": elapsed,
+            "rotations": len(self.switch_latencies),
+            "switch_latency_ms": percentiles(self.switch_latencies),
+            "rss_start_bytes": self.samples[0]["rss_bytes"] if self.samples else None,
+            "rss_end_bytes": self.samples[-1]["rss_bytes"] if self.samples else None,
+            "rss_growth_per_rotation_bytes": rss_slope,
+            "timer_wakeups_per_sec": percentiles(wakeups),
+            "poll_rtt_ms": percentiles(self.poll_rtts),
+            "poll_errors": self.poll_errors,
+            "polls_per_sec": len(self.poll_rtts) / max(elapsed, 1e-6),
+            "tts_latency_ms": percentiles(self.tts_latencies),
+        }
+
+    def shutdown(self):
+        if self.window is not None:
+            self.window.close()
+            return
+        if self.network_client is not None:
+            self.network_client.close()
+        if self.tts_worker is not None:
+            self.tts_worker.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="PPS_Player 오프스크린 soak 벤치마크")
+    parser.add_argument("--duration", type=float, default=600.0, help="실행 시간(초)")
+    parser.add_argument("--interval", type=int, default=50, help="이미지 롤링 간격(ms), 가속용")
+    parser.add_argument("--sample-every", type=float, default=5.0, help="지표 수집 주기(초)")
+    parser.add_argument("--warmup", type=float, default=30.0, help="RSS 기울기 계산에서 제외할 초기 구간(초)")
+    parser.add_argument("--images", type=int, default=6, help="합성 이미지 수")
+    parser.add_argument("--video", action="append", default=[], help="재생 목록에 추가할 영상 경로")
+    parser.add_argument("--poll-interval", type=float, default=0.5, help="폴링 간격(초)")
+    parser.add_argument("--tts-every", type=int, default=20, help="N 번째 폴링마다 TTS 명령 (0=끔)")
+    parser.add_argument("--no-window", action="store_true", help="QtWebEngine 없이 MediaViewer 만 실행")
+    parser.add_argument("--output", help="결과 JSON 저장 경로 (기본: 표준출력)")
+    args = parser.parse_args(argv)
+
+    if not args.no_window:
+        QCoreApplication.setAttribute(Qt.ApplicationAttribute.AA_ShareOpenGLContexts)
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+
+    workdir = tempfile.mkdtemp(prefix="pps_soak_")
+    server = StubServer(tts_every=args.tts_every).start()
+    media_paths = make_synthetic_images(os.path.join(workdir, "media"), args.images) + args.video
+    run = SoakRun(args, app, server, media_paths, workdir)
+    try:
+        run.setup()
+        run.sample()
+        sampler = QTimer()
+        sampler.timeout.connect(run.sample)
+        sampler.start(int(args.sample_every * 1000))
+        QTimer.singleShot(int(args.duration * 1000), app.quit)
+        app.exec()
+        sampler.stop()
+        run.sample()
+    finally:
+        run.shutdown()
+        server.stop()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    result = {
+        "meta": {
+            "started_at": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(time.time() - (time.monotonic() - run.started))),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "qt": QT_VERSION_STR,
+            "pyqt": PYQT_VERSION_STR,
+            "qpa": os.environ.get("QT_QPA_PLATFORM"),
+            "args": vars(args),
+        },
+        "summary": run.summary(),
+        "samples": run.samples,
+    }
+    text = json.dumps(result, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        print(text)
+    return result
+
+
+if __name__ == "__main__":
+    main()
@@ -3,15 +3,207 @@
 # Version History
 # v0.1.0 - 2025.04.25 - 기본 config 로딩 클래스 생성
 # v0.2.0 - 2025.04.26 - PyInstaller 대응을 위한 base_path 처리 추가
+# v0.3.0 - 2026.10.18 - 스키마/기본값 통합, 값 검증, 원자적 저장, 파일 감시 핫 리로드 + 키별 변경 시그널
+# v0.3.1 - 2026.10.18 - 애니메이션 GIF 설정(gif_loops, gif_cache_mb) 추가
+# v0.3.2 - 2026.10.18 - 계측(metrics_*) 설정 추가
+# v0.3.3 - 2026.10.18 - 로그(log_*) 설정 추가
+# v0.3.4 - 2026.10.18 - 웹뷰 캐시/렌더러 재활용(web_*) 설정 추가
+# v0.3.5 - 2026.10.18 - 대시보드 갱신 방식(web_refresh_mode: poll/push) 추가
+# v0.3.6 - 2026.10.18 - 배경 음악(music_*) 설정 추가
+# v0.3.7 - 2026.10.18 - 미디어 라이브러리 인덱스/감시(media_index_path, media_watch) 추가, media_paths 에 디렉토리/glob 허용
+# v0.3.8 - 2026.10.18 - 재생 증명(pop_*) 설정 추가
+# v0.3.9 - 2026.10.18 - 시간대/요일별 편성(schedule, schedule_prefetch_s) 추가
+# v0.3.10 - 2026.10.18 - 값 범위(min/max)/허용값(choices) 검증, 다시 읽을 때 잘못된 값은 기존 값 유지
+# v0.3.11 - 2026.10.18 - 즉시 반영되지 않는 키(구독자 없음)가 바뀌면 재시작 후 적용된다고 기록
 # ---------------------------
 
 import json
+import logging
 import os
 import sys
+from collections import defaultdict
 
-class ConfigManager:
-    def __init__(self):
-        self.config_path = self.get_default_config_path()
+from PyQt6.QtCore import QFileSystemWatcher, QObject, QTimer, pyqtSignal
+
+logger = logging.getLogger(__name__)
+
+# ✅ 설정 스키마: 키 → (타입, 기본값[, 제약]). 기본값은 이곳에서만 정의
+# 제약: {"min": 최소, "max": 최대, "choices": 허용값} (문자열 허용값은 대소문자 무시)
+SCHEMA = {
+    # 화면 구성
+    "url": (str, "https://www.naver.com"),
+    "web_refresh_interval": (int, 10000, {"min": 1000}),
+    "web_refresh_mode": (str, "poll", {"choices": ("poll", "push")}),
+    "bottom_height": (int, 300, {"min": 1}),
+    "instrumentation": (bool, False),
+
+    # 웹뷰 (web_renderer_max_mb 0 = 메모리 기준 재활용 안 함, web_recycle_hours 0 = 예약 재활용 안 함)
+    "web_cache_dir": (str, "cache/web"),
+    "web_cache_mb": (int, 50, {"min": 1}),
+    "web_cache_mode": (str, "disk", {"choices": ("disk", "memory")}),
+    "web_memory_check_interval": (int, 60, {"min": 0}),
+    "web_renderer_max_mb": (int, 800, {"min": 0}),
+    "web_recycle_hours": (int, 24, {"min": 0}),
+    "web_recycle_mode": (str, "swap", {"choices": ("swap", "reload")}),
+
+    # 로그 (log_total_cap_mb 0 = 용량 제한 없음, log_rate_burst 0 = 반복 억제 안 함)
+    "log_level": (str, "INFO", {"choices": ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")}),
+    "log_max_mb": (int, 10, {"min": 1}),
+    "log_retention_days": (int, 30, {"min": 1}),
+    "log_total_cap_mb": (int, 200, {"min": 0}),
+    "log_rate_burst": (int, 10, {"min": 0}),
+    "log_rate_window": (int, 60, {"min": 1}),
+    "log_capture_stdio": (bool, True),
+
+    # 계측 (metrics_port 0 = 엔드포인트 없음, metrics_dump_interval 0 = 덤프 없음)
+    "metrics_enabled": (bool, False),
+    "metrics_port": (int, 8765, {"min": 0, "max": 65535}),
+    "metrics_dump_interval": (int, 60, {"min": 0}),
+    "metrics_heartbeat_ms": (int, 250, {"min": 10}),
+
+    # 하단 미디어 (media_paths: 파일/디렉토리/glob 또는 {"path": ..., "duration": ms})
+    "media_paths": (list, []),
+    "media_index_path": (str, "cache/media_index.sqlite"),
+    "media_watch": (bool, True),
+    "media_rolling": (bool, True),
+    "media_interval": (int, 5000, {"min": 100}),
+    "image_prefetch_count": (int, 2, {"min": 0}),
+    "image_cache_mb": (int, 64, {"min": 1}),
+    "video_double_buffer": (bool, True),
+    "gif_loops": (int, 1, {"min": 0}),
+    "gif_cache_mb": (int, 64, {"min": 1}),
+
+    # 편성 (schedule: [{"days", "start", "end", "media_paths", "url", "interval", "priority"}, ...],
+    # 규칙이 없는 시간대는 위 url/media_paths/media_interval 사용)
+    "schedule": (list, []),
+    "schedule_prefetch_s": (int, 60, {"min": 0}),
+
+    # 배경 음악 (music_paths 가 비어 있으면 사용 안 함, 음량은 0~100)
+    "music_paths": (list, []),
+    "music_mode": (str, "loop", {"choices": ("loop", "shuffle", "repeat_one")}),
+    "music_crossfade_ms": (int, 2000, {"min": 0}),
+    "music_volume": (int, 60, {"min": 0, "max": 100}),
+    "music_duck_volume": (int, 15, {"min": 0, "max": 100}),
+
+    # TTS
+    "tts_queue_size": (int, 10, {"min": 1}),
+    "tts_overflow": (str, "drop", {"choices": ("drop", "merge")}),
+    "tts_cache_enabled": (bool, True),
+    "tts_cache_dir": (str, "cache/tts"),
+    "tts_cache_mb": (int, 50, {"min": 1}),
+    "tts_warmup_phrases": (list, []),
+
+    # 서버 연동
+    "server_url": (str, ""),
+    "store_id": (str, ""),
+    "poll_interval": (float, 5.0, {"min": 0.5}),
+    "poll_timeout": (float, 10.0, {"min": 1}),
+    "poll_long_poll": (bool, False),
+    "poll_long_poll_wait": (int, 30, {"min": 1}),
+
+    # 재생 증명 (업로드: POST <server_url>/<pop_upload_path>/<store_id>)
+    "pop_enabled": (bool, True),
+    "pop_dir": (str, "cache/pop"),
+    "pop_upload_path": (str, "pop"),
+    "pop_upload_interval": (int, 60, {"min": 1}),
+    "pop_segment_events": (int, 500, {"min": 1}),
+    "pop_segment_seconds": (int, 300, {"min": 1}),
+    "pop_fsync_interval": (int, 30, {"min": 1}),
+    "pop_quota_mb": (int, 50, {"min": 1}),
+
+    # 미디어 동기화
+    "media_sync_enabled": (bool, False),
+    "media_manifest_path": (str, ""),
+    "media_sync_interval": (int, 300, {"min": 10}),
+    "media_store_dir": (str, "cache/media"),
+    "media_store_quota_mb": (int, 2048, {"min": 1}),
+    "media_sync_workers": (int, 3, {"min": 1, "max": 16}),
+}
+
+# 사용자가 처음 열어볼 config.json 에 기록할 항목
+INITIAL_KEYS = ("url", "media_paths", "bottom_height", "media_rolling")
+
+
+def default_config():
+    return {key: (list(spec[1]) if isinstance(spec[1], list) else spec[1])
+            for key, spec in SCHEMA.items()}
+
+
+def coerce(key, value):
+    """스키마 타입으로 변환하고 제약을 확인. 변환할 수 없거나 범위를 벗어나면 ValueError."""
+    value = _coerce_type(SCHEMA[key][0], value)
+    limits = SCHEMA[key][2] if len(SCHEMA[key]) > 2 else {}
+    if "choices" in limits:
+        for choice in limits["choices"]:
+            if str(value).lower() == str(choice).lower():
+                return choice
+        raise ValueError(value)
+    if "min" in limits and value < limits["min"]:
+        raise ValueError(value)
+    if "max" in limits and value > limits["max"]:
+        raise ValueError(value)
+    return value
+
+
+def _coerce_type(expected, value):
+    if expected is bool:
+        if isinstance(value, bool):
+            return value
+        if isinstance(value, str) and value.lower() in ("true", "false"):
+            return value.lower() == "true"
+        raise ValueError(value)
+    if expected in (int, float):
+        if isinstance(value, bool):
+            raise ValueError(value)
+        return expected(value)
+    if expected is list:
+        if not isinstance(value, list):
+            raise ValueError(value)
+        return value
+    if expected is str:
+        if value is None:
+            raise ValueError(value)
+        return str(value)
+    return value
+
+
+def validate(raw, previous=None):
+    """잘못된 값은 previous(다시 읽기 전 설정)의 값, 없으면 기본값으로 대체."""
+    config = default_config()
+    for key, value in raw.items():
+        if key not in SCHEMA:
+            # 스키마에 없는 키도 보존 (상위 버전 설정 파일 호환)
+            config[key] = value
+            continue
+        try:
+            config[key] = coerce(key, value)
+        except (TypeError, ValueError):
+            if previous is not None and key in previous:
+                config[key] = previous[key]
+                logger.warning("⚠️ 설정값 오류: %s=%r, 기존 값 %r 유지", key, value, previous[key])
+            else:
+                logger.warning("⚠️ 설정값 오류: %s=%r, 기본값 %r 사용", key, value, SCHEMA[key][1])
+    return config
+
+
+class ConfigManager(QObject):
+    """config.json 로딩/검증/저장 + 변경 감시.
+
+    dict 처럼 get()/[] 로 읽을 수 있으며, start_watching() 이후 파일이 바뀌면
+    실제로 값이 바뀐 키마다 changed(key, value) 시그널을 보낸다.
+    subscribe() 된 키만 실행 중에 반영되며, 나머지 스키마 키는 재시작해야 적용된다
+    (restart_pending 에 모아 둠).
+    """
+    changed = pyqtSignal(str, object)
+
+    def __init__(self, config_path=None, parent=None):
+        super().__init__(parent)
+        self.config_path = config_path or self.get_default_config_path()
+        self.values = default_config()
+        self._subscribers = defaultdict(list)
+        self.restart_pending = set()
+        self.watcher = None
+        self.reload_timer = None
 
     def get_default_config_path(self):
         if getattr(sys, 'frozen', False):
@@ -20,10 +212,100 @@ class ConfigManager:
             base_path = os.path.dirname(os.path.abspath(__file__))
         return os.path.join(base_path, '..', 'config.json')
 
+    def get(self, key, default=None):
+        return self.values.get(key, default)
+
+    def __getitem__(self, key):
+        return self.values[key]
+
+    def as_dict(self):
+        return dict(self.values)
+
+    def ensure_exists(self):
+        if os.path.exists(self.config_path):
+            return False
+        logger.warning("⚠️ config.json 없음. 기본값으로 생성합니다.")
+        defaults = default_config()
+        self.write_file({key: defaults[key] for key in INITIAL_KEYS})
+        return True
+
     def load_config(self, path=None):
-        config_file = path or self.config_path
-        if not os.path.exists(config_file):
-            raise FileNotFoundError(f"설정 파일을 찾을 수 없습니다: {config_file}")
+        if path:
+            self.config_path = path
+        if not os.path.exists(self.config_path):
+            raise FileNotFoundError(f"설정 파일을 찾을 수 없습니다: {self.config_path}")
+
+        with open(self.config_path, 'r', encoding='utf-8') as f:
+            self.values = validate(json.load(f))
+        return self.values
+
+    def write_file(self, data):
+        # 임시 파일에 쓴 뒤 교체 → 읽는 쪽이 반쯤 쓰인 파일을 보지 않음
+        tmp_path = self.config_path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.config_path)
+
+    def set(self, key, value, save=True):
+        value = coerce(key, value) if key in SCHEMA else value
+        if self.values.get(key) == value:
+            return
+        self.values[key] = value
+        if save:
+            self.save()
+        self._notify(key, value)
+
+    def save(self):
+        # 기본값과 같은 항목은 기록하지 않아 파일을 간결하게 유지
+        defaults = default_config()
+        data = {key: value for key, value in self.values.items()
+                if key not in defaults or defaults[key] != value or key in INITIAL_KEYS}
+        self.write_file(data)
+
+    def subscribe(self, key, callback):
+        """특정 키가 바뀔 때만 callback(value) 호출."""
+        self._subscribers[key].append(callback)
+
+    def start_watching(self, debounce_ms=500):
+        self.watcher = QFileSystemWatcher(self)
+        # 편집기가 파일을 교체 저장하면 파일 감시가 풀리므로 디렉토리도 함께 감시
+        self.watcher.addPath(os.path.dirname(os.path.abspath(self.config_path)))
+        self.watcher.addPath(self.config_path)
+        self.reload_timer = QTimer(self)
+        self.reload_timer.setSingleShot(True)
+        self.reload_timer.setInterval(debounce_ms)
+        self.reload_timer.timeout.connect(self.reload)
+        self.watcher.fileChanged.connect(lambda _: self.reload_timer.start())
+        self.watcher.directoryChanged.connect(lambda _: self.reload_timer.start())
+
+    def reload(self):
+        if self.watcher is not None and self.config_path not in self.watcher.files() \
+                and os.path.exists(self.config_path):
+            self.watcher.addPath(self.config_path)
+        old = self.values
+        try:
+            with open(self.config_path, 'r', encoding='utf-8') as f:
+                new = validate(json.load(f), previous=old)
+        except (OSError, ValueError) as e:
+            logger.warning("⚠️ config.json 다시 읽기 실패, 기존 설정 유지: %s", e)
+            return
+        self.values = new
+        for key in sorted(set(old) | set(new)):
+            if old.get(key) == new.get(key):
+                continue
+            if key in SCHEMA and not self._subscribers.get(key):
+                self.restart_pending.add(key)
+                logger.warning("🔧 설정 변경: %s = %r (실행 중 반영 안 됨, 재시작 후 적용)", key, new.get(key))
+            else:
+                logger.info("🔧 설정 변경: %s = %r", key, new.get(key))
+            self._notify(key, new.get(key))
 
-        with open(config_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+    def _notify(self, key, value):
+        self.changed.emit(key, value)
+        for callback in self._subscribers.get(key, []):
+            try:
+                callback(value)
+            except Exception:
+                logger.exception("설정 변경 반영 실패: %s", key)
@@ -0,0 +1,205 @@
+# PPS_Player/core/animated_image.py
+# ---------------------------
+# Version History
+# v0.1.0 - 2026.10.18 - 애니메이션 GIF 재생 추가 (QMovie 디코딩 시 1회 스케일, 프레임 캐시 재사용, 반복 횟수 알림)
+# v0.1.1 - 2026.10.18 - loop_finished 처리 중 정지/다른 미디어 재생이 시작되면 이전 프레임을 라벨에 다시 그리지 않음
+# ---------------------------
+
+import logging
+from collections import OrderedDict
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+from PyQt6.QtGui import QImageReader, QMovie
+
+from PPS_Player.core.image_cache import image_cache_key
+
+logger = logging.getLogger(__name__)
+
+ANIMATED_EXTENSIONS = (".gif",)
+
+
+def is_animated(path):
+    # 헤더만 읽어 프레임 수 확인 (전체 디코딩 없음)
+    reader = QImageReader(path)
+    return reader.supportsAnimation() and reader.imageCount() != 1
+
+
+class FrameCache:
+    """스케일 완료된 애니메이션 프레임 목록 [(QPixmap, delay_ms), ...] 을 바이트 기준 LRU 로 보관.
+
+    같은 크기로 다시 재생되는 경우(반복, 다음 롤링 주기) 디코딩/스케일 없이 그대로 재사용한다.
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._items = OrderedDict()
+
+    @staticmethod
+    def frames_bytes(frames):
+        return sum(pixmap.width() * pixmap.height() * pixmap.depth() // 8 for pixmap, _ in frames)
+
+    def get(self, key):
+        entry = self._items.get(key)
+        if entry is None:
+            return None
+        self._items.move_to_end(key)
+        return entry[0]
+
+    def put(self, key, frames):
+        size = self.frames_bytes(frames)
+        if key is None or not frames or size > self.max_bytes:
+            return False
+        old = self._items.pop(key, None)
+        if old is not None:
+            self.total_bytes -= old[1]
+        self._items[key] = (frames, size)
+        self.total_bytes += size
+        while self.total_bytes > self.max_bytes and self._items:
+            _, (_, evicted) = self._items.popitem(last=False)
+            self.total_bytes -= evicted
+        return True
+
+    def clear(self):
+        self._items.clear()
+        self.total_bytes = 0
+
+
+class AnimatedImagePlayer(QObject):
+    """QLabel 에 애니메이션 이미지를 재생.
+
+    첫 반복은 QMovie 가 setScaledSize 로 디코딩 단계에서 한 번만 스케일하고, 그 프레임을
+    FrameCache 에 모아 둔다. 이후 반복은 캐시된 pixmap 을 타이머로 교체하기만 한다.
+    프레임 총 용량이 캐시 한도를 넘으면 캐시 없이 QMovie 로 계속 재생한다.
+    """
+    frame_shown = pyqtSignal()
+    loop_finished = pyqtSignal(int)  # 지금까지 완료한 반복 횟수
+
+    def __init__(self, label, cache, parent=None):
+        super().__init__(parent)
+        self.label = label
+        self.cache = cache
+        self.movie = None
+        self.frames = None
+        self.frame_index = 0
+        self.loops = 0
+        self.key = None
+        self._captured = []
+        self._capturing = False
+        self._frames_in_loop = 0
+        self._generation = 0  # play()/stop() 마다 증가 → 시그널 처리 중 재시작 여부 판단
+
+        self.frame_timer = QTimer(self)
+        self.frame_timer.setSingleShot(True)
+        self.frame_timer.timeout.connect(self._next_cached_frame)
+
+    def play(self, path, size):
+        self.stop()
+        self.loops = 0
+        self.key = image_cache_key(path, size)
+        frames = self.cache.get(self.key)
+        if frames:
+            self._play_cached(frames)
+            return True
+
+        self.movie = QMovie(path)
+        if not self.movie.isValid():
+            logger.warning("애니메이션 이미지 로딩 실패: %s", path)
+            self.movie = None
+            return False
+        self.movie.setCacheMode(QMovie.CacheMode.CacheNone)
+        self.movie.setScaledSize(size)
+        self._captured = []
+        self._capturing = True
+        self._frames_in_loop = 0
+        self.movie.frameChanged.connect(self._on_movie_frame)
+        self.movie.finished.connect(self._on_movie_finished)
+        self.movie.start()
+        return True
+
+    def stop(self):
+        self._generation += 1
+        self.frame_timer.stop()
+        self.frames = None
+        self._captured = []
+        self._capturing = False
+        if self.movie is not None:
+            self.movie.frameChanged.disconnect(self._on_movie_frame)
+            self.movie.finished.disconnect(self._on_movie_finished)
+            self.movie.stop()
+            self.movie.deleteLater()
+            self.movie = None
+
+    def is_playing(self):
+        return self.movie is not None or self.frames is not None
+
+    def _on_movie_frame(self, frame_number):
+        if frame_number == 0 and self._frames_in_loop:
+            # 처음 프레임으로 돌아옴 = 한 번 반복 완료
+            if self._finish_loop():
+                return
+        self._frames_in_loop += 1
+        pixmap = self.movie.currentPixmap()
+        if self._capturing:
+            self._captured.append((pixmap, max(self.movie.nextFrameDelay(), 20)))
+            if FrameCache.frames_bytes(self._captured) > self.cache.max_bytes:
+                logger.info("애니메이션 프레임이 캐시 한도 초과, 스트리밍 재생: %s", self.key)
+                self._capturing = False
+                self._captured = []
+        self.label.setPixmap(pixmap)
+        self.frame_shown.emit()
+
+    def _on_movie_finished(self):
+        # 반복 횟수가 정해진 GIF 는 finished 로 끝남 → 롤링 기준 반복을 위해 계속 재생
+        if not self._finish_loop():
+            self.movie.start()
+
+    def _finish_loop(self):
+        """반복 1회 완료 처리. 현재 QMovie 로 계속 재생하지 않으면 True
+        (캐시 재생으로 전환, 또는 loop_finished 처리 중 정지/다른 미디어 재생)."""
+        self.loops += 1
+        self._frames_in_loop = 0
+        switched = False
+        if self._capturing and self.cache.put(self.key, self._captured):
+            frames = self._captured
+            loops = self.loops
+            self.stop()
+            self.loops = loops
+            self._play_cached(frames, start_timer=False)
+            switched = True
+        self._capturing = False
+        self._captured = []
+        generation = self._generation
+        self.loop_finished.emit(self.loops)
+        if generation != self._generation:
+            # 슬롯에서 stop()/play() 가 불림 → 라벨은 이미 다음 미디어의 것
+            return True
+        if switched:
+            self._show_cached_frame()
+        return switched
+
+    def _play_cached(self, frames, start_timer=True):
+        self.frames = frames
+        self.frame_index = 0
+        if start_timer:
+            self._show_cached_frame()
+
+    def _show_cached_frame(self):
+        pixmap, delay = self.frames[self.frame_index]
+        self.label.setPixmap(pixmap)
+        self.frame_shown.emit()
+        self.frame_timer.start(delay)
+
+    def _next_cached_frame(self):
+        if self.frames is None:
+            return
+        self.frame_index += 1
+        if self.frame_index >= len(self.frames):
+            self.frame_index = 0
+            self.loops += 1
+            generation = self._generation
+            self.loop_finished.emit(self.loops)
+            # loop_finished 에서 정지했거나 다음 미디어로 넘어갔으면 중단
+            if generation != self._generation:
+                return
+        self._show_cached_frame()
@@ -0,0 +1,148 @@
+# PPS_Player/core/image_cache.py
+# ---------------------------
+# Version History
+# v0.1.0 - 2026.10.18 - 이미지 사전 디코딩/스케일링 캐시 추가 (백그라운드 프리페치 + LRU)
+# v0.1.1 - 2026.10.18 - 디코딩/스케일 시간, 캐시 히트/미스 계측
+# ---------------------------
+
+import logging
+import os
+from collections import OrderedDict
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, Qt, pyqtSignal
+from PyQt6.QtGui import QImageReader
+
+from PPS_Player.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+def image_cache_key(path, size):
+    """(절대경로, mtime, 폭, 높이) 형태의 캐시 키. 파일이 없으면 None."""
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return None
+    return (os.path.abspath(path), mtime, size.width(), size.height())
+
+
+def load_scaled_image(path, width, height):
+    # QImage 는 GUI 스레드 밖에서도 안전하게 다룰 수 있음
+    reader = QImageReader(path)
+    reader.setAutoTransform(True)
+    with metrics.timer("media_decode_ms"):
+        image = reader.read()
+    if image.isNull():
+        logger.warning("이미지 디코딩 실패: %s (%s)", path, reader.errorString())
+        return image
+    with metrics.timer("media_scale_ms"):
+        return image.scaled(width, height,
+                            Qt.AspectRatioMode.IgnoreAspectRatio,
+                            Qt.TransformationMode.SmoothTransformation)
+
+
+class ImageCache:
+    """스케일 완료된 QImage 를 바이트 크기 기준으로 제한하는 LRU 캐시."""
+
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._items = OrderedDict()
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def get(self, key):
+        image = self._items.get(key)
+        if image is not None:
+            self._items.move_to_end(key)
+        return image
+
+    def put(self, key, image):
+        if key is None or image is None or image.isNull():
+            return
+        size = image.sizeInBytes()
+        if size > self.max_bytes:
+            return
+        old = self._items.pop(key, None)
+        if old is not None:
+            self.total_bytes -= old.sizeInBytes()
+        self._items[key] = image
+        self.total_bytes += size
+        while self.total_bytes > self.max_bytes and self._items:
+            _, evicted = self._items.popitem(last=False)
+            self.total_bytes -= evicted.sizeInBytes()
+
+    def clear(self):
+        self._items.clear()
+        self.total_bytes = 0
+
+
+class _ScaleSignals(QObject):
+    finished = pyqtSignal(int, object, object)  # generation, key, QImage
+
+
+class _ScaleJob(QRunnable):
+    def __init__(self, generation, key, path, width, height, signals):
+        super().__init__()
+        self.generation = generation
+        self.key = key
+        self.path = path
+        self.width = width
+        self.height = height
+        self.signals = signals
+
+    def run(self):
+        image = load_scaled_image(self.path, self.width, self.height)
+        self.signals.finished.emit(self.generation, self.key, image)
+
+
+class ImagePrefetcher(QObject):
+    """다음 이미지들을 워커 스레드에서 미리 디코딩/스케일해 ImageCache 에 채움.
+
+    캐시 갱신은 항상 GUI 스레드(finished 시그널 수신측)에서만 일어난다.
+    """
+
+    def __init__(self, cache, parent=None):
+        super().__init__(parent)
+        self.cache = cache
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)  # 저사양 PC에서 재생을 방해하지 않도록 1개만 사용
+        self._generation = 0
+        self._pending = set()
+        self._signals = _ScaleSignals()
+        self._signals.finished.connect(self._on_finished)
+
+    def get_or_load(self, path, size):
+        """캐시 히트면 즉시 반환, 아니면 GUI 스레드에서 동기 로딩 후 캐시에 저장."""
+        key = image_cache_key(path, size)
+        image = self.cache.get(key)
+        metrics.inc("image_cache_hits" if image is not None else "image_cache_misses")
+        if image is None:
+            image = load_scaled_image(path, size.width(), size.height())
+            self.cache.put(key, image)
+        return image
+
+    def prefetch(self, paths, size):
+        if size.isEmpty():
+            return
+        for path in paths:
+            key = image_cache_key(path, size)
+            if key is None or key in self.cache or key in self._pending:
+                continue
+            self._pending.add(key)
+            self.pool.start(_ScaleJob(self._generation, key, path,
+                                      size.width(), size.height(), self._signals))
+
+    def invalidate(self):
+        # 진행 중인 작업 결과는 세대 번호로 걸러냄
+        self._generation += 1
+        self._pending.clear()
+        self.pool.clear()
+        self.cache.clear()
+
+    def _on_finished(self, generation, key, image):
+        if generation != self._generation:
+            return
+        self._pending.discard(key)
+        self.cache.put(key, image)
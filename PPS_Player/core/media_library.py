@@ -0,0 +1,478 @@
+# PPS_Player/core/media_library.py
+# ---------------------------
+# Version History
+# v0.1.0 - 2026.10.18 - 미디어 라이브러리: 디렉토리/glob 소스, 1회 probe(종류/해상도/길이/크기/mtime),
+#                       SQLite 인덱스, 디렉토리 감시로 변경분만 다시 probe, 검증된 재생 목록 제공
+# v0.2.0 - 2026.10.18 - prepare(): 다음 편성 소스를 미리 스캔해 두고 set_sources() 시 바로 재생 목록 전달
+# v0.2.1 - 2026.10.18 - 인덱스 정리: 현재/편성 소스에 없는 항목 삭제 (전체 행 stat 없음), 준비된 목록 수 제한
+# v0.3.0 - 2026.10.18 - 증분 스캔: 감시가 알린 디렉토리의 소스만 다시 펼치고 그 디렉토리 파일만 stat,
+#                       편성 소스는 규칙이 바뀔 때만 다시 펼침. probe 한 영상 길이를 PlaylistItem 에 전달,
+#                       mp4 tkhd 에서 영상 해상도 기록
+# ---------------------------
+
+import glob
+import json
+import logging
+import os
+import sqlite3
+import struct
+import threading
+import time
+
+from PyQt6.QtCore import QFileSystemWatcher, QObject, QTimer, pyqtSignal
+from PyQt6.QtGui import QImageReader
+
+logger = logging.getLogger(__name__)
+
+MAX_PREPARED = 4  # 보관할 사전 준비 재생 목록 수
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".gif", ".bmp", ".webp")
+VIDEO_EXTENSIONS = (".mp4", ".m4v", ".mov", ".avi", ".mkv", ".webm", ".wmv")
+# ISO BMFF(mp4 계열): mvhd 박스에서 길이를 바로 읽을 수 있음
+BMFF_EXTENSIONS = (".mp4", ".m4v", ".mov")
+
+KIND_IMAGE = "image"
+KIND_VIDEO = "video"
+
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS media (
+    path TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    width INTEGER,
+    height INTEGER,
+    duration_ms INTEGER,
+    size INTEGER NOT NULL,
+    mtime REAL NOT NULL,
+    valid INTEGER NOT NULL,
+    error TEXT
+);
+CREATE TABLE IF NOT EXISTS playlist (
+    position INTEGER PRIMARY KEY,
+    path TEXT NOT NULL,
+    duration_ms INTEGER
+);
+"""
+
+
+def media_kind(path):
+    """확장자로 판단한 미디어 종류. 지원하지 않으면 None."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext in IMAGE_EXTENSIONS:
+        return KIND_IMAGE
+    if ext in VIDEO_EXTENSIONS:
+        return KIND_VIDEO
+    return None
+
+
+class PlaylistItem:
+    """MediaViewer 에 넘기는 검증된 재생 항목.
+
+    duration_ms: 설정에서 지정한 표시 시간. None 이면 기본 간격(이미지)/끝까지(영상).
+    media_duration_ms: probe 로 읽은 영상 자체 길이 (모르면 None).
+    """
+
+    def __init__(self, path, kind, duration_ms=None, media_duration_ms=None):
+        self.path = path
+        self.kind = kind
+        self.duration_ms = duration_ms
+        self.media_duration_ms = media_duration_ms
+
+    def __eq__(self, other):
+        return isinstance(other, PlaylistItem) and \
+            (self.path, self.kind, self.duration_ms, self.media_duration_ms) == \
+            (other.path, other.kind, other.duration_ms, other.media_duration_ms)
+
+    def __repr__(self):
+        return f"PlaylistItem({self.path!r}, {self.kind!r}, {self.duration_ms!r}, {self.media_duration_ms!r})"
+
+
+def mp4_info(path):
+    """moov/mvhd 의 timescale/duration 으로 길이(ms), 첫 영상 트랙 tkhd 로 해상도 계산.
+
+    → (duration_ms, width, height). moov/mvhd 를 찾지 못하면 None.
+    """
+    with open(path, "rb") as f:
+        file_size = os.fstat(f.fileno()).st_size
+        moov = _find_box(f, b"moov", 0, file_size)
+        if moov is None:
+            return None
+        mvhd = _find_box(f, b"mvhd", *moov)
+        if mvhd is None:
+            return None
+        f.seek(mvhd[0])
+        version = f.read(4)[0]
+        if version == 1:
+            f.seek(16, os.SEEK_CUR)
+            timescale, duration = struct.unpack(">IQ", f.read(12))
+        else:
+            f.seek(8, os.SEEK_CUR)
+            timescale, duration = struct.unpack(">II", f.read(8))
+        width = height = None
+        for trak in _iter_boxes(f, b"trak", *moov):
+            tkhd = _find_box(f, b"tkhd", *trak)
+            if tkhd is None:
+                continue
+            f.seek(tkhd[0])
+            # 버전/플래그 이후 시각·트랙 ID·길이(v1 은 64비트)·예약·레이어·볼륨·행렬 다음에 16.16 고정소수점 너비/높이
+            f.seek(87 if f.read(1)[0] == 1 else 75, os.SEEK_CUR)
+            track_width, track_height = struct.unpack(">II", f.read(8))
+            if track_width and track_height:  # 오디오 트랙은 0
+                width, height = track_width >> 16, track_height >> 16
+                break
+    if not timescale:
+        return None
+    return int(duration * 1000 / timescale), width, height
+
+
+def _iter_boxes(f, box_type, start, end):
+    # box_type 박스마다 (내용 시작, 내용 끝). mdat 같은 큰 박스는 읽지 않고 건너뜀
+    offset = start
+    while offset + 8 <= end:
+        f.seek(offset)
+        header = f.read(8)
+        if len(header) < 8:
+            return
+        size, kind = struct.unpack(">I4s", header)
+        header_size = 8
+        if size == 1:
+            size = struct.unpack(">Q", f.read(8))[0]
+            header_size = 16
+        elif size == 0:
+            size = end - offset
+        if size < header_size:
+            return
+        if kind == box_type:
+            yield offset + header_size, offset + size
+        offset += size
+
+
+def _find_box(f, box_type, start, end):
+    return next(_iter_boxes(f, box_type, start, end), None)
+
+
+def probe(path):
+    """파일 한 개 분석 → (kind, width, height, duration_ms, valid, error). 디코딩은 하지 않음."""
+    kind = media_kind(path)
+    if kind is None:
+        return None, None, None, None, False, "unsupported"
+    if kind == KIND_IMAGE:
+        reader = QImageReader(path)
+        size = reader.size()  # 헤더만 읽음
+        if not reader.canRead() or not size.isValid():
+            return kind, None, None, None, False, reader.errorString()
+        return kind, size.width(), size.height(), None, True, None
+    if not path.lower().endswith(BMFF_EXTENSIONS):
+        return kind, None, None, None, True, None
+    try:
+        info = mp4_info(path)
+    except (OSError, struct.error, IndexError) as e:
+        return kind, None, None, None, False, str(e)
+    if info is None:
+        return kind, None, None, None, False, "moov/mvhd 없음"
+    duration, width, height = info
+    return kind, width, height, duration, True, None
+
+
+def _is_glob(pattern):
+    return any(ch in pattern for ch in "*?[")
+
+
+def expand_source(source):
+    """media_paths 항목 1개(파일/디렉토리/glob, 또는 {"path", "duration"}) → [(경로, duration_ms)], 감시 디렉토리 집합."""
+    duration = None
+    if isinstance(source, dict):
+        duration = source.get("duration")
+        source = source.get("path", "")
+    if not source:
+        return [], set()
+    watch_dirs = set()
+    if _is_glob(source):
+        paths = sorted(glob.glob(source, recursive=True))
+        base = source[:min(source.find(ch) for ch in "*?[" if ch in source)]
+        watch_dirs.add(os.path.dirname(base) or ".")
+    elif os.path.isdir(source):
+        paths = []
+        for root, dirs, names in os.walk(source):
+            dirs.sort()
+            watch_dirs.add(root)
+            paths.extend(os.path.join(root, name) for name in sorted(names))
+    else:
+        # 단일 파일은 아직 없어도 목록에 두고 상위 디렉토리를 감시
+        paths = [source]
+        watch_dirs.add(os.path.dirname(source) or ".")
+    entries = [(path, duration) for path in paths if media_kind(path) is not None]
+    return entries, {d for d in watch_dirs if os.path.isdir(d)}
+
+
+def merge_entries(expanded):
+    """소스별 펼친 결과 목록 → 중복 경로를 뺀 [(경로, duration_ms)], 감시 디렉토리 목록."""
+    entries = []
+    watch_dirs = set()
+    seen = set()
+    for source_entries, source_dirs in expanded:
+        watch_dirs |= source_dirs
+        for path, duration in source_entries:
+            if path not in seen:
+                seen.add(path)
+                entries.append((path, duration))
+    return entries, sorted(watch_dirs)
+
+
+def expand_sources(sources):
+    """media_paths 전체 → [(경로, duration_ms)], 감시 디렉토리 목록."""
+    return merge_entries(expand_source(source) for source in sources)
+
+
+class MediaLibrary(QObject):
+    """media_paths 소스를 스캔해 SQLite 인덱스에 보관하고 검증된 재생 목록을 제공.
+
+    - cached_playlist(): 마지막 스캔 결과를 바로 반환 (시작 시 파일 확인/디코딩 없음)
+    - start()/set_sources(): 백그라운드 스레드에서 stat 후 크기/mtime 이 바뀐 파일만 probe
+    - 소스 디렉토리 변경 시 debounce 후 그 디렉토리를 포함한 소스만 다시 펼치고 그 디렉토리의 파일만 stat,
+      목록이 바뀐 경우에만 playlist_changed
+    - prepare(): 다음에 쓸 소스를 미리 probe 하고 결과를 보관 (playlist_prepared), 현재 목록은 그대로
+    """
+    playlist_changed = pyqtSignal(list)
+    playlist_prepared = pyqtSignal(list)
+    _watch_requested = pyqtSignal(list)
+
+    def __init__(self, sources, index_path, watch=True, debounce_ms=1000, parent=None):
+        super().__init__(parent)
+        self.sources = list(sources)
+        self.index_path = index_path
+        self.playlist = []
+        self.prepared = {}  # 소스 키 → 미리 스캔한 재생 목록 (오래된 것부터 MAX_PREPARED 개까지)
+        self.retained_sources = []  # 현재 소스 외에 인덱스에 남겨 둘 소스 목록들 (편성 규칙별)
+        self._prepare_queue = []
+        self._dirty_dirs = set()  # 감시가 알린 변경 디렉토리 (다음 증분 스캔 대상)
+        self._full_scan = True
+        self._retained_changed = True
+        # 아래는 스캔 스레드 전용
+        self._expanded = {}  # 소스 키 → 펼친 결과 (entries, 감시 디렉토리)
+        self._present = set()  # 마지막 스캔에서 현재 소스에 실제로 있던 경로
+        self._retained_paths = set()
+        self._lock = threading.Lock()
+        self._scan_requested = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread = None
+        os.makedirs(os.path.dirname(os.path.abspath(index_path)), exist_ok=True)
+
+        self.watcher = None
+        if watch:
+            self.watcher = QFileSystemWatcher(self)
+            self.watcher.directoryChanged.connect(self.on_directory_changed)
+        self.rescan_timer = QTimer(self)
+        self.rescan_timer.setSingleShot(True)
+        self.rescan_timer.setInterval(debounce_ms)
+        self.rescan_timer.timeout.connect(self._scan_requested.set)
+        self._watch_requested.connect(self.update_watch)
+
+    def connect_db(self):
+        conn = sqlite3.connect(self.index_path, timeout=5)
+        conn.executescript(SCHEMA_SQL)
+        return conn
+
+    def cached_playlist(self):
+        try:
+            conn = self.connect_db()
+            try:
+                rows = conn.execute(
+                    "SELECT p.path, m.kind, p.duration_ms, m.duration_ms FROM playlist p "
+                    "JOIN media m ON m.path = p.path WHERE m.valid = 1 ORDER BY p.position").fetchall()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.warning("미디어 인덱스 읽기 실패: %s", e)
+            return []
+        self.playlist = [PlaylistItem(*row) for row in rows]
+        return self.playlist
+
+    def start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run, name="MediaLibrary", daemon=True)
+            self._thread.start()
+        self.request_scan()
+
+    def stop(self):
+        self._stop_event.set()
+        self._scan_requested.set()
+        if self._thread is not None:
+            self._thread.join(5)
+        self._thread = None
+
+    @staticmethod
+    def sources_key(sources):
+        return json.dumps(sources, sort_keys=True, ensure_ascii=False)
+
+    def set_sources(self, sources):
+        with self._lock:
+            self.sources = list(sources)
+            playlist = self.prepared.pop(self.sources_key(self.sources), None)
+        if playlist is not None and playlist != self.playlist:
+            # 미리 준비된 목록으로 바로 전환하고, 이후 변경분은 아래 스캔에서 반영
+            self.playlist = playlist
+            self.playlist_changed.emit(playlist)
+        self.request_scan()
+
+    def set_retained_sources(self, source_lists):
+        """편성 규칙이 바뀔 때 호출. 이 소스들의 항목은 정리 대상에서 제외하고, 더 이상 쓰지 않는 준비 목록은 버림."""
+        keys = {self.sources_key(sources) for sources in source_lists}
+        with self._lock:
+            self.retained_sources = [list(sources) for sources in source_lists]
+            self.prepared = {key: playlist for key, playlist in self.prepared.items() if key in keys}
+            self._retained_changed = True
+
+    def prepare(self, sources):
+        """sources 를 백그라운드에서 미리 probe. 현재 재생 목록/인덱스의 playlist 는 바꾸지 않음."""
+        with self._lock:
+            self._prepare_queue.append(list(sources))
+        self._scan_requested.set()
+
+    def request_scan(self):
+        """전체 스캔 요청 (모든 소스를 다시 펼치고 모든 파일 stat)."""
+        with self._lock:
+            self._full_scan = True
+        self._scan_requested.set()
+
+    def on_directory_changed(self, path):
+        with self._lock:
+            self._dirty_dirs.add(os.path.normpath(path))
+        self.rescan_timer.start()
+
+    def update_watch(self, dirs):
+        if self.watcher is None:
+            return
+        current = set(self.watcher.directories())
+        wanted = set(dirs)
+        if current - wanted:
+            self.watcher.removePaths(list(current - wanted))
+        if wanted - current:
+            self.watcher.addPaths(list(wanted - current))
+
+    def _run(self):
+        conn = self.connect_db()
+        try:
+            while True:
+                self._scan_requested.wait()
+                self._scan_requested.clear()
+                if self._stop_event.is_set():
+                    break
+                with self._lock:
+                    pending, self._prepare_queue = self._prepare_queue, []
+                try:
+                    for sources in pending:
+                        self.prepare_scan(conn, sources)
+                    self.scan(conn)
+                except (OSError, sqlite3.Error) as e:
+                    logger.warning("미디어 스캔 실패: %s", e)
+        finally:
+            conn.close()
+
+    def probe_entries(self, conn, entries, check=None):
+        """stat 후 크기/mtime 이 바뀐 파일만 probe 해 인덱스 갱신 → (재생 목록, probe 수, 존재하는 경로).
+
+        check 가 주어지면 그 경로와 아직 인덱스에 없는 경로만 stat 하고 나머지는 인덱스 값을 그대로 사용.
+        """
+        known = {row[0]: row[1:] for row in conn.execute(
+            "SELECT path, kind, size, mtime, valid, duration_ms FROM media")}
+        playlist = []
+        present = set()
+        probed = 0
+        for path, duration in entries:
+            row = known.get(path)
+            if row is not None and check is not None and path not in check:
+                present.add(path)
+                if row[3]:
+                    playlist.append(PlaylistItem(path, row[0], duration, row[4]))
+                continue
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            present.add(path)
+            if row is None or row[1] != stat.st_size or row[2] != stat.st_mtime:
+                kind, width, height, media_duration, valid, error = probe(path)
+                conn.execute(
+                    "INSERT OR REPLACE INTO media (path, kind, width, height, duration_ms, size, mtime, valid, error) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (path, kind, width, height, media_duration, stat.st_size, stat.st_mtime, int(valid), error))
+                probed += 1
+                if not valid:
+                    logger.warning("재생할 수 없는 미디어 제외: %s (%s)", path, error)
+                row = (kind, stat.st_size, stat.st_mtime, int(valid), media_duration)
+            if row[3]:
+                playlist.append(PlaylistItem(path, row[0], duration, row[4]))
+
+        return playlist, probed, present
+
+    def prune(self, conn, present, full):
+        """현재 소스와 편성 규칙 소스 어디에도 없는 항목 삭제 (다른 편성의 항목은 다음 전환을 위해 유지).
+
+        full 이 아니면 지난 스캔 이후 현재 소스에서 사라진 경로만 삭제.
+        """
+        if full:
+            stale = {path for (path,) in conn.execute("SELECT path FROM media")}
+        else:
+            stale = self._present - present
+        self._present = present
+        stale -= present | self._retained_paths
+        conn.executemany("DELETE FROM media WHERE path = ?", [(path,) for path in stale])
+        return len(stale)
+
+    def prepare_scan(self, conn, sources):
+        entries, _ = expand_sources(sources)
+        playlist, probed, _ = self.probe_entries(conn, entries)
+        conn.commit()
+        with self._lock:
+            key = self.sources_key(sources)
+            self.prepared.pop(key, None)
+            self.prepared[key] = playlist
+            while len(self.prepared) > MAX_PREPARED:
+                self.prepared.pop(next(iter(self.prepared)))
+        logger.info("📚 다음 편성 미디어 준비: %d개 (probe %d)", len(playlist), probed)
+        self.playlist_prepared.emit(playlist)
+
+    def scan(self, conn):
+        started = time.perf_counter()
+        with self._lock:
+            sources = list(self.sources)
+            retained = list(self.retained_sources)
+            full, self._full_scan = self._full_scan, False
+            retained_changed, self._retained_changed = self._retained_changed, False
+            dirty, self._dirty_dirs = self._dirty_dirs, set()
+        if full:
+            self._expanded.clear()
+
+        # 캐시가 없거나 감시 디렉토리가 바뀐 소스만 다시 펼침
+        expanded = {}
+        for source in sources:
+            key = self.sources_key(source)
+            cached = self._expanded.get(key)
+            if cached is None or any(os.path.normpath(d) in dirty for d in cached[1]):
+                cached = expand_source(source)
+            expanded[key] = cached
+        self._expanded = expanded
+        entries, watch_dirs = merge_entries(expanded[self.sources_key(source)] for source in sources)
+        self._watch_requested.emit(watch_dirs)
+
+        if full or retained_changed:
+            self._retained_paths = {path for source_list in retained
+                                    for path, _ in expand_sources(source_list)[0]}
+        check = None
+        if not full:
+            # 변경된 디렉토리의 파일과 처음 보는 경로만 stat
+            check = {path for path, _ in entries
+                     if path not in self._present or os.path.dirname(os.path.normpath(path)) in dirty}
+        playlist, probed, present = self.probe_entries(conn, entries, check)
+        removed = self.prune(conn, present, full or retained_changed)
+        conn.execute("DELETE FROM playlist")
+        conn.executemany("INSERT INTO playlist (position, path, duration_ms) VALUES (?, ?, ?)",
+                         [(i, item.path, item.duration_ms) for i, item in enumerate(playlist)])
+        conn.commit()
+        logger.info("📚 미디어 %s스캔: %d개 (stat %s, probe %d, 제외 %d, 인덱스 정리 %d) %.0fms",
+                    "" if full else "증분 ", len(playlist), len(entries) if check is None else len(check),
+                    probed, len(entries) - len(playlist), removed, (time.perf_counter() - started) * 1000)
+        if playlist != self.playlist:
+            self.playlist = playlist
+            self.playlist_changed.emit(playlist)
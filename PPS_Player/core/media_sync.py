@@ -0,0 +1,234 @@
+# PPS_Player/core/media_sync.py
+# ---------------------------
+# Version History
+# v0.1.0 - 2026.10.18 - 서버 매니페스트 기반 미디어 동기화 추가 (내용 주소 저장소, 이어받기, 병렬 다운로드, GC)
+# v0.1.1 - 2026.10.18 - 이어받기 416 처리 (완성된 .part 는 해시 확인 후 사용, 아니면 처음부터), 워커별 세션
+# v0.1.2 - 2026.10.18 - server_url 이 비어 있으면 동기화 건너뜀
+# v0.1.3 - 2026.10.18 - asset_name(): blob 경로 → 매니페스트 항목 이름 (재생 증명 기록용)
+# ---------------------------
+
+import hashlib
+import json
+import logging
+import os
+import posixpath
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+logger = logging.getLogger(__name__)
+
+PLAYLIST_FILE = "playlist.json"
+
+
+class ManifestEntry:
+    def __init__(self, url, sha256, size, name=None):
+        self.url = url
+        self.sha256 = sha256.lower()
+        self.size = int(size)
+        self.name = name or posixpath.basename(urlparse(url).path)
+
+    @property
+    def extension(self):
+        # MediaViewer 가 확장자로 이미지/비디오를 구분하므로 원본 확장자 유지
+        return os.path.splitext(self.name)[1].lower()
+
+
+def parse_manifest(data):
+    items = data.get("items", []) if isinstance(data, dict) else data
+    return [ManifestEntry(item["url"], item["sha256"], item.get("size", 0), item.get("name"))
+            for item in items]
+
+
+def file_sha256(path, chunk_size=1024 * 1024):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class MediaSync(QObject):
+    """서버 매니페스트(url, sha256, size) 에 맞춰 로컬 미디어 저장소를 동기화.
+
+    blob 은 store_dir/blobs/<sha 앞 2자리>/<sha><확장자> 에 저장되며, 매니페스트의 모든 항목이
+    검증된 경우에만 playlist_ready 로 새 재생 목록을 보낸다. 디스크 용량이 quota 를 넘으면
+    현재 매니페스트에서 참조하지 않는 blob 부터 오래된 순으로 지운다.
+    """
+    playlist_ready = pyqtSignal(list)
+    sync_failed = pyqtSignal(str)
+
+    def __init__(self, network_client, store_dir, manifest_path=None, interval=300,
+                 quota_bytes=2 * 1024 * 1024 * 1024, workers=3, chunk_size=256 * 1024, parent=None):
+        super().__init__(parent)
+        self.network_client = network_client
+        self.store_dir = store_dir
+        self.manifest_path = manifest_path or f"manifest/{network_client.store_id}"
+        self.interval = interval
+        self.quota_bytes = quota_bytes
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.names = {}  # blob 절대 경로 → 매니페스트 이름 (마지막 동기화 기준)
+        self._stop_event = threading.Event()
+        self._thread = None
+        os.makedirs(self.blob_dir, exist_ok=True)
+
+    @property
+    def blob_dir(self):
+        return os.path.join(self.store_dir, "blobs")
+
+    def blob_path(self, entry):
+        return os.path.join(self.blob_dir, entry.sha256[:2], entry.sha256 + entry.extension)
+
+    def asset_name(self, path):
+        return self.names.get(os.path.abspath(path))
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="MediaSync", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(5)
+        self._thread = None
+
+    def load_cached_playlist(self):
+        """마지막으로 동기화에 성공한 재생 목록 (오프라인 시작용). 파일이 빠져 있으면 제외."""
+        path = os.path.join(self.store_dir, PLAYLIST_FILE)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                paths = json.load(f)
+        except (OSError, ValueError):
+            return []
+        return [p for p in paths if os.path.isfile(p)]
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            if not self.network_client.server_url:
+                self._stop_event.wait(self.interval)
+                continue
+            try:
+                self.sync_once()
+            except Exception as e:
+                logger.warning("미디어 동기화 실패: %s", e)
+                self.sync_failed.emit(str(e))
+            self._stop_event.wait(self.interval)
+
+    def fetch_manifest(self):
+        resp = self.network_client.session.get(self.network_client.url(self.manifest_path),
+                                               timeout=self.network_client.timeout)
+        resp.raise_for_status()
+        return parse_manifest(resp.json())
+
+    def sync_once(self):
+        entries = self.fetch_manifest()
+        # 같은 blob 을 여러 항목이 참조해도 한 번만 다운로드
+        missing = list({self.blob_path(e): e for e in entries if not self.is_present(e)}.values())
+        if missing:
+            logger.info("미디어 동기화: %d/%d 개 다운로드", len(missing), len(entries))
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                # list() 로 모두 기다리며 첫 예외를 그대로 올림
+                list(pool.map(self.download, missing))
+
+        playlist = [self.blob_path(e) for e in entries]
+        self.names = {os.path.abspath(self.blob_path(e)): e.name for e in entries}
+        self.save_playlist(playlist)
+        self.collect_garbage({os.path.abspath(p) for p in playlist})
+        self.playlist_ready.emit(playlist)
+        return playlist
+
+    def is_present(self, entry):
+        path = self.blob_path(entry)
+        # 저장소에 들어온 blob 은 해시 검증을 통과한 것이므로 크기만 확인
+        return os.path.isfile(path) and (not entry.size or os.path.getsize(path) == entry.size)
+
+    def download(self, entry):
+        path = self.blob_path(entry)
+        part_path = path + ".part"
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        if entry.size and offset >= entry.size:
+            offset = 0
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
+
+        # 세션은 스레드별 (NetworkClient.session)
+        session = self.network_client.session
+        with session.get(entry.url, headers=headers, stream=True,
+                         timeout=self.network_client.timeout) as resp:
+            if resp.status_code == 416 and offset:
+                # 크기 정보가 없는 항목의 .part 가 이미 끝까지 받아져 있는 경우
+                if file_sha256(part_path) == entry.sha256:
+                    os.replace(part_path, path)
+                    return path
+                logger.warning("이어받기 범위 오류, 처음부터 다시 받음: %s", entry.name)
+                os.remove(part_path)
+                return self.download(entry)
+            resp.raise_for_status()
+            # 서버가 Range 를 무시하면(200) 처음부터 다시 받음
+            mode = "ab" if offset and resp.status_code == 206 else "wb"
+            with open(part_path, mode) as f:
+                for chunk in resp.iter_content(self.chunk_size):
+                    if self._stop_event.is_set():
+                        raise RuntimeError("동기화 중단")
+                    f.write(chunk)
+
+        if entry.size and os.path.getsize(part_path) != entry.size:
+            raise IOError(f"크기 불일치: {entry.name}")
+        digest = file_sha256(part_path)
+        if digest != entry.sha256:
+            os.remove(part_path)
+            raise IOError(f"해시 불일치: {entry.name} ({digest})")
+        os.replace(part_path, path)
+        return path
+
+    def save_playlist(self, playlist):
+        path = os.path.join(self.store_dir, PLAYLIST_FILE)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(playlist, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+
+    def collect_garbage(self, referenced):
+        blobs = []
+        total = 0
+        stale_before = time.time() - 24 * 3600
+        for root, _, names in os.walk(self.blob_dir):
+            for name in names:
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                if name.endswith(".part"):
+                    # 하루 이상 이어받지 않은 조각은 정리
+                    if stat.st_mtime < stale_before:
+                        self._remove(path)
+                    continue
+                total += stat.st_size
+                if os.path.abspath(path) not in referenced:
+                    blobs.append((stat.st_mtime, stat.st_size, path))
+
+        blobs.sort()
+        for _, size, path in blobs:
+            if total <= self.quota_bytes:
+                break
+            if self._remove(path):
+                total -= size
+        if total > self.quota_bytes:
+            logger.warning("미디어 저장소가 용량 제한을 초과함: %.1fMB", total / 1024 / 1024)
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+            return True
+        except OSError:
+            logger.warning("미디어 blob 삭제 실패: %s", path)
+            return False
@@ -3,45 +3,146 @@
 # Version History
 # v0.0.3 - 2025.04.26 - rolling 인자 추가, 롤링 설정 가능하도록 수정
 # v0.1.0 - 2025.05.15 - PyQt6 호환 버전으로 변환
+# v0.2.0 - 2026.10.18 - 이미지 프리페치/사전 스케일 캐시 적용 (슬라이드 전환 시 pixmap 교체만 수행)
+# v0.3.0 - 2026.10.18 - A/B 이중 비디오 플레이어 (다음 영상 사전 로딩, 첫 프레임 이후 전환, 전환 시간 측정)
+# v0.4.0 - 2026.10.18 - set_playlist 추가 (재생 중 목록 교체, 미디어 동기화 연동)
+# v0.4.1 - 2026.10.18 - 롤링/간격/프리페치 수 런타임 변경 지원 (설정 핫 리로드)
+# v0.5.0 - 2026.10.18 - 애니메이션 GIF 재생 (프레임 캐시, 지정 반복 횟수 후 다음 미디어로 롤링)
+# v0.5.1 - 2026.10.18 - 전환 시간/영상 첫 프레임까지 시간 계측
+# v0.5.2 - 2026.10.18 - print 진단 출력을 logging 으로 전환 (슬라이드마다 찍히던 경로는 DEBUG)
+# v0.6.0 - 2026.10.18 - MediaLibrary 재생 목록(PlaylistItem: 종류/항목별 표시 시간) 지원, 지원 확장자 확대
+# v0.6.1 - 2026.10.18 - 재생 시작/종료 시그널 (재생 증명 기록용)
+# v0.6.2 - 2026.10.18 - warm_up(): 다음 편성 재생 목록의 첫 이미지들을 전환 전에 미리 디코딩
+# v0.6.3 - 2026.10.18 - 사전 로딩 중 깨진 영상 처리, 첫 프레임 대기 시간 제한 (영상 롤링 멈춤 방지)
+# v0.6.4 - 2026.10.18 - 빈 재생 목록에서 롤링 타이머 정지 (첫 스캔 전/목록이 비었을 때), 항목이 들어오면 재개
+# v0.6.5 - 2026.10.18 - 사용처가 없는 media_started 시그널 제거
+# v0.6.6 - 2026.10.18 - 인덱스에서 읽은 영상 길이(media_duration_ms)로 항목별 종료 감시 (끝 신호 없이 멈춘 영상도 롤링)
 # ---------------------------
 
 from PyQt6.QtWidgets import QLabel, QStackedLayout, QWidget
 from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput
 from PyQt6.QtMultimediaWidgets import QVideoWidget
-from PyQt6.QtCore import Qt, QTimer, QUrl
+from PyQt6.QtCore import QObject, Qt, QTimer, QUrl, pyqtSignal
 from PyQt6.QtGui import QPixmap
+from PPS_Player.core.image_cache import ImageCache, ImagePrefetcher
+from PPS_Player.core.metrics import metrics
+from PPS_Player.core.animated_image import ANIMATED_EXTENSIONS, AnimatedImagePlayer, FrameCache, is_animated
+from PPS_Player.core.media_library import KIND_IMAGE, KIND_VIDEO, PlaylistItem, media_kind
+import logging
 import os
+import time
+
+logger = logging.getLogger(__name__)
+
+# 영상 재생을 시작한 뒤 이 시간 안에 첫 프레임이 나오지 않으면 다음 항목으로
+FIRST_FRAME_TIMEOUT_MS = 10000
+# 길이를 아는 영상이 첫 프레임 이후 (길이 + 이 시간) 안에 끝나지 않으면 다음 항목으로
+VIDEO_END_GRACE_MS = 3000
+
+class VideoSlot(QObject):
+    """QMediaPlayer + QVideoWidget 한 쌍. 이중 버퍼 모드에서는 두 개를 번갈아 사용."""
+    first_frame = pyqtSignal(object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.path = None
+        self.widget = QVideoWidget()
+        self.player = QMediaPlayer()
+        self.audio_output = QAudioOutput()
+        self.player.setAudioOutput(self.audio_output)
+        self.player.setVideoOutput(self.widget)
+        self.waiting_first_frame = False
+
+    def load(self, path):
+        if self.path != path:
+            self.path = path
+            self.player.setSource(QUrl.fromLocalFile(path))
+
+    def is_ready_for(self, path):
+        return self.path == path and self.player.mediaStatus() in (
+            QMediaPlayer.MediaStatus.LoadedMedia,
+            QMediaPlayer.MediaStatus.BufferedMedia,
+            QMediaPlayer.MediaStatus.EndOfMedia,
+        )
+
+    def arm_first_frame(self):
+        # 매 프레임마다 파이썬 슬롯이 호출되지 않도록 첫 프레임까지만 연결
+        if not self.waiting_first_frame:
+            self.waiting_first_frame = True
+            self.widget.videoSink().videoFrameChanged.connect(self._on_frame)
+
+    def disarm_first_frame(self):
+        if self.waiting_first_frame:
+            self.waiting_first_frame = False
+            self.widget.videoSink().videoFrameChanged.disconnect(self._on_frame)
+
+    def _on_frame(self, frame):
+        if not self.waiting_first_frame or not frame.isValid():
+            return
+        self.disarm_first_frame()
+        self.first_frame.emit(self)
+
 
 class MediaViewer(QWidget):
-    def __init__(self, media_paths, interval=5000, rolling=True):
+    # (경로, 전환 소요 ms) - next_media 호출부터 화면에 실제로 표시되기까지
+    transition_measured = pyqtSignal(str, float)
+    # 실제로 화면에 표시된 항목 기준: (경로, 종류, 시작 epoch ms, 표시 ms, 끝까지 재생 여부)
+    media_finished = pyqtSignal(str, str, "qint64", "qint64", bool)
+
+    def __init__(self, media_paths, interval=5000, rolling=True, prefetch_count=2, cache_mb=64,
+                 double_buffer=True, gif_loops=1, gif_cache_mb=64):
         super().__init__()
-        self.media_paths = media_paths
+        self.media_paths, self.kinds, self.durations, self.media_durations = self.split_playlist(media_paths)
         self.interval = interval
         self.rolling = rolling
         self.current_index = 0
+        self.prefetch_count = prefetch_count
+
+        # 이미지 사전 디코딩/스케일 캐시
+        self.image_cache = ImageCache(max_bytes=cache_mb * 1024 * 1024)
+        self.prefetcher = ImagePrefetcher(self.image_cache, self)
+
+        # 리사이즈가 연달아 들어오는 경우를 묶어서 한 번만 캐시 무효화
+        self.resize_timer = QTimer(self)
+        self.resize_timer.setSingleShot(True)
+        self.resize_timer.timeout.connect(self.on_resized)
 
         # 이미지 표시용
         self.image_label = QLabel("[이미지 로딩 실패]")
         self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.image_label.setStyleSheet("background-color: black;")
 
-        # 비디오 표시용
-        self.video_widget = QVideoWidget()
-        self.video_player = QMediaPlayer()
-        self.audio_output = QAudioOutput()
-        self.video_player.setAudioOutput(self.audio_output)
-        self.video_player.setVideoOutput(self.video_widget)
-        self.video_player.mediaStatusChanged.connect(self.on_video_status_changed)
+        # 애니메이션 GIF: 스케일된 프레임을 캐시해 반복/다음 주기에 재사용
+        self.gif_loops = gif_loops
+        self.frame_cache = FrameCache(max_bytes=gif_cache_mb * 1024 * 1024)
+        self.animation = AnimatedImagePlayer(self.image_label, self.frame_cache, self)
+        self.animation.loop_finished.connect(self.on_animation_loop)
+
+        # 비디오 표시용 (이중 버퍼 모드: A/B 두 슬롯)
+        self.double_buffer = double_buffer
+        self.video_slots = [VideoSlot(self) for _ in range(2 if double_buffer else 1)]
+        for slot in self.video_slots:
+            slot.player.mediaStatusChanged.connect(
+                lambda status, s=slot: self.on_video_status_changed(s, status))
+            slot.first_frame.connect(self.on_video_first_frame)
+        self.active_slot = self.video_slots[0]
+        self.transition_started = None
+        self.on_air = None
 
         # 스택 레이아웃으로 이미지/비디오 전환
         self.stack = QStackedLayout()
         self.stack.addWidget(self.image_label)
-        self.stack.addWidget(self.video_widget)
+        for slot in self.video_slots:
+            self.stack.addWidget(slot.widget)
         self.setLayout(self.stack)
 
         self.timer = QTimer()
         self.timer.timeout.connect(self.next_media)
 
+        self.first_frame_timer = QTimer(self)
+        self.first_frame_timer.setSingleShot(True)
+        self.first_frame_timer.timeout.connect(self.on_first_frame_timeout)
+
         if self.rolling:
             self.timer.start(self.interval)
 
@@ -49,42 +150,293 @@ class MediaViewer(QWidget):
 
     def show_media(self):
         if not self.media_paths:
+            # 첫 스캔 전/소스가 빈 경우: 항목이 들어오면 set_playlist 가 다시 시작
+            self.timer.stop()
+            self.animation.stop()
+            self.stop_video()
             self.image_label.setText("[재생할 미디어 없음]")
             self.stack.setCurrentWidget(self.image_label)
             return
 
         path = self.media_paths[self.current_index]
-        print(f"[미디어 경로] {path}")
-        if not os.path.exists(path):
-            print(f"[❌ 경로 존재 안함] {os.path.abspath(path)}")
-            self.image_label.setText(f"[파일 없음] {os.path.basename(path)}")
+        kind = self.kind_of(path)
+        logger.debug("[미디어 경로] %s", path)
+        self.animation.stop()
+        if not os.path.exists(path) or kind is None:
+            if kind is None:
+                logger.warning("[❌ 지원하지 않는 형식] %s", path)
+                self.image_label.setText(f"[지원하지 않는 형식] {os.path.basename(path)}")
+            else:
+                logger.warning("[❌ 경로 존재 안함] %s", os.path.abspath(path))
+                self.image_label.setText(f"[파일 없음] {os.path.basename(path)}")
+            self.stop_video()
             self.stack.setCurrentWidget(self.image_label)
             if self.rolling:
                 self.timer.start(self.interval)
             return
 
-        if path.lower().endswith((".jpg", ".png", ".gif")):
-            pixmap = QPixmap(path)
-            if pixmap.isNull():
-                print(f"[❌ QPixmap 로딩 실패] {path}")
-                self.image_label.setText(f"[로딩 실패] {os.path.basename(path)}")
-            else:
-                self.image_label.setPixmap(pixmap.scaled(
-                    self.size(), Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.SmoothTransformation))
+        if kind == KIND_IMAGE:
+            # 애니메이션은 시간(interval)이 아니라 반복 횟수(gif_loops) 기준으로 롤링
+            animated = self.show_animation(path)
+            if not animated:
+                self.show_image(path)
+            self.stop_video()
             self.stack.setCurrentWidget(self.image_label)
-            if self.rolling:
-                self.timer.start(self.interval)
-        elif path.lower().endswith(".mp4"):
-            self.video_player.setSource(QUrl.fromLocalFile(path))
-            self.stack.setCurrentWidget(self.video_widget)
-            self.video_player.play()
-            self.timer.stop()
+            self.begin_play(path)
+            self.report_transition(path)
+            if animated and path not in self.durations:
+                self.timer.stop()
+            elif self.rolling:
+                self.timer.start(self.item_interval(path))
+            self.prefetch_upcoming()
+            self.preload_next_video()
+        else:
+            self.play_video(path)
+            # 항목별 표시 시간이 지정된 영상만 시간 기준, 나머지는 끝까지 재생
+            if self.rolling and path in self.durations:
+                self.timer.start(self.durations[path])
+            else:
+                self.timer.stop()
+            self.prefetch_upcoming()
+
+    def play_video(self, path):
+        # 이중 버퍼 모드에서는 항상 대기 슬롯에서 재생 (대부분 이미 사전 로딩되어 있음)
+        slot = self.idle_slot() if self.double_buffer else self.active_slot
+        if slot.path == path and slot.player.mediaStatus() == QMediaPlayer.MediaStatus.InvalidMedia:
+            # 사전 로딩 단계에서 이미 깨진 것으로 확인된 영상
+            logger.warning("[❌ 비디오 로딩 실패] %s", path)
+            slot.path = None
+            QTimer.singleShot(0, self.next_media)
+            return
+        if not slot.is_ready_for(path):
+            logger.debug("사전 로딩되지 않은 영상: %s", path)
+        slot.load(path)
+        slot.arm_first_frame()
+        slot.player.play()
+        self.first_frame_timer.start(FIRST_FRAME_TIMEOUT_MS)
+        # 화면 전환은 새 영상의 첫 프레임이 나온 뒤에 수행 (검은 화면 방지)
+
+    def on_video_first_frame(self, slot):
+        self.first_frame_timer.stop()
+        previous = self.active_slot
+        self.active_slot = slot
+        self.stack.setCurrentWidget(slot.widget)
+        if previous is not slot:
+            previous.player.stop()
+        self.begin_play(slot.path)
+        self.report_transition(slot.path, video=True)
+        if self.rolling and slot.path not in self.durations and slot.path in self.media_durations:
+            # 평소에는 EndOfMedia 로 넘어가고, 끝 신호 없이 멈춘 경우에만 이 타이머로 넘어감
+            self.timer.start(self.item_interval(slot.path))
+        self.preload_next_video()
+
+    def on_first_frame_timeout(self):
+        for slot in self.video_slots:
+            if slot.waiting_first_frame:
+                logger.warning("[❌ 비디오 첫 프레임 없음 %dms] %s", FIRST_FRAME_TIMEOUT_MS, slot.path)
+                metrics.inc("video_first_frame_timeouts")
+                slot.disarm_first_frame()
+                slot.player.stop()
+                slot.path = None  # 다음 차례에 처음부터 다시 로딩
+                self.next_media()
+                return
+
+    def stop_video(self):
+        # 목록 교체 등으로 영상 도중에 이미지로 넘어가는 경우 소리가 남지 않도록 정지
+        self.first_frame_timer.stop()
+        for slot in self.video_slots:
+            slot.disarm_first_frame()
+            if slot.player.playbackState() == QMediaPlayer.PlaybackState.PlayingState:
+                slot.player.stop()
+
+    def idle_slot(self):
+        for slot in self.video_slots:
+            if slot is not self.active_slot:
+                return slot
+        return self.active_slot
+
+    def preload_next_video(self):
+        if not self.double_buffer or not self.media_paths:
+            return
+        path = self.media_paths[(self.current_index + 1) % len(self.media_paths)]
+        if self.kind_of(path) == KIND_VIDEO and os.path.exists(path):
+            # setSource 만 호출하면 재생 없이 LoadedMedia 단계까지 진행됨
+            self.idle_slot().load(path)
+
+    def begin_play(self, path):
+        self.end_play(completed=False)
+        kind = self.kind_of(path)
+        self.on_air = (path, kind, int(time.time() * 1000), time.monotonic())
+
+    def end_play(self, completed=True):
+        """현재 표시 중인 항목의 재생 종료 기록. completed=False 는 목록 교체/종료 등으로 중단된 경우."""
+        if self.on_air is None:
+            return
+        path, kind, started_ms, started = self.on_air
+        self.on_air = None
+        self.media_finished.emit(path, kind, started_ms, int((time.monotonic() - started) * 1000), completed)
+
+    def report_transition(self, path, video=False):
+        if self.transition_started is None:
+            return
+        elapsed_ms = (time.perf_counter() - self.transition_started) * 1000.0
+        self.transition_started = None
+        logger.debug("미디어 전환 %.1fms: %s", elapsed_ms, path)
+        metrics.inc("media_rotations")
+        metrics.observe("video_load_to_first_frame_ms" if video else "media_switch_ms", elapsed_ms)
+        self.transition_measured.emit(path, elapsed_ms)
+
+    def show_image(self, path):
+        image = self.prefetcher.get_or_load(path, self.size())
+        if image.isNull():
+            logger.warning("[❌ 이미지 로딩 실패] %s", path)
+            self.image_label.setText(f"[로딩 실패] {os.path.basename(path)}")
+        else:
+            self.image_label.setPixmap(QPixmap.fromImage(image))
+
+    def show_animation(self, path):
+        if not path.lower().endswith(ANIMATED_EXTENSIONS) or not is_animated(path):
+            return False
+        return self.animation.play(path, self.size())
+
+    def on_animation_loop(self, loops):
+        path = self.media_paths[self.current_index] if self.media_paths else None
+        if self.rolling and loops >= self.gif_loops and path not in self.durations:
+            self.next_media()
 
-    def on_video_status_changed(self, status):
+    def upcoming_image_paths(self):
+        paths = []
+        count = len(self.media_paths)
+        for offset in range(1, count):
+            if len(paths) >= self.prefetch_count:
+                break
+            path = self.media_paths[(self.current_index + offset) % count]
+            if self.kind_of(path) == KIND_IMAGE and not path.lower().endswith(ANIMATED_EXTENSIONS) \
+                    and path not in paths:
+                paths.append(path)
+        return paths
+
+    def prefetch_upcoming(self):
+        if self.prefetch_count > 0:
+            self.prefetcher.prefetch(self.upcoming_image_paths(), self.size())
+
+    def warm_up(self, playlist):
+        """곧 교체될 재생 목록의 앞쪽 이미지를 미리 디코딩/스케일 (편성 전환 직후 첫 화면 지연 방지)."""
+        paths, kinds, _, _ = self.split_playlist(playlist)
+        images = [path for path in paths
+                  if (kinds.get(path) or media_kind(path)) == KIND_IMAGE
+                  and not path.lower().endswith(ANIMATED_EXTENSIONS)]
+        self.prefetcher.prefetch(images[:max(1, self.prefetch_count)], self.size())
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.resize_timer.start(150)
+
+    def on_resized(self):
+        # 크기가 바뀌면 기존 스케일 결과는 쓸 수 없음
+        self.prefetcher.invalidate()
+        self.frame_cache.clear()
+        if not self.media_paths:
+            return
+        path = self.media_paths[self.current_index]
+        if self.animation.is_playing():
+            self.animation.play(path, self.size())
+        elif self.kind_of(path) == KIND_IMAGE and os.path.exists(path):
+            self.show_image(path)
+            self.prefetch_upcoming()
+
+    def on_video_status_changed(self, slot, status):
+        if status == QMediaPlayer.MediaStatus.InvalidMedia and slot.waiting_first_frame:
+            # 재생 대기 중이던 영상이 깨진 경우 다음 항목으로
+            logger.warning("[❌ 비디오 로딩 실패] %s", slot.path)
+            self.first_frame_timer.stop()
+            slot.disarm_first_frame()
+            self.next_media()
+            return
+        if status == QMediaPlayer.MediaStatus.InvalidMedia and slot is not self.active_slot:
+            # 사전 로딩 중 실패: 경로를 지워 재생 차례에 다시 로딩하고 실패하면 위에서 건너뜀
+            logger.debug("사전 로딩 실패: %s", slot.path)
+            slot.path = None
+            return
+        if slot is not self.active_slot or self.stack.currentWidget() is not slot.widget:
+            return
         if status == QMediaPlayer.MediaStatus.EndOfMedia:
             self.next_media()
 
+    def set_rolling(self, rolling):
+        self.rolling = rolling
+        if not rolling:
+            self.timer.stop()
+        elif self.stack.currentWidget() is self.image_label and not self.animation.is_playing():
+            self.timer.start(self.current_interval())
+
+    def set_interval(self, interval):
+        self.interval = interval
+        if self.timer.isActive():
+            self.timer.start(self.current_interval())
+
+    def set_prefetch_count(self, count):
+        self.prefetch_count = count
+        self.prefetch_upcoming()
+
+    @staticmethod
+    def split_playlist(playlist):
+        """경로 문자열 또는 PlaylistItem 목록 → (경로 목록, 경로별 종류, 경로별 표시 시간, 경로별 영상 길이)."""
+        paths, kinds, durations, media_durations = [], {}, {}, {}
+        for item in playlist:
+            if isinstance(item, PlaylistItem):
+                paths.append(item.path)
+                kinds[item.path] = item.kind
+                if item.duration_ms:
+                    durations[item.path] = item.duration_ms
+                if item.media_duration_ms:
+                    media_durations[item.path] = item.media_duration_ms
+            else:
+                paths.append(item)
+        return paths, kinds, durations, media_durations
+
+    def kind_of(self, path):
+        return self.kinds.get(path) or media_kind(path)
+
+    def item_interval(self, path):
+        if path in self.durations:
+            return self.durations[path]
+        if self.kind_of(path) == KIND_VIDEO and path in self.media_durations:
+            return self.media_durations[path] + VIDEO_END_GRACE_MS
+        return self.interval
+
+    def current_interval(self):
+        if not self.media_paths:
+            return self.interval
+        return self.item_interval(self.media_paths[self.current_index])
+
+    def set_playlist(self, media_paths):
+        """재생 목록(경로 또는 PlaylistItem)을 통째로 교체. 현재 항목이 새 목록에도 있으면 끊지 않고 이어서 재생."""
+        media_paths, kinds, durations, media_durations = self.split_playlist(media_paths)
+        if (media_paths, kinds, durations, media_durations) == \
+                (self.media_paths, self.kinds, self.durations, self.media_durations):
+            return
+        current = self.media_paths[self.current_index] if self.media_paths else None
+        self.kinds = kinds
+        self.durations = durations
+        self.media_durations = media_durations
+        self.media_paths = media_paths
+        if current is not None and current in media_paths:
+            self.current_index = media_paths.index(current)
+            self.prefetch_upcoming()
+            self.preload_next_video()
+            return
+        self.current_index = 0
+        self.transition_started = time.perf_counter()
+        self.end_play(completed=False)
+        self.show_media()
+
     def next_media(self):
+        self.end_play(completed=True)
+        if not self.media_paths:
+            self.timer.stop()
+            return
+        self.transition_started = time.perf_counter()
         self.current_index = (self.current_index + 1) % len(self.media_paths)
         self.show_media()
 
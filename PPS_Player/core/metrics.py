@@ -0,0 +1,237 @@
+# PPS_Player/core/metrics.py
+# ---------------------------
+# Version History
+# v0.1.0 - 2026.10.18 - 런타임 계측 추가 (카운터/게이지/히스토그램, 이벤트 루프 지연 프로브, 메모리, 로컬 JSON 엔드포인트, 주기 덤프)
+# v0.1.1 - 2026.10.18 - 렌더러 RSS: renderProcessPid(Qt 6.6+) 직접 호출, Windows 에서도 조회 (utils.process_rss_bytes)
+# ---------------------------
+
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from PyQt6.QtCore import QElapsedTimer, QObject, Qt, QTimer
+
+from PPS_Player.utils.utils import get_log_dir, process_rss_bytes
+
+logger = logging.getLogger(__name__)
+
+# 밀리초 단위 히스토그램 구간 상한
+DEFAULT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+
+
+class Histogram:
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def observe(self, value):
+        index = len(self.buckets)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = i
+                break
+        self.counts[index] += 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def snapshot(self):
+        labels = [f"le_{b}" for b in self.buckets] + ["inf"]
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "mean": self.total / self.count if self.count else None,
+            "min": self.min,
+            "max": self.max,
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
+class _NullTimer:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class _Timer:
+    def __init__(self, registry, name):
+        self.registry = registry
+        self.name = name
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.registry.observe(self.name, (time.perf_counter() - self.started) * 1000)
+        return False
+
+
+class Metrics:
+    """프로세스 전역 계측 저장소. 어느 스레드에서나 호출 가능.
+
+    enabled 가 False 이면 모든 기록 함수가 속성 확인 한 번 후 바로 반환한다.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.started = time.time()
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._gauges = {}
+        self._histograms = {}
+
+    def inc(self, name, value=1):
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def set_gauge(self, name, value):
+        if not self.enabled:
+            return
+        with self._lock:
+            self._gauges[name] = value
+
+    def observe(self, name, value):
+        if not self.enabled:
+            return
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = Histogram()
+            histogram.observe(value)
+
+    def timer(self, name):
+        """with metrics.timer("x_ms"): ... 형태로 구간 시간(ms) 기록."""
+        return _Timer(self, name) if self.enabled else _NULL_TIMER
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "timestamp": datetime.now().isoformat(timespec="seconds"),
+                "uptime_s": time.time() - self.started,
+                "counters": dict(self._counters),
+                "gauges": dict(self._gauges),
+                "histograms": {name: h.snapshot() for name, h in self._histograms.items()},
+            }
+
+
+metrics = Metrics()
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        if self.path.split("?")[0] not in ("/", "/metrics"):
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = json.dumps(metrics.snapshot(), ensure_ascii=False, indent=2).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class MetricsService(QObject):
+    """계측 활성화 시 필요한 주변 장치 모음.
+
+    - 이벤트 루프 하트비트: heartbeat_ms 마다 예정 시각 대비 지연을 event_loop_lag_ms 로 기록
+    - 메모리: 프로세스 RSS, QtWebEngine 렌더러 RSS (page_provider 가 주는 QWebEnginePage 기준)
+    - 127.0.0.1:port 의 GET /metrics JSON 엔드포인트 (port 0 이면 사용 안 함)
+    - dump_interval 초마다 logs/YYYY-MM/metrics-YYYY-MM-DD.jsonl 에 스냅샷 추가 (백그라운드 스레드)
+    """
+
+    def __init__(self, port=8765, dump_interval=60, heartbeat_ms=250, page_provider=None, parent=None):
+        super().__init__(parent)
+        self.port = port
+        self.dump_interval = dump_interval
+        self.heartbeat_ms = heartbeat_ms
+        self.page_provider = page_provider
+        self.httpd = None
+        self._stop_event = threading.Event()
+        self._threads = []
+
+        self.heartbeat = QTimer(self)
+        self.heartbeat.setTimerType(Qt.TimerType.PreciseTimer)
+        self.heartbeat.timeout.connect(self.on_heartbeat)
+        self.elapsed = QElapsedTimer()
+
+        self.memory_timer = QTimer(self)
+        self.memory_timer.timeout.connect(self.sample_memory)
+
+    def start(self):
+        metrics.enabled = True
+        self.elapsed.start()
+        self.heartbeat.start(self.heartbeat_ms)
+        self.memory_timer.start(10000)
+        self.sample_memory()
+
+        if self.port:
+            try:
+                self.httpd = ThreadingHTTPServer(("127.0.0.1", self.port), _MetricsHandler)
+                self.httpd.daemon_threads = True
+                self._spawn(self.httpd.serve_forever, "MetricsHTTP")
+                logger.info("📈 계측 엔드포인트: http://127.0.0.1:%d/metrics", self.port)
+            except OSError as e:
+                logger.warning("계측 엔드포인트 시작 실패 (port %d): %s", self.port, e)
+                self.httpd = None
+        if self.dump_interval:
+            self._spawn(self._dump_loop, "MetricsDump")
+
+    def stop(self):
+        self.heartbeat.stop()
+        self.memory_timer.stop()
+        self._stop_event.set()
+        if self.httpd is not None:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+            self.httpd = None
+        metrics.enabled = False
+
+    def _spawn(self, target, name):
+        thread = threading.Thread(target=target, name=name, daemon=True)
+        thread.start()
+        self._threads.append(thread)
+
+    def on_heartbeat(self):
+        lag = self.elapsed.restart() - self.heartbeat_ms
+        metrics.observe("event_loop_lag_ms", max(lag, 0))
+
+    def sample_memory(self):
+        metrics.set_gauge("process_rss_bytes", process_rss_bytes())
+        page = self.page_provider() if self.page_provider is not None else None
+        if page is None:
+            return
+        pid = page.renderProcessPid()
+        metrics.set_gauge("webengine_renderer_pid", pid)
+        metrics.set_gauge("webengine_renderer_rss_bytes", process_rss_bytes(pid) if pid else None)
+
+    def _dump_loop(self):
+        while not self._stop_event.wait(self.dump_interval):
+            try:
+                log_dir = get_log_dir()
+                path = os.path.join(log_dir, f"metrics-{datetime.now():%Y-%m-%d}.jsonl")
+                with open(path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(metrics.snapshot(), ensure_ascii=False) + "\n")
+            except OSError as e:
+                logger.warning("계측 덤프 실패: %s", e)
@@ -2,25 +2,293 @@
 # ---------------------------
 # Version History
 # v0.0.1 - 2025.04.25 - 배경 음악 플레이어 구조 설계 시작
+# v0.1.0 - 2026.10.18 - PyQt6 전환: 2개 플레이어 교대 재생(다음 곡 사전 로딩), 크로스페이드/무간격 전환,
+#                       loop/shuffle(전곡 재생 전 중복 없음)/repeat_one, 음성 재생 중 볼륨 낮춤(더킹)
 # ---------------------------
 
-from PyQt5.QtMultimedia import QMediaPlayer, QMediaPlaylist, QMediaContent
-from PyQt5.QtCore import QUrl
+import logging
+import math
+import os
+import random
 
-class MusicPlayer:
-    def __init__(self, music_paths, mode='loop'):
-        self.player = QMediaPlayer()
-        self.playlist = QMediaPlaylist()
-        for path in music_paths:
-            self.playlist.addMedia(QMediaContent(QUrl.fromLocalFile(path)))
+from PyQt6.QtCore import QObject, Qt, QTimer, QUrl, pyqtSignal
+from PyQt6.QtMultimedia import QAudioOutput, QMediaPlayer
 
-        if mode == 'shuffle':
-            self.playlist.setPlaybackMode(QMediaPlaylist.Random)
-        elif mode == 'repeat_one':
-            self.playlist.setPlaybackMode(QMediaPlaylist.CurrentItemInLoop)
+from PPS_Player.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+MODE_LOOP = "loop"
+MODE_SHUFFLE = "shuffle"
+MODE_REPEAT_ONE = "repeat_one"
+
+RAMP_STEP_MS = 50
+
+
+class _Deck:
+    """QMediaPlayer + QAudioOutput 한 쌍과 현재 곡 정보."""
+
+    def __init__(self, parent):
+        self.player = QMediaPlayer(parent)
+        self.output = QAudioOutput(parent)
+        self.player.setAudioOutput(self.output)
+        self.index = None
+        self.path = None
+        self.fade = 1.0  # 크로스페이드 중 곡별 음량 비율
+
+    def load(self, index, path):
+        if self.path != path:
+            self.player.setSource(QUrl.fromLocalFile(os.path.abspath(path)))
+        self.index = index
+        self.path = path
+
+    def stop(self):
+        self.player.stop()
+
+
+class MusicPlayer(QObject):
+    """배경 음악 엔진.
+
+    두 개의 덱을 번갈아 쓰며, 재생 중이 아닌 덱에 다음 곡을 미리 열어 둔다.
+    곡이 끝나기 crossfade_ms 전에 다음 덱을 시작해 두 곡을 교차시키고(0 이면 바로 이어서 재생),
+    duck(source, True) 가 하나라도 활성인 동안 음량을 duck_volume 까지 낮춘다.
+    """
+    track_changed = pyqtSignal(str)
+
+    def __init__(self, music_paths=None, mode=MODE_LOOP, crossfade_ms=2000, volume=60,
+                 duck_volume=15, parent=None):
+        super().__init__(parent)
+        self.paths = []
+        self.mode = mode
+        self.crossfade_ms = crossfade_ms
+        self.volume = volume
+        self.duck_volume = duck_volume
+        self.decks = [_Deck(self), _Deck(self)]
+        self.active = 0
+        self.next_index = None
+        self.shuffle_bag = []
+        self.playing = False
+        self.fading = False
+        self.fade_elapsed = 0
+        self.duck_sources = set()
+        self.duck_level = 1.0
+
+        for deck in self.decks:
+            deck.player.mediaStatusChanged.connect(
+                lambda status, deck=deck: self.on_status_changed(deck, status))
+            deck.player.durationChanged.connect(lambda _, deck=deck: self.arm_handoff(deck))
+
+        # 다음 곡 시작 시각 (곡 길이 - 현재 위치 - crossfade)
+        self.handoff_timer = QTimer(self)
+        self.handoff_timer.setSingleShot(True)
+        self.handoff_timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.handoff_timer.timeout.connect(self.advance)
+
+        # 크로스페이드/더킹 음량 변화 (변화 중일 때만 동작)
+        self.ramp_timer = QTimer(self)
+        self.ramp_timer.setInterval(RAMP_STEP_MS)
+        self.ramp_timer.timeout.connect(self.on_ramp)
+
+        self.set_playlist(music_paths or [])
+
+    @property
+    def deck(self):
+        return self.decks[self.active]
+
+    @property
+    def idle_deck(self):
+        return self.decks[1 - self.active]
+
+    # ---------- 재생 목록 ----------
+    def set_playlist(self, paths):
+        found = [p for p in paths if os.path.exists(p)]
+        if len(found) != len(paths):
+            logger.warning("배경 음악 파일 %d개 없음, 제외", len(paths) - len(found))
+        paths = found
+        if paths == self.paths:
+            return
+        current = self.deck.path
+        self.paths = paths
+        self.shuffle_bag = []
+        self.next_index = None
+        if not paths:
+            self.stop()
+            return
+        if self.playing and current in paths:
+            # 현재 곡은 이어서 재생, 다음 곡만 새 목록 기준으로 다시 준비
+            self.deck.index = paths.index(current)
+            self.preload_next()
+        elif self.playing:
+            self.play_index(self.pick_next(), fade_ms=self.crossfade_ms)
+
+    def set_mode(self, mode):
+        self.mode = mode
+        self.shuffle_bag = []
+        if self.playing:
+            self.next_index = None
+            self.preload_next()
+
+    def set_crossfade(self, ms):
+        self.crossfade_ms = max(0, ms)
+        self.arm_handoff(self.deck)
+
+    def set_volume(self, volume):
+        self.volume = volume
+        self.apply_volume()
+
+    def set_duck_volume(self, volume):
+        self.duck_volume = volume
+        self.start_ramp()
+
+    def pick_next(self):
+        """다음 곡 번호. 셔플은 목록 전체를 한 번씩 재생한 뒤 새로 섞음."""
+        count = len(self.paths)
+        current = self.deck.index
+        if current is None or current >= count:
+            current = None
+        if self.mode == MODE_REPEAT_ONE and current is not None:
+            return current
+        if self.mode == MODE_SHUFFLE:
+            if not self.shuffle_bag:
+                self.shuffle_bag = list(range(count))
+                random.shuffle(self.shuffle_bag)
+                # 새로 섞은 첫 곡이 방금 곡과 같으면 뒤로 보냄
+                if count > 1 and self.shuffle_bag[-1] == current:
+                    self.shuffle_bag.insert(0, self.shuffle_bag.pop())
+            return self.shuffle_bag.pop()
+        return 0 if current is None else (current + 1) % count
+
+    # ---------- 재생 ----------
+    def start(self):
+        if not self.paths or self.playing:
+            return
+        self.playing = True
+        self.play_index(self.pick_next(), fade_ms=0)
+
+    def stop(self):
+        self.playing = False
+        self.handoff_timer.stop()
+        self.ramp_timer.stop()
+        self.fading = False
+        for deck in self.decks:
+            deck.stop()
+
+    def play_index(self, index, fade_ms):
+        if self.fading:
+            # 이전 크로스페이드가 끝나기 전에 넘어가면 나가던 곡은 바로 정리
+            self.idle_deck.stop()
+            self.deck.fade = 1.0
+            self.fading = False
+        old = self.deck
+        new = self.idle_deck
+        new.load(index, self.paths[index])
+        self.active = 1 - self.active
+        self.next_index = None
+        self.handoff_timer.stop()
+
+        if fade_ms > 0 and old.player.playbackState() == QMediaPlayer.PlaybackState.PlayingState:
+            new.fade = 0.0
+            self.fading = True
+            self.fade_elapsed = 0
+            self.start_ramp()
         else:
-            self.playlist.setPlaybackMode(QMediaPlaylist.Loop)
+            old.stop()
+            new.fade = 1.0
+            self.fading = False
+            # 이전 덱이 비었으므로 바로 다음 곡을 열어 둠
+            QTimer.singleShot(0, self.preload_next)
+        self.apply_volume()
+        new.player.play()
+        metrics.inc("music_track_changes")
+        logger.info("🎵 배경 음악: %s", os.path.basename(new.path))
+        self.track_changed.emit(new.path)
+        self.arm_handoff(new)
+
+    def preload_next(self):
+        if not self.playing or not self.paths or self.fading:
+            return
+        if self.next_index is None:
+            self.next_index = self.pick_next()
+        self.idle_deck.load(self.next_index, self.paths[self.next_index])
+
+    def advance(self):
+        if not self.playing or not self.paths:
+            return
+        index = self.next_index if self.next_index is not None else self.pick_next()
+        self.play_index(index, fade_ms=self.crossfade_ms)
+
+    def arm_handoff(self, deck):
+        if deck is not self.deck or not self.playing:
+            return
+        duration = deck.player.duration()
+        if duration <= 0:
+            return  # 길이를 모르면 EndOfMedia 에서 전환
+        fade = min(self.crossfade_ms, duration // 2)
+        remaining = duration - deck.player.position() - fade
+        self.handoff_timer.start(max(0, remaining))
+
+    def on_status_changed(self, deck, status):
+        if deck is not self.deck or not self.playing:
+            return
+        if status == QMediaPlayer.MediaStatus.EndOfMedia:
+            # 전환 예약이 실행되기 전에 끝난 경우 (길이 정보 없음 등)
+            self.advance()
+        elif status == QMediaPlayer.MediaStatus.InvalidMedia:
+            logger.warning("배경 음악 재생 실패: %s", deck.path)
+            if len(self.paths) > 1:
+                self.advance()
+            else:
+                self.stop()
+
+    # ---------- 음량 ----------
+    def duck(self, source, active):
+        """source(예: "tts", "voice") 가 재생 중인 동안 음량을 낮춤."""
+        if active:
+            self.duck_sources.add(source)
+        else:
+            self.duck_sources.discard(source)
+        self.start_ramp()
+
+    def duck_target(self):
+        if not self.duck_sources or not self.volume:
+            return 1.0
+        return min(1.0, self.duck_volume / self.volume)
+
+    def start_ramp(self):
+        if not self.ramp_timer.isActive():
+            self.ramp_timer.start()
+
+    def on_ramp(self):
+        steady = True
+        if self.fading:
+            self.fade_elapsed += RAMP_STEP_MS
+            progress = min(1.0, self.fade_elapsed / max(self.crossfade_ms, 1))
+            # 등전력 곡선: 교차 구간에서 전체 음량이 꺼지지 않음
+            self.deck.fade = math.sin(progress * math.pi / 2)
+            self.idle_deck.fade = math.cos(progress * math.pi / 2)
+            if progress >= 1.0:
+                self.fading = False
+                self.idle_deck.stop()
+                self.idle_deck.fade = 1.0
+                self.preload_next()
+            else:
+                steady = False
+
+        target = self.duck_target()
+        if self.duck_level != target:
+            # 약 300ms 에 걸쳐 낮추거나 복귀
+            step = RAMP_STEP_MS / 300.0
+            if abs(target - self.duck_level) <= step:
+                self.duck_level = target
+            else:
+                self.duck_level += step if target > self.duck_level else -step
+                steady = False
+
+        self.apply_volume()
+        if steady:
+            self.ramp_timer.stop()
 
-        self.player.setPlaylist(self.playlist)
-        self.player.setVolume(100)
-        self.player.play()
\ No newline at end of file
+    def apply_volume(self):
+        base = max(0, min(self.volume, 100)) / 100.0 * self.duck_level
+        for deck in self.decks:
+            deck.output.setVolume(base * deck.fade)
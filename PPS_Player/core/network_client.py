@@ -2,27 +2,188 @@
 # ---------------------------
 # Version History
 # v0.0.1 - 2025.04.25 - 서버 폴링 구조 및 명령 수신 구조 설계 시작
+# v0.1.0 - 2026.10.18 - 단일 워커 스레드 + 연결 재사용 세션, ETag/304, 롱폴링, 지수 백오프, Qt 시그널 전달
+# v0.1.1 - 2026.10.18 - update_settings 추가 (설정 핫 리로드)
+# v0.1.2 - 2026.10.18 - 폴링 지연/오류/304 계측
+# v0.1.3 - 2026.10.18 - 종료 시 롱폴링 응답을 기다리지 않음 (세션 종료 + 짧은 join, 종료 후 받은 명령은 버림)
+# v0.1.4 - 2026.10.18 - 스레드별 세션 (폴링/미디어 동기화 워커/재생 증명 업로드가 세션을 공유하지 않음)
+# v0.1.5 - 2026.10.18 - 폴링 스레드마다 종료 이벤트를 따로 둠 (중지 직후 재시작해도 이전 스레드가 살아나지 않음)
 # ---------------------------
 
+import logging
+import random
+import threading
+import time
+import weakref
+
 import requests
-from threading import Timer
+from requests.adapters import HTTPAdapter
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from PPS_Player.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# stop_polling() 이 GUI 스레드에서 폴링 스레드를 기다리는 최대 시간 (초).
+# 롱폴링 요청은 끝날 때까지 기다리지 않고, 데몬 스레드가 응답을 받은 뒤 스스로 종료
+STOP_JOIN_TIMEOUT = 1.0
+
+
+class NetworkClient(QObject):
+    """서버 명령 폴링 클라이언트.
 
-class NetworkClient:
-    def __init__(self, server_url, store_id, interval=5):
-        self.server_url = server_url
+    하나의 워커 스레드가 requests.Session(연결 풀)으로 계속 폴링하고, 받은 명령은
+    commands_received 시그널로 전달한다. 수신측이 QObject 슬롯이면 Qt 스레드에서 실행된다.
+    session 은 스레드마다 따로 만들어지므로 MediaSync/ProofOfPlay 워커에서 그대로 써도 된다.
+    """
+    commands_received = pyqtSignal(object)
+    poll_failed = pyqtSignal(str)
+
+    def __init__(self, server_url, store_id, interval=5, timeout=10,
+                 long_poll=False, long_poll_wait=30, max_backoff=300, parent=None):
+        super().__init__(parent)
+        self.server_url = server_url.rstrip("/")
         self.store_id = store_id
         self.interval = interval
-        self.timer = None
+        self.timeout = timeout
+        self.long_poll = long_poll
+        self.long_poll_wait = long_poll_wait
+        self.max_backoff = max_backoff
+
+        # requests.Session 은 스레드 안전하지 않으므로 스레드마다 하나씩 (close() 용으로 약한 참조 보관)
+        self._local = threading.local()
+        self._sessions = weakref.WeakSet()
+        self._sessions_lock = threading.Lock()
+
+        self.etag = None
+        self.failures = 0
+        self.last_rtt = None
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def update_settings(self, server_url=None, store_id=None, interval=None, timeout=None,
+                        long_poll=None, long_poll_wait=None):
+        """폴링 스레드를 멈추지 않고 설정 변경. 다음 폴링부터 적용."""
+        if server_url is not None and server_url.rstrip("/") != self.server_url:
+            self.server_url = server_url.rstrip("/")
+            self.etag = None
+        if store_id is not None and store_id != self.store_id:
+            self.store_id = store_id
+            self.etag = None
+        if interval is not None:
+            self.interval = interval
+        if timeout is not None:
+            self.timeout = timeout
+        if long_poll is not None:
+            self.long_poll = long_poll
+        if long_poll_wait is not None:
+            self.long_poll_wait = long_poll_wait
+
+    @property
+    def session(self):
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self.create_session()
+            self._local.session = session
+            with self._sessions_lock:
+                self._sessions.add(session)
+        return session
 
-    def start_polling(self, callback):
-        def poll():
+    @staticmethod
+    def create_session():
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=8)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers["User-Agent"] = "PPS_Player"
+        return session
+
+    def url(self, path):
+        return f"{self.server_url}/{path.lstrip('/')}"
+
+    def commands_url(self):
+        return self.url(f"commands/{self.store_id}")
+
+    def start_polling(self, callback=None):
+        if callback is not None:
+            self.commands_received.connect(callback)
+        if self._thread is not None and self._thread.is_alive():
+            return
+        # 아직 끝나지 않은 이전 스레드는 자기 이벤트가 설정된 채로 남아 있다가 종료
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(self._stop_event,),
+                                        name="NetworkClientPoll", daemon=True)
+        self._thread.start()
+
+    def stop_polling(self, wait=True):
+        self._stop_event.set()
+        if wait and self._thread is not None:
+            self._thread.join(STOP_JOIN_TIMEOUT)
+        self._thread = None
+
+    def close(self):
+        self._stop_event.set()
+        # 연결 풀을 먼저 닫아 대기 중인 연결을 정리한 뒤 짧게만 기다림
+        with self._sessions_lock:
+            sessions = list(self._sessions)
+        for session in sessions:
+            session.close()
+        self.stop_polling()
+
+    def poll_once(self):
+        """한 번 폴링. 새 명령이 있으면 파싱된 JSON, 변경 없으면(304/204) None. 실패 시 예외."""
+        headers = {}
+        params = None
+        timeout = self.timeout
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.long_poll:
+            params = {"wait": self.long_poll_wait}
+            timeout = (self.timeout, self.long_poll_wait + self.timeout)
+
+        started = time.perf_counter()
+        resp = self.session.get(self.commands_url(), headers=headers, params=params, timeout=timeout)
+        self.last_rtt = time.perf_counter() - started
+        if not self.long_poll:
+            metrics.observe("poll_latency_ms", self.last_rtt * 1000)
+
+        if resp.status_code in (204, 304):
+            metrics.inc("poll_not_modified")
+            return None
+        resp.raise_for_status()
+        etag = resp.headers.get("ETag")
+        if etag:
+            self.etag = etag
+        if not resp.content:
+            return None
+        return resp.json()
+
+    def backoff_delay(self):
+        # 지수 백오프 + 지터 (동시에 장애가 난 매장들이 한꺼번에 재접속하지 않도록)
+        base = min(self.max_backoff, self.interval * (2 ** min(self.failures - 1, 16)))
+        return random.uniform(base / 2, base)
+
+    def _run(self, stop_event):
+        while not stop_event.is_set():
+            started = time.monotonic()
             try:
-                resp = requests.get(f"{self.server_url}/commands/{self.store_id}")
-                if resp.status_code == 200:
-                    callback(resp.json())
+                data = self.poll_once()
+                if stop_event.is_set():
+                    break  # 종료 요청 이후 도착한 응답은 처리하지 않음
+                self.failures = 0
+                if data:
+                    self.commands_received.emit(data)
+                if self.long_poll:
+                    # 롱폴링 미지원 서버가 즉시 응답해도 초당 1회 이상은 요청하지 않음
+                    delay = max(0.0, 1.0 - (time.monotonic() - started))
+                else:
+                    delay = self.interval
             except Exception as e:
-                print("Polling error:", e)
-            self.schedule_next()
-
-        self.schedule_next = lambda: Timer(self.interval, poll).start()
-        poll()
+                if stop_event.is_set():
+                    break
+                self.failures += 1
+                metrics.inc("poll_errors")
+                delay = self.backoff_delay()
+                logger.warning("Polling error (%d회 연속, %.1fs 후 재시도): %s", self.failures, delay, e)
+                self.poll_failed.emit(str(e))
+            stop_event.wait(delay)
@@ -0,0 +1,272 @@
+# PPS_Player/core/proof_of_play.py
+# ---------------------------
+# Version History
+# v0.1.0 - 2026.10.18 - 재생 증명(proof-of-play): 로컬 추가 전용 저널(세그먼트, 드문 fsync) + gzip 일괄 업로드(재시도, 세그먼트 ID 로 중복 방지)
+# v0.1.1 - 2026.10.18 - 재시도해도 안 되는 4xx 는 rejected/ 로 옮기고 다음 세그먼트 업로드 (5xx/429/네트워크 오류만 백오프),
+#                       파일 이름 대신 전체 경로(+ 매니페스트 이름) 기록
+# ---------------------------
+
+import gzip
+import json
+import logging
+import os
+import queue
+import random
+import threading
+import time
+import uuid
+from datetime import datetime
+
+from PPS_Player.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+OPEN_SUFFIX = ".jsonl.part"   # 기록 중인 세그먼트
+SEALED_SUFFIX = ".jsonl"      # 업로드 대기 세그먼트
+REJECTED_DIR = "rejected"     # 서버가 영구 거부한 세그먼트 (확인용으로 보관, 용량 초과 시 먼저 삭제)
+
+
+class RetryableUploadError(Exception):
+    """5xx/429 등 나중에 다시 보내면 되는 응답."""
+
+
+class PlayJournal:
+    """재생 이벤트를 세그먼트 파일에 한 줄씩 추가. 워커 스레드 전용.
+
+    - 이벤트마다 write+flush (OS 버퍼까지), fsync 는 fsync_interval 초마다와 봉인 시에만
+    - segment_events 건 또는 segment_seconds 초가 지나면 봉인(.jsonl.part → .jsonl)
+    - 세그먼트 파일명(시각-uuid)이 업로드 Idempotency-Key 가 되므로 재시작 후 재전송도 서버에서 중복 제거 가능
+    """
+
+    def __init__(self, journal_dir, segment_events=500, segment_seconds=300, fsync_interval=30,
+                 quota_bytes=50 * 1024 * 1024):
+        self.journal_dir = journal_dir
+        self.segment_events = segment_events
+        self.segment_seconds = segment_seconds
+        self.fsync_interval = fsync_interval
+        self.quota_bytes = quota_bytes
+        self.stream = None
+        self.path = None
+        self.events = 0
+        self.opened_at = 0.0
+        self.synced_at = 0.0
+        os.makedirs(journal_dir, exist_ok=True)
+        self.recover()
+
+    def recover(self):
+        # 비정상 종료로 남은 기록 중 세그먼트: 마지막 불완전한 줄을 잘라내고 봉인
+        for name in os.listdir(self.journal_dir):
+            if not name.endswith(OPEN_SUFFIX):
+                continue
+            path = os.path.join(self.journal_dir, name)
+            with open(path, "rb+") as f:
+                data = f.read()
+                end = data.rfind(b"\n") + 1
+                if end != len(data):
+                    f.truncate(end)
+            if end:
+                os.replace(path, path[:-len(OPEN_SUFFIX)] + SEALED_SUFFIX)
+            else:
+                os.remove(path)
+
+    def append(self, event):
+        if self.stream is None:
+            segment_id = f"{datetime.now():%Y%m%d%H%M%S%f}-{uuid.uuid4().hex[:12]}"
+            self.path = os.path.join(self.journal_dir, segment_id + OPEN_SUFFIX)
+            self.stream = open(self.path, "ab")
+            self.events = 0
+            self.opened_at = self.synced_at = time.monotonic()
+        self.stream.write(json.dumps(event, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n")
+        self.stream.flush()
+        self.events += 1
+        self.maintain()
+
+    def maintain(self):
+        """기간/건수 기준 봉인, 주기적 fsync. 새 이벤트가 없어도 워커가 주기적으로 호출."""
+        if self.stream is None:
+            return
+        now = time.monotonic()
+        if self.events >= self.segment_events or now - self.opened_at >= self.segment_seconds:
+            self.seal()
+        elif now - self.synced_at >= self.fsync_interval:
+            os.fsync(self.stream.fileno())
+            self.synced_at = now
+
+    def seal(self):
+        if self.stream is None:
+            return
+        self.stream.flush()
+        os.fsync(self.stream.fileno())
+        self.stream.close()
+        self.stream = None
+        os.replace(self.path, self.path[:-len(OPEN_SUFFIX)] + SEALED_SUFFIX)
+        self.path = None
+
+    def sealed_segments(self, directory=None):
+        """업로드 대기 세그먼트 (오래된 순)."""
+        directory = directory or self.journal_dir
+        if not os.path.isdir(directory):
+            return []
+        names = sorted(n for n in os.listdir(directory) if n.endswith(SEALED_SUFFIX))
+        return [os.path.join(directory, n) for n in names]
+
+    @property
+    def rejected_dir(self):
+        return os.path.join(self.journal_dir, REJECTED_DIR)
+
+    def reject(self, path):
+        os.makedirs(self.rejected_dir, exist_ok=True)
+        os.replace(path, os.path.join(self.rejected_dir, os.path.basename(path)))
+
+    def enforce_quota(self):
+        # 오프라인이 길어져 용량을 넘으면 거부된 세그먼트, 그다음 가장 오래된 세그먼트부터 버림 (재생은 계속)
+        segments = self.sealed_segments(self.rejected_dir) + self.sealed_segments()
+        total = sum(os.path.getsize(p) for p in segments)
+        while segments and total > self.quota_bytes:
+            path = segments.pop(0)
+            total -= os.path.getsize(path)
+            os.remove(path)
+            metrics.inc("pop_segments_discarded")
+            logger.warning("재생 증명 저널 용량 초과, 오래된 세그먼트 삭제: %s", os.path.basename(path))
+
+
+class ProofOfPlay:
+    """MediaViewer 의 재생 기록을 저널에 남기고 NetworkClient 세션으로 업로드.
+
+    record() 는 큐에 넣기만 하므로 GUI 스레드를 막지 않는다. 워커 스레드가 저널 기록,
+    봉인, 업로드(gzip POST, Idempotency-Key=세그먼트 ID)를 처리하고, 2xx/409 응답을 받은
+    세그먼트만 삭제한다. 그 밖의 4xx 는 rejected/ 로 옮기고, 5xx/429/네트워크 오류 시에는
+    지수 백오프로 재시도하며 기록은 계속 쌓인다.
+    """
+
+    def __init__(self, journal, network_client=None, upload_path="pop", upload_interval=60,
+                 max_backoff=900, asset_name=None):
+        self.journal = journal
+        self.network_client = network_client
+        self.asset_name = asset_name  # 경로 → 표시 이름 (미디어 동기화 blob 의 매니페스트 이름), 없으면 None
+        self.upload_path = upload_path
+        self.upload_interval = upload_interval
+        self.max_backoff = max_backoff
+        self.failures = 0
+        self._queue = queue.SimpleQueue()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="ProofOfPlay", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        self._queue.put(None)
+        if self._thread is not None:
+            self._thread.join(5)
+        self._thread = None
+
+    def record(self, path, kind, started_ms, duration_ms, completed):
+        """재생 1건. MediaViewer.media_finished 시그널에 연결."""
+        metrics.inc("pop_events")
+        # 다른 디렉토리의 같은 파일 이름이 합쳐지지 않도록 전체 경로
+        event = {
+            "t": started_ms,
+            "d": duration_ms,
+            "p": os.path.abspath(path),
+            "k": kind,
+            "c": int(completed),
+        }
+        name = self.asset_name(path) if self.asset_name is not None else None
+        if name:
+            event["n"] = name
+        self._queue.put(event)
+
+    def upload_url(self):
+        client = self.network_client
+        return client.url(f"{self.upload_path.rstrip('/')}/{client.store_id}")
+
+    def upload_segment(self, path):
+        client = self.network_client
+        with open(path, "rb") as f:
+            body = gzip.compress(f.read())
+        segment_id = os.path.basename(path)[:-len(SEALED_SUFFIX)]
+        resp = client.session.post(self.upload_url(), data=body, timeout=client.timeout, headers={
+            "Content-Type": "application/x-ndjson",
+            "Content-Encoding": "gzip",
+            "Idempotency-Key": segment_id,
+        })
+        status = resp.status_code
+        if status == 429 or status >= 500 or status < 200 or 300 <= status < 400:
+            raise RetryableUploadError(f"HTTP {status}")
+        if 400 <= status < 500 and status != 409:
+            # 다시 보내도 같은 결과이므로 따로 보관하고 다음 세그먼트로 진행
+            self.journal.reject(path)
+            metrics.inc("pop_segments_rejected")
+            logger.error("재생 증명 세그먼트 거부됨 (HTTP %d), %s 로 이동: %s",
+                         status, REJECTED_DIR, os.path.basename(path))
+            return
+        # 409: 이미 받은 세그먼트 (이전 전송의 응답만 유실된 경우)
+        os.remove(path)
+        metrics.inc("pop_segments_uploaded")
+
+    def upload_pending(self):
+        if self.network_client is None or not self.network_client.server_url:
+            return
+        for path in self.journal.sealed_segments():
+            if self._stop_event.is_set():
+                return
+            self.upload_segment(path)
+
+    def backoff_delay(self):
+        base = min(self.max_backoff, self.upload_interval * (2 ** min(self.failures - 1, 16)))
+        return random.uniform(base / 2, base)
+
+    def _run(self):
+        next_upload = time.monotonic()
+        while not self._stop_event.is_set():
+            try:
+                # 이벤트가 없어도 봉인/fsync 시점을 놓치지 않도록 최대 1초 대기
+                event = self._queue.get(timeout=1.0)
+            except queue.Empty:
+                event = None
+            try:
+                while event is not None:
+                    self.journal.append(event)
+                    event = self._queue.get_nowait()
+            except queue.Empty:
+                pass
+            except OSError as e:
+                logger.warning("재생 증명 기록 실패: %s", e)
+            try:
+                self.journal.maintain()
+            except OSError as e:
+                logger.warning("재생 증명 저널 정리 실패: %s", e)
+
+            if time.monotonic() < next_upload:
+                continue
+            try:
+                self.journal.enforce_quota()
+                self.upload_pending()
+                self.failures = 0
+                next_upload = time.monotonic() + self.upload_interval
+            except Exception as e:
+                self.failures += 1
+                metrics.inc("pop_upload_errors")
+                delay = self.backoff_delay()
+                next_upload = time.monotonic() + delay
+                logger.warning("재생 증명 업로드 실패 (%d회 연속, %.0fs 후 재시도): %s", self.failures, delay, e)
+            metrics.set_gauge("pop_pending_segments", len(self.journal.sealed_segments()))
+
+        # 종료 시 남은 이벤트를 기록하고 세그먼트 봉인 (다음 실행에서 업로드)
+        try:
+            while True:
+                event = self._queue.get_nowait()
+                if event is not None:
+                    self.journal.append(event)
+        except queue.Empty:
+            pass
+        try:
+            self.journal.seal()
+        except OSError as e:
+            logger.warning("재생 증명 저널 봉인 실패: %s", e)
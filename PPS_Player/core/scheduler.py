@@ -0,0 +1,279 @@
+# PPS_Player/core/scheduler.py
+# ---------------------------
+# Version History
+# v0.1.0 - 2026.10.18 - 시간대/요일별 편성(dayparting): 규칙을 주간 타임라인으로 미리 컴파일(이진 탐색 조회),
+#                       구간 경계에서 단발 타이머로 전환, 시작 전 다음 구간 사전 준비 알림
+# v0.1.1 - 2026.10.18 - 규칙/구간을 값으로 비교 (설정을 다시 읽어도 같은 편성이면 전환하지 않음), interval 에 bool 거부
+# ---------------------------
+
+import bisect
+import logging
+import math
+from datetime import datetime
+
+from PyQt6.QtCore import QObject, Qt, QTimer, pyqtSignal
+
+from PPS_Player.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+DAY_SECONDS = 24 * 3600
+WEEK_SECONDS = 7 * DAY_SECONDS
+DAY_NAMES = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+# 시계 보정(NTP)/서머타임/절전 복귀로 벽시계가 바뀌어도 최대 이 간격마다 다시 맞춤
+MAX_WAIT_MS = 3600 * 1000
+
+
+def parse_time(value):
+    """"HH:MM" 또는 "HH:MM:SS" → 하루 중 초. "24:00" 허용."""
+    parts = str(value).split(":")
+    if len(parts) not in (2, 3) or not all(p.isdigit() for p in parts):
+        raise ValueError(f"시각 형식 오류: {value!r}")
+    hours, minutes = int(parts[0]), int(parts[1])
+    seconds = int(parts[2]) if len(parts) == 3 else 0
+    total = hours * 3600 + minutes * 60 + seconds
+    if minutes >= 60 or seconds >= 60 or total > DAY_SECONDS:
+        raise ValueError(f"시각 범위 오류: {value!r}")
+    return total
+
+
+def parse_days(value):
+    """[0~6] 또는 ["mon", ...] (0/mon = 월요일). 생략하면 매일."""
+    if value is None:
+        return list(range(7))
+    days = []
+    for day in value:
+        if isinstance(day, str) and day[:3].lower() in DAY_NAMES:
+            day = DAY_NAMES.index(day[:3].lower())
+        if not isinstance(day, int) or isinstance(day, bool) or not 0 <= day <= 6:
+            raise ValueError(f"요일 오류: {day!r}")
+        days.append(day)
+    return sorted(set(days))
+
+
+class ScheduleRule:
+    """편성 규칙 1개. 설정/서버의 dict:
+
+    {"name": "lunch", "days": ["mon", "fri"], "start": "11:00", "end": "14:00",
+     "media_paths": [...], "url": "...", "interval": 8000, "priority": 0}
+
+    end 가 start 이하이면 다음 날 end 까지 (예: 22:00~06:00). 겹치는 구간은 priority 가 높은 규칙,
+    같으면 목록에서 뒤에 있는 규칙이 우선. media_paths/url/interval 을 생략하면 기본 설정을 사용.
+    """
+
+    def __init__(self, raw, order=0):
+        if not isinstance(raw, dict):
+            raise ValueError(f"규칙은 dict 여야 함: {raw!r}")
+        self.raw = raw
+        self.order = order
+        self.name = str(raw.get("name") or f"rule{order}")
+        self.days = parse_days(raw.get("days"))
+        self.start = parse_time(raw.get("start", "00:00"))
+        self.end = parse_time(raw.get("end", "24:00"))
+        self.media_paths = raw.get("media_paths")
+        self.url = raw.get("url") or None
+        self.interval = raw.get("interval")
+        self.priority = int(raw.get("priority", 0))
+        if self.media_paths is not None and not isinstance(self.media_paths, list):
+            raise ValueError(f"media_paths 는 목록이어야 함: {self.media_paths!r}")
+        if self.interval is not None and (not isinstance(self.interval, int) or isinstance(self.interval, bool)
+                                          or self.interval <= 0):
+            raise ValueError(f"interval 오류: {self.interval!r}")
+
+    def intervals(self):
+        """주간 초 단위 [시작, 끝) 목록. 주 경계(일→월)를 넘는 구간은 둘로 나눔."""
+        length = (self.end - self.start) % DAY_SECONDS or DAY_SECONDS
+        result = []
+        for day in self.days:
+            start = day * DAY_SECONDS + self.start
+            end = start + length
+            if end > WEEK_SECONDS:
+                result.append((start, WEEK_SECONDS))
+                result.append((0, end - WEEK_SECONDS))
+            else:
+                result.append((start, end))
+        return result
+
+    def __eq__(self, other):
+        # 설정을 다시 읽을 때마다 새 객체가 만들어지므로 원본 dict 와 순서로 비교
+        return isinstance(other, ScheduleRule) and (self.order, self.raw) == (other.order, other.raw)
+
+    def __hash__(self):
+        return hash((self.order, self.name))
+
+    def __repr__(self):
+        return f"ScheduleRule({self.name!r})"
+
+
+class Segment:
+    """타임라인의 한 구간 [start, end) (주간 초). rule 이 None 이면 기본 편성."""
+
+    def __init__(self, start, end, rule):
+        self.start = start
+        self.end = end
+        self.rule = rule
+
+    @property
+    def name(self):
+        return self.rule.name if self.rule is not None else "default"
+
+    def __eq__(self, other):
+        return isinstance(other, Segment) and (self.start, self.end, self.rule) == (other.start, other.end, other.rule)
+
+    def __hash__(self):
+        return hash((self.start, self.end))
+
+    def __repr__(self):
+        return f"Segment({self.start}, {self.end}, {self.name!r})"
+
+
+def compile_timeline(rules):
+    """규칙 목록 → 겹치지 않는 Segment 목록 (0 부터 WEEK_SECONDS 까지 빈틈 없이).
+
+    규칙이 바뀔 때 한 번만 계산한다. 규칙 수가 적으므로 경계 구간마다 단순 비교.
+    """
+    intervals = [(start, end, rule) for rule in rules for start, end in rule.intervals()]
+    bounds = sorted({0, WEEK_SECONDS} | {t for start, end, _ in intervals for t in (start, end)})
+    segments = []
+    for start, end in zip(bounds, bounds[1:]):
+        covering = [rule for s, e, rule in intervals if s <= start and end <= e]
+        rule = max(covering, key=lambda r: (r.priority, r.order)) if covering else None
+        if segments and segments[-1].rule is rule:
+            segments[-1].end = end  # 같은 규칙이 이어지면 병합
+        else:
+            segments.append(Segment(start, end, rule))
+    return segments
+
+
+def week_seconds(when):
+    return (when.weekday() * DAY_SECONDS + when.hour * 3600 + when.minute * 60
+            + when.second + when.microsecond / 1e6)
+
+
+class Timeline:
+    """미리 컴파일된 주간 타임라인. 현재/다음 구간 조회는 시작 시각 배열 이진 탐색 (O(log n))."""
+
+    def __init__(self, rules=()):
+        self.segments = compile_timeline(rules)
+        self.starts = [segment.start for segment in self.segments]
+
+    def index_at(self, seconds):
+        return bisect.bisect_right(self.starts, seconds % WEEK_SECONDS) - 1
+
+    def lookup(self, when):
+        """→ (현재 구간, 다음으로 바뀌는 구간, 다음 구간까지 남은 초)."""
+        seconds = week_seconds(when)
+        index = self.index_at(seconds)
+        current = self.segments[index]
+        # 일→월 경계처럼 규칙이 같은 구간으로 이어지는 경우는 건너뜀
+        remaining = current.end - seconds
+        following = self.segments[(index + 1) % len(self.segments)]
+        for offset in range(2, len(self.segments) + 1):
+            if following.rule is not current.rule:
+                break
+            remaining += following.end - following.start
+            following = self.segments[(index + offset) % len(self.segments)]
+        if following.rule is current.rule:
+            return current, None, None  # 주 전체가 한 편성
+        return current, following, remaining
+
+
+def parse_rules(raw_rules):
+    rules = []
+    for order, raw in enumerate(raw_rules or []):
+        try:
+            rules.append(ScheduleRule(raw, order))
+        except (TypeError, ValueError) as e:
+            logger.warning("⚠️ 편성 규칙 무시: %s", e)
+    return rules
+
+
+class Scheduler(QObject):
+    """편성 타임라인에 따라 구간 전환을 알림.
+
+    - 주기적으로 시각을 확인하지 않고, 다음 경계 시각에 맞춘 단발 PreciseTimer 하나만 사용
+      (경계가 멀면 MAX_WAIT_MS 마다 벽시계 기준으로 다시 계산)
+    - 다음 구간 시작 prefetch_lead 초 전에 segment_upcoming 으로 자산 준비를 요청
+    - 구간이 실제로 바뀔 때만 segment_changed (같은 규칙이 이어지는 경계는 무시)
+    """
+    segment_changed = pyqtSignal(object)
+    segment_upcoming = pyqtSignal(object)
+
+    def __init__(self, rules=None, prefetch_lead=60, parent=None):
+        super().__init__(parent)
+        self.prefetch_lead = prefetch_lead
+        self.rules = parse_rules(rules)
+        self.timeline = Timeline(self.rules)
+        self.current = None
+        self.upcoming = None
+        self.running = False
+
+        self.boundary_timer = QTimer(self)
+        self.boundary_timer.setSingleShot(True)
+        self.boundary_timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.boundary_timer.timeout.connect(self.evaluate)
+
+        self.prefetch_timer = QTimer(self)
+        self.prefetch_timer.setSingleShot(True)
+        self.prefetch_timer.timeout.connect(self.on_prefetch)
+
+    def set_rules(self, rules):
+        self.rules = parse_rules(rules)
+        self.timeline = Timeline(self.rules)
+        logger.info("🗓️ 편성 규칙 %d개 → 구간 %d개", len(rules or []), len(self.timeline.segments))
+        if self.running:
+            self.evaluate()
+
+    def set_prefetch_lead(self, seconds):
+        self.prefetch_lead = max(0, seconds)
+        if self.running:
+            self.evaluate()
+
+    def current_segment(self):
+        return self.timeline.lookup(datetime.now())[0]
+
+    def start(self):
+        self.running = True
+        self.evaluate()
+
+    def stop(self):
+        self.running = False
+        self.boundary_timer.stop()
+        self.prefetch_timer.stop()
+
+    def evaluate(self):
+        current, following, remaining = self.timeline.lookup(datetime.now())
+        if self.current is None or current.rule != self.current.rule:
+            previous = self.current
+            self.current = current
+            self.upcoming = None
+            if previous is not None:
+                metrics.inc("schedule_transitions")
+                logger.info("🗓️ 편성 전환: %s → %s", previous.name, current.name)
+            self.segment_changed.emit(current)
+        else:
+            self.current = current
+
+        self.prefetch_timer.stop()
+        if following is None:
+            self.boundary_timer.stop()
+            return
+        # 타이머가 경계보다 조금 일찍 울리면 같은 구간으로 조회되므로 남은 시간만큼 다시 예약
+        remaining_ms = max(1, math.ceil(remaining * 1000))
+        self.boundary_timer.start(min(remaining_ms, MAX_WAIT_MS))
+
+        if following == self.upcoming:
+            return
+        lead_ms = remaining_ms - self.prefetch_lead * 1000
+        if lead_ms <= 0:
+            self.upcoming = following
+            self.segment_upcoming.emit(following)
+        elif lead_ms < MAX_WAIT_MS:
+            self.prefetch_timer.start(lead_ms)
+
+    def on_prefetch(self):
+        _, following, _ = self.timeline.lookup(datetime.now())
+        if following is not None and following != self.upcoming:
+            self.upcoming = following
+            logger.info("🗓️ 다음 편성 준비: %s", following.name)
+            self.segment_upcoming.emit(following)
@@ -0,0 +1,110 @@
+# PPS_Player/core/tts_cache.py
+# ---------------------------
+# Version History
+# v0.1.0 - 2026.10.18 - 합성 음성 WAV 캐시 추가 (텍스트/음성/속도/볼륨 기반 키, 용량 제한 LRU)
+# v0.1.1 - 2026.10.18 - 중단된 렌더링이 남긴 *.part.wav 를 시작 시/정리 시 삭제 (용량 제한 밖에서 쌓이던 문제)
+# ---------------------------
+
+import hashlib
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+
+class TTSCache:
+    """pyttsx3 로 렌더링한 WAV 파일을 내용 주소(sha256) 로 보관하는 디스크 캐시.
+
+    파일 mtime 을 최근 사용 시각으로 사용하며, 전체 용량이 max_bytes 를 넘으면
+    가장 오래 사용하지 않은 파일부터 삭제한다. 렌더링 스레드에서만 사용할 것.
+    """
+    PART_SUFFIX = ".part.wav"
+
+    def __init__(self, cache_dir, max_bytes=50 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.remove_partials()
+
+    @staticmethod
+    def make_key(text, voice, rate, volume):
+        raw = f"{text}\x00{voice}\x00{rate}\x00{volume}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def engine_key(engine, text):
+        return TTSCache.make_key(text,
+                                 engine.getProperty("voice"),
+                                 engine.getProperty("rate"),
+                                 engine.getProperty("volume"))
+
+    def path_for(self, key):
+        return os.path.join(self.cache_dir, f"{key}.wav")
+
+    def lookup(self, key):
+        path = self.path_for(key)
+        if not os.path.isfile(path) or os.path.getsize(path) == 0:
+            return None
+        try:
+            os.utime(path, None)  # LRU 갱신
+        except OSError:
+            pass
+        return path
+
+    def render(self, engine, text, key):
+        path = self.path_for(key)
+        tmp_path = os.path.join(self.cache_dir, f"{key}{self.PART_SUFFIX}")
+        engine.save_to_file(text, tmp_path)
+        engine.runAndWait()
+        if not os.path.isfile(tmp_path) or os.path.getsize(tmp_path) == 0:
+            logger.warning("TTS 렌더링 결과 없음: %s", text)
+            self.remove(tmp_path)
+            return None
+        os.replace(tmp_path, path)
+        self.evict()
+        return path
+
+    def get_or_render(self, engine, text):
+        key = self.engine_key(engine, text)
+        return self.lookup(key) or self.render(engine, text, key)
+
+    def remove_partials(self):
+        """중단된 save_to_file 이 남긴 임시 파일 삭제. 렌더링은 한 스레드에서 순서대로만 하므로
+        render() 밖에서 보이는 임시 파일은 모두 버려진 것."""
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(self.PART_SUFFIX):
+                self.remove(os.path.join(self.cache_dir, name))
+
+    @staticmethod
+    def remove(path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError:
+            logger.warning("TTS 캐시 삭제 실패: %s", path)
+
+    def evict(self):
+        self.remove_partials()
+        entries = []
+        total = 0
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(".wav") or name.endswith(self.PART_SUFFIX):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                logger.warning("TTS 캐시 삭제 실패: %s", path)
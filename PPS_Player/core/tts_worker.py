@@ -0,0 +1,205 @@
+# PPS_Player/core/tts_worker.py
+# ---------------------------
+# Version History
+# v0.1.0 - 2026.10.18 - 전용 TTS 워커 스레드 추가 (우선순위 큐, 중복 제거, 넘침 정책)
+# v0.2.0 - 2026.10.18 - 합성 음성 캐시 연동 (캐시 WAV 는 GUI 측 플레이어로 재생), 사전 렌더링 지원
+# v0.2.1 - 2026.10.18 - 대기열 길이/대기 시간/발화 시간 계측
+# v0.2.2 - 2026.10.18 - 종료 시 진행 중인 발화 중단(engine.stop) 후 스레드 종료 확인
+# ---------------------------
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from PPS_Player.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+PRIORITY_LOW = 2
+
+OVERFLOW_DROP = "drop"
+OVERFLOW_MERGE = "merge"
+
+
+class TTSWorker(QThread):
+    """pyttsx3 발화를 GUI 스레드 밖에서 순차 처리하는 워커.
+
+    - 대기열은 max_queue 개로 제한되며 우선순위가 높은(숫자가 작은) 항목부터 발화
+    - 이미 대기 중인 동일 문장은 다시 넣지 않음 (우선순위만 상향)
+    - 대기열이 가득 차면 overflow 정책에 따라 버리거나(drop) 같은 우선순위 항목에 이어붙임(merge)
+    - cache(TTSCache) 가 있으면 WAV 로 렌더링/재사용하고 play_requested 로 재생을 요청한 뒤
+      notify_playback_finished() 가 호출될 때까지 대기
+    """
+    speech_started = pyqtSignal(str)
+    speech_finished = pyqtSignal(str)
+    speech_dropped = pyqtSignal(str)
+    play_requested = pyqtSignal(str, str)  # (wav 경로, 문장)
+
+    PLAYBACK_TIMEOUT = 60.0
+    STOP_TIMEOUT_MS = 3000
+
+    def __init__(self, max_queue=10, overflow=OVERFLOW_DROP, cache=None, parent=None):
+        super().__init__(parent)
+        self.max_queue = max(1, max_queue)
+        self.overflow = overflow
+        self.cache = cache
+        self._queue = []  # [priority, seq, text, 투입 시각]
+        self._warmup = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._playback_done = threading.Event()
+        self._running = True
+        self.engine = None
+
+    def pending_count(self):
+        with self._cond:
+            return len(self._queue)
+
+    def enqueue(self, text, priority=PRIORITY_NORMAL):
+        """발화 요청을 대기열에 추가. 버려진 경우 False 반환. 어느 스레드에서나 호출 가능."""
+        text = text.strip()
+        if not text:
+            return False
+        dropped = None
+        with self._cond:
+            for entry in self._queue:
+                if entry[2] == text:
+                    if priority < entry[0]:
+                        entry[0] = priority
+                        heapq.heapify(self._queue)
+                    return True
+
+            if len(self._queue) >= self.max_queue:
+                if self.overflow == OVERFLOW_MERGE and self._merge(text, priority):
+                    self._cond.notify()
+                    return True
+                dropped = self._drop_for(priority)
+                if dropped is None:
+                    dropped = text
+                    text = None
+
+            if text is not None:
+                heapq.heappush(self._queue, [priority, next(self._seq), text, time.perf_counter()])
+                self._cond.notify()
+            metrics.set_gauge("tts_queue_depth", len(self._queue))
+
+        if dropped is not None:
+            metrics.inc("tts_dropped")
+            logger.warning("TTS 대기열 초과로 발화 제외: %s", dropped)
+            self.speech_dropped.emit(dropped)
+        return text is not None
+
+    def _merge(self, text, priority):
+        # 같은 우선순위의 가장 마지막 항목 뒤에 이어붙임
+        candidates = [entry for entry in self._queue if entry[0] == priority]
+        if not candidates:
+            return False
+        last = max(candidates, key=lambda entry: entry[1])
+        last[2] = f"{last[2]} {text}"
+        return True
+
+    def _drop_for(self, priority):
+        # 새 항목보다 우선순위가 낮은 항목 중 가장 최근 것을 밀어냄
+        victim = max(self._queue, key=lambda entry: (entry[0], entry[1]))
+        if victim[0] <= priority:
+            return None
+        self._queue.remove(victim)
+        heapq.heapify(self._queue)
+        return victim[2]
+
+    def warm_up(self, phrases):
+        """캐시에 미리 렌더링할 문구 등록. 발화 대기열이 비어 있을 때만 하나씩 처리."""
+        if self.cache is None:
+            return
+        with self._cond:
+            self._warmup.extend(p.strip() for p in phrases if p and p.strip())
+            self._cond.notify()
+
+    def notify_playback_finished(self):
+        self._playback_done.set()
+
+    def _take(self):
+        # (종류, 문장) 반환. 종료 시 None
+        with self._cond:
+            while self._running and not self._queue and not self._warmup:
+                self._cond.wait()
+            if not self._running:
+                return None
+            if self._queue:
+                _, _, text, enqueued = heapq.heappop(self._queue)
+                metrics.set_gauge("tts_queue_depth", len(self._queue))
+                metrics.observe("tts_queue_wait_ms", (time.perf_counter() - enqueued) * 1000)
+                return ("speak", text)
+            return ("render", self._warmup.pop(0))
+
+    def stop(self):
+        """대기열을 비우고 진행 중인 발화를 끊은 뒤 스레드 종료까지 대기. 종료되면 True."""
+        with self._cond:
+            self._running = False
+            self._queue.clear()
+            self._warmup.clear()
+            self._cond.notify_all()
+        self._playback_done.set()
+        if self.engine is not None:
+            # 긴 문장을 runAndWait() 로 말하는 중이면 끝날 때까지 기다리지 않도록 중단
+            try:
+                self.engine.stop()
+            except Exception as e:
+                logger.warning("TTS 엔진 중단 실패: %s", e)
+        if self.wait(self.STOP_TIMEOUT_MS):
+            return True
+        # 실행 중인 QThread 가 파괴되면 Qt 가 경고/비정상 종료하므로 한 번 더 기다림
+        logger.warning("TTS 스레드가 %dms 안에 끝나지 않음, 추가 대기", self.STOP_TIMEOUT_MS)
+        if self.wait(self.STOP_TIMEOUT_MS * 2):
+            return True
+        logger.error("TTS 스레드 종료 실패")
+        return False
+
+    def create_engine(self):
+        # pyttsx3 엔진은 사용하는 스레드에서 생성해야 함 (Windows SAPI/COM)
+        import pyttsx3
+        return pyttsx3.init()
+
+    def speak(self, text):
+        path = self.cache.get_or_render(self.engine, text) if self.cache is not None else None
+        if path is None:
+            self.engine.say(text)
+            self.engine.runAndWait()
+            return
+        self._playback_done.clear()
+        self.play_requested.emit(path, text)
+        if not self._playback_done.wait(self.PLAYBACK_TIMEOUT):
+            logger.warning("TTS 캐시 재생 완료 신호 없음: %s", text)
+
+    def run(self):
+        try:
+            self.engine = self.create_engine()
+        except Exception:
+            logger.exception("TTS 엔진 초기화 실패")
+            return
+
+        while True:
+            item = self._take()
+            if item is None:
+                break
+            kind, text = item
+            if kind == "render":
+                try:
+                    self.cache.get_or_render(self.engine, text)
+                except Exception:
+                    logger.exception("TTS 사전 렌더링 실패: %s", text)
+                continue
+            self.speech_started.emit(text)
+            try:
+                with metrics.timer("tts_speak_ms"):
+                    self.speak(text)
+            except Exception:
+                metrics.inc("tts_errors")
+                logger.exception("TTS 발화 실패: %s", text)
+            self.speech_finished.emit(text)
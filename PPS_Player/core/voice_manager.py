@@ -2,23 +2,43 @@
 # ---------------------------
 # Version History
 # v0.0.1 - 2025.04.25 - 음성 수신 및 자막 출력 구조 설계 시작
+# v0.1.0 - 2026.10.18 - PyQt6 전환, 플레이어 재사용 및 재생 완료 시그널 추가 (TTS 캐시 재생용)
+# v0.1.1 - 2026.10.18 - 재생 시작 시그널 추가 (배경 음악 더킹용)
 # ---------------------------
 
-from PyQt5.QtMultimedia import QMediaPlayer, QMediaContent
-from PyQt5.QtWidgets import QLabel
-from PyQt5.QtCore import QUrl, QTimer
+from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput
+from PyQt6.QtWidgets import QLabel
+from PyQt6.QtCore import QObject, QUrl, QTimer, pyqtSignal
 
-class VoiceManager:
-    def __init__(self, subtitle_label: QLabel):
-        self.player = QMediaPlayer()
+class VoiceManager(QObject):
+    started = pyqtSignal()
+    finished = pyqtSignal()
+
+    def __init__(self, subtitle_label: QLabel = None, parent=None):
+        super().__init__(parent)
+        # 플레이어/오디오 출력은 한 번만 만들어 재사용 (매 발화마다 백엔드 초기화 방지)
+        self.player = QMediaPlayer(self)
+        self.audio_output = QAudioOutput(self)
+        self.player.setAudioOutput(self.audio_output)
+        self.player.mediaStatusChanged.connect(self.on_status_changed)
         self.subtitle_label = subtitle_label
 
-    def play_voice(self, filepath, subtitle_text):
-        self.subtitle_label.setText(subtitle_text)
-        self.player.setMedia(QMediaContent(QUrl.fromLocalFile(filepath)))
+        self.subtitle_timer = QTimer(self)
+        self.subtitle_timer.setSingleShot(True)
+        self.subtitle_timer.timeout.connect(self.clear_subtitle)
+
+    def play_voice(self, filepath, subtitle_text=""):
+        if self.subtitle_label is not None:
+            self.subtitle_label.setText(subtitle_text)
+            self.subtitle_timer.start(5000)
+        self.player.setSource(QUrl.fromLocalFile(filepath))
         self.player.play()
+        self.started.emit()
+
+    def on_status_changed(self, status):
+        if status in (QMediaPlayer.MediaStatus.EndOfMedia, QMediaPlayer.MediaStatus.InvalidMedia):
+            self.finished.emit()
 
-        timer = QTimer()
-        timer.setSingleShot(True)
-        timer.timeout.connect(lambda: self.subtitle_label.setText(""))
-        timer.start(5000)
+    def clear_subtitle(self):
+        if self.subtitle_label is not None:
+            self.subtitle_label.setText("")
@@ -0,0 +1,169 @@
+# PPS_Player/tests/test_config_manager.py
+# ---------------------------
+# Version History
+# v0.1.0 - 2026.10.18 - 설정 스키마 변환/범위·허용값 검증, 잘못된 값의 기존 값 유지, 키별 변경 알림, 재시작 필요 키 기록 검증
+# ---------------------------
+
+import importlib.util
+import json
+import os
+import tempfile
+import unittest
+
+if not importlib.util.find_spec("PyQt6"):
+    raise unittest.SkipTest("PyQt6 미설치")
+
+from PyQt6.QtCore import QCoreApplication
+
+from PPS_Player.config.config_manager import SCHEMA, ConfigManager, coerce, default_config, validate
+
+
+class CoerceTest(unittest.TestCase):
+    def test_types(self):
+        self.assertEqual(coerce("media_interval", "7000"), 7000)
+        self.assertEqual(coerce("poll_interval", 2), 2.0)
+        self.assertIs(coerce("media_rolling", "False"), False)
+        self.assertEqual(coerce("url", 123), "123")
+        self.assertEqual(coerce("media_paths", ["a.png"]), ["a.png"])
+
+    def test_rejects_wrong_types(self):
+        for key, value in (("media_interval", True), ("media_interval", "abc"), ("media_rolling", "yes"),
+                           ("media_paths", "a.png"), ("url", None)):
+            with self.subTest(key=key, value=value), self.assertRaises((TypeError, ValueError)):
+                coerce(key, value)
+
+    def test_min_max(self):
+        self.assertEqual(coerce("music_volume", 0), 0)
+        self.assertEqual(coerce("music_volume", 100), 100)
+        for value in (-1, 101):
+            with self.subTest(value=value), self.assertRaises(ValueError):
+                coerce("music_volume", value)
+        with self.assertRaises(ValueError):
+            coerce("poll_interval", 0.1)
+
+    def test_choices_case_insensitive(self):
+        self.assertEqual(coerce("log_level", "debug"), "DEBUG")
+        self.assertEqual(coerce("web_cache_mode", "MEMORY"), "memory")
+        with self.assertRaises(ValueError):
+            coerce("music_mode", "random")
+
+    def test_defaults_satisfy_schema(self):
+        for key, value in default_config().items():
+            with self.subTest(key=key):
+                self.assertEqual(coerce(key, value), value)
+
+
+class ValidateTest(unittest.TestCase):
+    def test_invalid_value_falls_back_to_default(self):
+        with self.assertLogs("PPS_Player.config.config_manager", "WARNING"):
+            config = validate({"media_interval": 10, "music_mode": "random"})
+        self.assertEqual(config["media_interval"], SCHEMA["media_interval"][1])
+        self.assertEqual(config["music_mode"], SCHEMA["music_mode"][1])
+
+    def test_invalid_value_keeps_previous(self):
+        previous = validate({"media_interval": 8000, "log_level": "DEBUG"})
+        with self.assertLogs("PPS_Player.config.config_manager", "WARNING") as logs:
+            config = validate({"media_interval": -5, "log_level": "verbose"}, previous=previous)
+        self.assertEqual(config["media_interval"], 8000)
+        self.assertEqual(config["log_level"], "DEBUG")
+        self.assertIn("기존 값", logs.output[0])
+
+    def test_unknown_keys_preserved(self):
+        self.assertEqual(validate({"future_option": {"a": 1}})["future_option"], {"a": 1})
+
+
+class ConfigManagerTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QCoreApplication.instance() or QCoreApplication([])
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "config.json")
+        self.write({"media_interval": 6000, "url": "http://a"})
+        self.config = ConfigManager(self.path)
+        self.config.load_config()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, data):
+        with open(self.path, "w", encoding="utf-8") as f:
+            if isinstance(data, str):
+                f.write(data)
+            else:
+                json.dump(data, f)
+
+    def read(self):
+        with open(self.path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def test_load_applies_defaults(self):
+        self.assertEqual(self.config["media_interval"], 6000)
+        self.assertEqual(self.config.get("bottom_height"), SCHEMA["bottom_height"][1])
+
+    def test_reload_notifies_only_changed_keys(self):
+        calls = []
+        signals = []
+        self.config.subscribe("media_interval", calls.append)
+        self.config.subscribe("url", lambda value: calls.append(("url", value)))
+        self.config.changed.connect(lambda key, value: signals.append(key))
+        self.write({"media_interval": 9000, "url": "http://a"})
+        self.config.reload()
+        self.assertEqual(calls, [9000])
+        self.assertEqual(signals, ["media_interval"])
+
+    def test_reload_keeps_previous_on_invalid_value(self):
+        calls = []
+        self.config.subscribe("media_interval", calls.append)
+        self.write({"media_interval": "soon", "url": "http://b"})
+        with self.assertLogs("PPS_Player.config.config_manager", "WARNING"):
+            self.config.reload()
+        self.assertEqual(self.config["media_interval"], 6000)
+        self.assertEqual(self.config["url"], "http://b")
+        self.assertEqual(calls, [])
+
+    def test_reload_keeps_config_on_broken_json(self):
+        self.write("{ not json")
+        with self.assertLogs("PPS_Player.config.config_manager", "WARNING"):
+            self.config.reload()
+        self.assertEqual(self.config["url"], "http://a")
+
+    def test_unsubscribed_key_needs_restart(self):
+        self.config.subscribe("url", lambda value: None)
+        self.write({"media_interval": 6000, "url": "http://b", "image_cache_mb": 128})
+        with self.assertLogs("PPS_Player.config.config_manager", "INFO") as logs:
+            self.config.reload()
+        self.assertEqual(self.config.restart_pending, {"image_cache_mb"})
+        restart_logs = [line for line in logs.output if "재시작" in line]
+        self.assertEqual(len(restart_logs), 1)
+        self.assertIn("image_cache_mb", restart_logs[0])
+
+    def test_failing_subscriber_does_not_block_others(self):
+        calls = []
+
+        def broken(value):
+            raise RuntimeError("boom")
+
+        self.config.subscribe("media_interval", broken)
+        self.config.subscribe("media_interval", calls.append)
+        with self.assertLogs("PPS_Player.config.config_manager", "ERROR"):
+            self.config.set("media_interval", 7000, save=False)
+        self.assertEqual(calls, [7000])
+
+    def test_set_validates_saves_and_skips_unchanged(self):
+        calls = []
+        self.config.subscribe("music_volume", calls.append)
+        self.config.set("music_volume", "30")
+        self.config.set("music_volume", 30)
+        self.assertEqual(calls, [30])
+        self.assertEqual(self.read()["music_volume"], 30)
+        # 기본값과 같은 항목은 저장하지 않음
+        self.assertNotIn("poll_interval", self.read())
+        with self.assertRaises(ValueError):
+            self.config.set("music_volume", 150)
+        self.assertEqual(self.config["music_volume"], 30)
+
+
+if __name__ == "__main__":
+    unittest.main()
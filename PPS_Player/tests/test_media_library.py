@@ -0,0 +1,167 @@
+# PPS_Player/tests/test_media_library.py
+# ---------------------------
+# Version History
+# v0.1.0 - 2026.10.18 - 미디어 인덱스 증분 스캔(변경 디렉토리만 stat), 인덱스 정리, mp4 길이/해상도 probe 검증
+# ---------------------------
+
+import importlib.util
+import os
+import struct
+import tempfile
+import unittest
+from unittest import mock
+
+if not importlib.util.find_spec("PyQt6"):
+    raise unittest.SkipTest("PyQt6 미설치")
+
+from PyQt6.QtCore import QCoreApplication
+from PyQt6.QtGui import QColor, QImage
+
+from PPS_Player.core import media_library
+from PPS_Player.core.media_library import KIND_IMAGE, KIND_VIDEO, MediaLibrary, PlaylistItem, mp4_info
+
+
+def box(kind, payload):
+    return struct.pack(">I4s", 8 + len(payload), kind) + payload
+
+
+def write_mp4(path, duration_ms, width, height):
+    """ftyp + moov(mvhd, 오디오 trak, 영상 trak) + mdat 만 있는 최소 mp4."""
+    mvhd = box(b"mvhd", bytes(12) + struct.pack(">II", 1000, duration_ms) + bytes(80))
+
+    def trak(w, h):
+        tkhd = box(b"tkhd", bytes(76) + struct.pack(">II", w << 16, h << 16))
+        return box(b"trak", tkhd)
+
+    with open(path, "wb") as f:
+        f.write(box(b"ftyp", b"isom" + bytes(4)))
+        f.write(box(b"moov", mvhd + trak(0, 0) + trak(width, height)))
+        f.write(box(b"mdat", bytes(64)))
+
+
+class MediaLibraryScanTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QCoreApplication.instance() or QCoreApplication([])
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.media_dir = os.path.join(self.tmp.name, "media")
+        self.other_dir = os.path.join(self.tmp.name, "other")
+        os.makedirs(os.path.join(self.media_dir, "sub"))
+        os.makedirs(self.other_dir)
+        self.library = MediaLibrary([self.media_dir], os.path.join(self.tmp.name, "index.sqlite"), watch=False)
+        self.conn = self.library.connect_db()
+
+    def tearDown(self):
+        self.conn.close()
+        self.tmp.cleanup()
+
+    def image(self, *parts):
+        path = os.path.join(*parts)
+        image = QImage(8, 4, QImage.Format.Format_RGB32)
+        image.fill(QColor("red"))
+        self.assertTrue(image.save(path))
+        return path
+
+    def indexed(self):
+        return {path for (path,) in self.conn.execute("SELECT path FROM media")}
+
+    def scan_counting_stats(self):
+        stats = []
+        real_stat = os.stat
+
+        def counting_stat(path, *args, **kwargs):
+            stats.append(path)
+            return real_stat(path, *args, **kwargs)
+
+        with mock.patch.object(media_library.os, "stat", side_effect=counting_stat):
+            self.library.scan(self.conn)
+        return stats
+
+    def test_full_scan_builds_playlist(self):
+        a = self.image(self.media_dir, "a.png")
+        b = self.image(self.media_dir, "sub", "b.png")
+        self.library.scan(self.conn)
+        self.assertEqual(self.library.playlist, [PlaylistItem(a, KIND_IMAGE), PlaylistItem(b, KIND_IMAGE)])
+        self.assertEqual(self.library.cached_playlist(), self.library.playlist)
+        row = self.conn.execute("SELECT width, height FROM media WHERE path = ?", (a,)).fetchone()
+        self.assertEqual(row, (8, 4))
+
+    def test_incremental_scan_stats_only_changed_directory(self):
+        a = self.image(self.media_dir, "a.png")
+        self.image(self.media_dir, "sub", "b.png")
+        self.library.scan(self.conn)
+
+        c = self.image(self.media_dir, "sub", "c.png")
+        self.library.on_directory_changed(os.path.join(self.media_dir, "sub"))
+        stats = self.scan_counting_stats()
+        self.assertNotIn(a, stats)
+        self.assertIn(c, stats)
+        self.assertIn(c, [item.path for item in self.library.playlist])
+
+    def test_idle_rescan_stats_nothing(self):
+        self.image(self.media_dir, "a.png")
+        self.library.scan(self.conn)
+        self.assertEqual(self.scan_counting_stats(), [])
+
+    def test_deleted_file_removed_from_index(self):
+        a = self.image(self.media_dir, "a.png")
+        b = self.image(self.media_dir, "b.png")
+        self.library.scan(self.conn)
+        os.remove(b)
+        self.library.on_directory_changed(self.media_dir)
+        self.library.scan(self.conn)
+        self.assertEqual([item.path for item in self.library.playlist], [a])
+        self.assertEqual(self.indexed(), {a})
+
+    def test_retained_sources_survive_prune(self):
+        a = self.image(self.media_dir, "a.png")
+        other = self.image(self.other_dir, "x.png")
+        self.library.set_retained_sources([[self.other_dir]])
+        self.library.prepare_scan(self.conn, [self.other_dir])
+        self.library.scan(self.conn)
+        self.assertEqual(self.indexed(), {a, other})
+
+        self.library.set_retained_sources([])
+        self.library.scan(self.conn)
+        self.assertEqual(self.indexed(), {a})
+
+    def test_switching_sources_prunes_old_entries(self):
+        a = self.image(self.media_dir, "a.png")
+        other = self.image(self.other_dir, "x.png")
+        self.library.scan(self.conn)
+        self.library.set_sources([self.other_dir])
+        self.library.scan(self.conn)
+        self.assertEqual([item.path for item in self.library.playlist], [other])
+        self.assertEqual(self.indexed(), {other})
+        self.assertNotIn(a, self.indexed())
+
+    def test_video_duration_reaches_playlist(self):
+        video = os.path.join(self.media_dir, "clip.mp4")
+        write_mp4(video, 12345, 1920, 1080)
+        self.library.set_sources([{"path": video, "duration": 5000}, self.media_dir])
+        self.library.scan(self.conn)
+        self.assertEqual(self.library.playlist, [PlaylistItem(video, KIND_VIDEO, 5000, 12345)])
+        row = self.conn.execute("SELECT width, height, duration_ms FROM media WHERE path = ?", (video,)).fetchone()
+        self.assertEqual(row, (1920, 1080, 12345))
+        self.assertEqual(self.library.cached_playlist(), self.library.playlist)
+
+
+class Mp4InfoTest(unittest.TestCase):
+    def test_reads_duration_and_video_track_size(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "clip.mp4")
+            write_mp4(path, 90000, 1280, 720)
+            self.assertEqual(mp4_info(path), (90000, 1280, 720))
+
+    def test_missing_moov(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "broken.mp4")
+            with open(path, "wb") as f:
+                f.write(box(b"ftyp", b"isom" + bytes(4)) + box(b"mdat", bytes(16)))
+            self.assertIsNone(mp4_info(path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+# PPS_Player/tests/test_media_sync.py
+# ---------------------------
+# Version History
+# v0.1.0 - 2026.10.18 - MediaSync 다운로드/이어받기/416/해시 검증 (로컬 스텁 서버)
+# ---------------------------
+
+import hashlib
+import importlib.util
+import os
+import tempfile
+import unittest
+
+if not all(importlib.util.find_spec(name) for name in ("PyQt6", "requests")):
+    raise unittest.SkipTest("PyQt6/requests 미설치")
+
+from PPS_Player.bench.bench_utils import StubServer
+from PPS_Player.core.media_sync import ManifestEntry, MediaSync
+from PPS_Player.core.network_client import NetworkClient
+
+DATA = bytes(range(256)) * 64
+SHA = hashlib.sha256(DATA).hexdigest()
+
+
+class MediaSyncTest(unittest.TestCase):
+    def setUp(self):
+        self.server = StubServer().start()
+        self.server.files["a.png"] = DATA
+        self.tmp = tempfile.TemporaryDirectory()
+        self.client = NetworkClient(self.server.url, "store1", timeout=5)
+        self.sync = MediaSync(self.client, self.tmp.name, manifest_path="json/manifest", workers=2)
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+        self.tmp.cleanup()
+
+    def entry(self, size=len(DATA), sha=SHA):
+        return ManifestEntry(f"{self.server.url}/files/a.png", sha, size)
+
+    def write_part(self, entry, data):
+        path = self.sync.blob_path(entry) + ".part"
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(data)
+        return path
+
+    def test_sync_once_downloads_and_saves_playlist(self):
+        self.server.json_routes["manifest"] = {"items": [
+            {"url": f"{self.server.url}/files/a.png", "sha256": SHA, "size": len(DATA)}]}
+        playlist = self.sync.sync_once()
+        self.assertEqual(len(playlist), 1)
+        with open(playlist[0], "rb") as f:
+            self.assertEqual(f.read(), DATA)
+        self.assertEqual(self.sync.load_cached_playlist(), playlist)
+
+    def test_resume_partial_download(self):
+        entry = self.entry()
+        self.write_part(entry, DATA[:1000])
+        path = self.sync.download(entry)
+        with open(path, "rb") as f:
+            self.assertEqual(f.read(), DATA)
+
+    def test_complete_part_with_unknown_size_is_accepted_on_416(self):
+        entry = self.entry(size=0)
+        self.write_part(entry, DATA)
+        path = self.sync.download(entry)
+        self.assertTrue(os.path.isfile(path))
+        self.assertFalse(os.path.exists(path + ".part"))
+
+    def test_corrupt_part_restarts_from_zero_on_416(self):
+        entry = self.entry(size=0)
+        self.write_part(entry, b"x" * (len(DATA) + 10))
+        path = self.sync.download(entry)
+        with open(path, "rb") as f:
+            self.assertEqual(f.read(), DATA)
+
+    def test_hash_mismatch_is_rejected(self):
+        entry = self.entry(sha="0" * 64)
+        with self.assertRaises(IOError):
+            self.sync.download(entry)
+        self.assertFalse(os.path.exists(self.sync.blob_path(entry)))
+
+
+if __name__ == "__main__":
+    unittest.main()
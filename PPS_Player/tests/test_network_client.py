@@ -0,0 +1,58 @@
+# PPS_Player/tests/test_network_client.py
+# ---------------------------
+# Version History
+# v0.1.0 - 2026.10.18 - NetworkClient 폴링(ETag/304, 백오프, 종료) 검증 (로컬 스텁 서버)
+# ---------------------------
+
+import importlib.util
+import time
+import unittest
+
+if not all(importlib.util.find_spec(name) for name in ("PyQt6", "requests")):
+    raise unittest.SkipTest("PyQt6/requests 미설치")
+
+from PPS_Player.bench.bench_utils import StubServer
+from PPS_Player.core.network_client import STOP_JOIN_TIMEOUT, NetworkClient
+
+
+class NetworkClientTest(unittest.TestCase):
+    def setUp(self):
+        self.server = StubServer().start()
+        self.client = NetworkClient(self.server.url, "store1", interval=0.05, timeout=2)
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+
+    def test_etag_not_modified(self):
+        self.assertEqual(self.client.poll_once(), [])
+        self.assertEqual(self.client.etag, '"0"')
+        # 두 번째 요청은 If-None-Match → 304
+        self.assertIsNone(self.client.poll_once())
+
+    def test_command_delivered(self):
+        self.server.tts_every = 1
+        data = self.client.poll_once()
+        self.assertEqual(data["command"], "tts")
+
+    def test_backoff_grows_and_is_capped(self):
+        self.client.interval = 1
+        self.client.max_backoff = 8
+        for failures, upper in ((1, 1), (3, 4), (10, 8)):
+            self.client.failures = failures
+            delay = self.client.backoff_delay()
+            self.assertGreaterEqual(delay, upper / 2)
+            self.assertLessEqual(delay, upper)
+
+    def test_stop_does_not_wait_for_long_poll(self):
+        self.server.command_delay = 5
+        self.client.long_poll = True
+        self.client.start_polling()
+        time.sleep(0.2)  # 요청이 서버에서 대기 중인 상태
+        started = time.monotonic()
+        self.client.close()
+        self.assertLess(time.monotonic() - started, STOP_JOIN_TIMEOUT + 0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+# PPS_Player/tests/test_proof_of_play.py
+# ---------------------------
+# Version History
+# v0.1.0 - 2026.10.18 - 재생 증명 저널 복구/중복 방지 재전송/거부 처리/백오프 검증 (로컬 스텁 서버)
+# ---------------------------
+
+import gzip
+import importlib.util
+import json
+import os
+import tempfile
+import unittest
+
+if not all(importlib.util.find_spec(name) for name in ("PyQt6", "requests")):
+    raise unittest.SkipTest("PyQt6/requests 미설치")
+
+from PPS_Player.bench.bench_utils import StubServer
+from PPS_Player.core.network_client import NetworkClient
+from PPS_Player.core.proof_of_play import (
+    OPEN_SUFFIX, REJECTED_DIR, SEALED_SUFFIX, PlayJournal, ProofOfPlay, RetryableUploadError)
+
+
+class PlayJournalTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_recover_truncates_partial_line_and_seals(self):
+        part = os.path.join(self.tmp.name, "20261018000000000000-abc" + OPEN_SUFFIX)
+        with open(part, "wb") as f:
+            f.write(b'{"t":1}\n{"t":2')
+        journal = PlayJournal(self.tmp.name)
+        segments = journal.sealed_segments()
+        self.assertEqual(len(segments), 1)
+        with open(segments[0], "rb") as f:
+            self.assertEqual(f.read(), b'{"t":1}\n')
+        self.assertFalse(os.path.exists(part))
+
+    def test_recover_removes_empty_segment(self):
+        part = os.path.join(self.tmp.name, "20261018000000000000-abc" + OPEN_SUFFIX)
+        with open(part, "wb") as f:
+            f.write(b'{"t":1')
+        journal = PlayJournal(self.tmp.name)
+        self.assertEqual(journal.sealed_segments(), [])
+
+    def test_segment_sealed_by_event_count(self):
+        journal = PlayJournal(self.tmp.name, segment_events=2)
+        for i in range(5):
+            journal.append({"t": i})
+        journal.seal()
+        self.assertEqual(len(journal.sealed_segments()), 3)
+
+
+class ProofOfPlayUploadTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.server = StubServer().start()
+        self.client = NetworkClient(self.server.url, "store1", timeout=5)
+        self.journal = PlayJournal(self.tmp.name)
+        self.pop = ProofOfPlay(self.journal, self.client, upload_interval=10, max_backoff=80)
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+        self.tmp.cleanup()
+
+    def add_segment(self, *paths):
+        for path in paths:
+            self.journal.append({"p": path})
+        self.journal.seal()
+        return self.journal.sealed_segments()[-1]
+
+    def test_upload_is_gzip_with_segment_id_key(self):
+        segment = self.add_segment("/media/lunch/menu.jpg")
+        self.pop.upload_pending()
+        path, headers, body = self.server.posts[0]
+        self.assertEqual(path, "/pop/store1")
+        self.assertEqual(headers["Content-Encoding"], "gzip")
+        self.assertEqual(headers["Idempotency-Key"], os.path.basename(segment)[:-len(SEALED_SUFFIX)])
+        self.assertEqual(json.loads(gzip.decompress(body))["p"], "/media/lunch/menu.jpg")
+        self.assertEqual(self.journal.sealed_segments(), [])
+
+    def test_resend_uses_same_key_and_409_counts_as_delivered(self):
+        self.add_segment("a.jpg")
+        self.server.post_statuses = [503, 409]
+        with self.assertRaises(RetryableUploadError):
+            self.pop.upload_pending()
+        self.assertEqual(len(self.journal.sealed_segments()), 1)
+        self.pop.upload_pending()
+        keys = [headers["Idempotency-Key"] for _, headers, _ in self.server.posts]
+        self.assertEqual(len(keys), 2)
+        self.assertEqual(keys[0], keys[1])
+        self.assertEqual(self.journal.sealed_segments(), [])
+
+    def test_rejected_segment_does_not_block_later_ones(self):
+        rejected = self.add_segment("bad.jpg")
+        self.add_segment("good.jpg")
+        self.server.post_statuses = [422, 200]
+        self.pop.upload_pending()
+        self.assertEqual(self.journal.sealed_segments(), [])
+        self.assertTrue(os.path.exists(
+            os.path.join(self.tmp.name, REJECTED_DIR, os.path.basename(rejected))))
+
+    def test_backoff_grows_and_is_capped(self):
+        for failures, upper in ((1, 10), (2, 20), (10, 80)):
+            self.pop.failures = failures
+            delay = self.pop.backoff_delay()
+            self.assertGreaterEqual(delay, upper / 2)
+            self.assertLessEqual(delay, upper)
+
+    def test_record_keeps_full_path_and_asset_name(self):
+        self.pop.asset_name = lambda path: "menu.jpg"
+        self.pop.record("blobs/ab/abcdef.jpg", "image", 1, 2, True)
+        event = self.pop._queue.get_nowait()
+        self.assertEqual(event["p"], os.path.abspath("blobs/ab/abcdef.jpg"))
+        self.assertEqual(event["n"], "menu.jpg")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,179 @@
+# PPS_Player/tests/test_scheduler.py
+# ---------------------------
+# Version History
+# v0.1.0 - 2026.10.18 - 주간 타임라인 컴파일/이진 탐색 조회 검증 (주 경계, 우선순위 겹침, 주 전체 구간, 규칙 값 비교)
+# ---------------------------
+
+import copy
+import importlib.util
+import unittest
+from datetime import datetime, timedelta
+
+if not importlib.util.find_spec("PyQt6"):
+    raise unittest.SkipTest("PyQt6 미설치")
+
+from PyQt6.QtCore import QCoreApplication
+
+from PPS_Player.core.scheduler import (
+    DAY_SECONDS, WEEK_SECONDS, ScheduleRule, Scheduler, Segment, Timeline, compile_timeline, parse_rules)
+
+# 2026-10-19 는 월요일
+MONDAY = datetime(2026, 10, 19)
+
+
+def at(day, hour, minute=0):
+    return MONDAY + timedelta(days=day, hours=hour, minutes=minute)
+
+
+def rule(order=0, **raw):
+    return ScheduleRule(raw, order)
+
+
+class CompileTimelineTest(unittest.TestCase):
+    def assert_covers_week(self, segments):
+        self.assertEqual(segments[0].start, 0)
+        self.assertEqual(segments[-1].end, WEEK_SECONDS)
+        for before, after in zip(segments, segments[1:]):
+            self.assertEqual(before.end, after.start)
+            self.assertIsNot(before.rule, after.rule)
+
+    def test_no_rules_is_one_default_segment(self):
+        segments = compile_timeline([])
+        self.assertEqual(segments, [Segment(0, WEEK_SECONDS, None)])
+
+    def test_daily_rule_splits_every_day(self):
+        lunch = rule(name="lunch", start="11:00", end="14:00")
+        segments = compile_timeline([lunch])
+        self.assert_covers_week(segments)
+        self.assertEqual(sum(1 for segment in segments if segment.rule is lunch), 7)
+
+    def test_overnight_rule_wraps_week_boundary(self):
+        night = rule(name="night", days=["sun"], start="22:00", end="02:00")
+        segments = compile_timeline([night])
+        self.assert_covers_week(segments)
+        # 일요일 22:00 ~ 주 끝, 주 시작 ~ 월요일 02:00
+        self.assertEqual(segments[0], Segment(0, 2 * 3600, night))
+        self.assertEqual(segments[-1], Segment(6 * DAY_SECONDS + 22 * 3600, WEEK_SECONDS, night))
+
+    def test_higher_priority_wins_overlap(self):
+        day = rule(0, name="day", start="09:00", end="18:00", priority=1)
+        promo = rule(1, name="promo", start="12:00", end="13:00")
+        timeline = Timeline([day, promo])
+        self.assertIs(timeline.lookup(at(0, 12, 30))[0].rule, day)
+
+        promo = rule(1, name="promo", start="12:00", end="13:00", priority=2)
+        timeline = Timeline([day, promo])
+        self.assertIs(timeline.lookup(at(0, 12, 30))[0].rule, promo)
+        self.assertIs(timeline.lookup(at(0, 13, 0))[0].rule, day)
+
+    def test_equal_priority_later_rule_wins(self):
+        first = rule(0, name="first", start="09:00", end="18:00")
+        second = rule(1, name="second", start="12:00", end="13:00")
+        timeline = Timeline([first, second])
+        self.assertIs(timeline.lookup(at(0, 12, 30))[0].rule, second)
+        self.assertIs(timeline.lookup(at(0, 11, 59))[0].rule, first)
+
+
+class TimelineLookupTest(unittest.TestCase):
+    def test_lookup_default_and_rule(self):
+        lunch = rule(name="lunch", days=["wed"], start="11:00", end="14:00")
+        timeline = Timeline([lunch])
+
+        current, following, remaining = timeline.lookup(at(2, 10, 0))
+        self.assertIsNone(current.rule)
+        self.assertIs(following.rule, lunch)
+        self.assertEqual(remaining, 3600)
+
+        current, following, remaining = timeline.lookup(at(2, 11, 0))
+        self.assertIs(current.rule, lunch)
+        self.assertIsNone(following.rule)
+        self.assertEqual(remaining, 3 * 3600)
+
+    def test_lookup_across_week_boundary_skips_same_rule(self):
+        night = rule(name="night", days=["sun"], start="22:00", end="02:00")
+        timeline = Timeline([night])
+        # 일요일 23:00 → 주 끝 구간과 월요일 구간이 같은 규칙이므로 월요일 02:00 까지 남음
+        current, following, remaining = timeline.lookup(at(6, 23, 0))
+        self.assertIs(current.rule, night)
+        self.assertIsNone(following.rule)
+        self.assertEqual(remaining, 3 * 3600)
+
+        current, _, remaining = timeline.lookup(at(0, 1, 0))
+        self.assertIs(current.rule, night)
+        self.assertEqual(remaining, 3600)
+
+    def test_default_segment_wraps_to_next_week(self):
+        monday = rule(name="monday", days=["mon"], start="09:00", end="10:00")
+        timeline = Timeline([monday])
+        # 월요일 10:00 이후의 기본 편성은 주를 넘어 다음 월요일 09:00 까지
+        current, following, remaining = timeline.lookup(at(6, 12, 0))
+        self.assertIsNone(current.rule)
+        self.assertIs(following.rule, monday)
+        self.assertEqual(remaining, 12 * 3600 + 9 * 3600)
+
+    def test_whole_week_rule_has_no_following(self):
+        always = rule(name="always")
+        timeline = Timeline([always])
+        self.assertEqual(len(timeline.segments), 1)
+        self.assertEqual(timeline.lookup(at(3, 15, 0)), (Segment(0, WEEK_SECONDS, always), None, None))
+
+    def test_no_rules_has_no_following(self):
+        current, following, remaining = Timeline([]).lookup(at(4, 8, 0))
+        self.assertIsNone(current.rule)
+        self.assertIsNone(following)
+        self.assertIsNone(remaining)
+
+
+class ScheduleRuleTest(unittest.TestCase):
+    def test_rules_compare_by_value(self):
+        raw = {"name": "lunch", "days": ["mon"], "start": "11:00", "end": "14:00", "media_paths": ["a.png"]}
+        self.assertEqual(ScheduleRule(raw, 0), ScheduleRule(copy.deepcopy(raw), 0))
+        self.assertNotEqual(ScheduleRule(raw, 0), ScheduleRule(raw, 1))
+        changed = dict(raw, media_paths=["b.png"])
+        self.assertNotEqual(ScheduleRule(raw, 0), ScheduleRule(changed, 0))
+
+    def test_recompiled_segments_compare_by_value(self):
+        raw = [{"name": "lunch", "start": "11:00", "end": "14:00"}]
+        first = Timeline(parse_rules(raw)).lookup(at(0, 12, 0))[0]
+        second = Timeline(parse_rules(copy.deepcopy(raw))).lookup(at(0, 12, 0))[0]
+        self.assertIsNot(first.rule, second.rule)
+        self.assertEqual(first, second)
+
+    def test_invalid_rules_skipped(self):
+        rules = parse_rules([
+            {"name": "ok", "start": "08:00", "end": "09:00"},
+            {"name": "bad time", "start": "25:00"},
+            {"name": "bad day", "days": ["xyz"]},
+            {"name": "bool interval", "interval": True},
+            "not a dict",
+        ])
+        self.assertEqual([r.name for r in rules], ["ok"])
+
+    def test_parse_time_accepts_end_of_day(self):
+        self.assertEqual(rule(start="00:00", end="24:00").end, DAY_SECONDS)
+        with self.assertRaises(ValueError):
+            rule(start="10:60")
+
+
+class SchedulerTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QCoreApplication.instance() or QCoreApplication([])
+
+    def test_same_rules_reloaded_do_not_switch(self):
+        raw = [{"name": "always", "media_paths": ["a.png"]}]
+        scheduler = Scheduler(raw)
+        changed = []
+        scheduler.segment_changed.connect(changed.append)
+        scheduler.start()
+        scheduler.set_rules(copy.deepcopy(raw))
+        self.assertEqual(len(changed), 1)
+
+        scheduler.set_rules([{"name": "always", "media_paths": ["b.png"]}])
+        self.assertEqual(len(changed), 2)
+        self.assertEqual(changed[-1].rule.media_paths, ["b.png"])
+        scheduler.stop()
+
+
+if __name__ == "__main__":
+    unittest.main()
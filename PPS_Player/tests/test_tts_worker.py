@@ -0,0 +1,167 @@
+# PPS_Player/tests/test_tts_worker.py
+# ---------------------------
+# Version History
+# v0.1.0 - 2026.10.18 - TTS 대기열 우선순위/중복 제거/넘침(drop, merge)/길이 제한 검증 (pyttsx3 없이 가짜 엔진 사용)
+# ---------------------------
+
+import importlib.util
+import threading
+import time
+import unittest
+
+if not importlib.util.find_spec("PyQt6"):
+    raise unittest.SkipTest("PyQt6 미설치")
+
+from PyQt6.QtCore import QCoreApplication
+
+from PPS_Player.core.tts_worker import (
+    OVERFLOW_DROP, OVERFLOW_MERGE, PRIORITY_HIGH, PRIORITY_LOW, PRIORITY_NORMAL, TTSWorker)
+
+
+class RecordingEngine:
+    """발화한 문장을 기록만 하는 pyttsx3 대체."""
+
+    def __init__(self):
+        self.spoken = []
+        self.stopped = False
+        self._pending = []
+
+    def getProperty(self, name):
+        return {"voice": "fake", "rate": 200, "volume": 1.0}.get(name)
+
+    def say(self, text):
+        self._pending.append(text)
+
+    def runAndWait(self):
+        self.spoken.extend(self._pending)
+        self._pending = []
+
+    def stop(self):
+        self.stopped = True
+
+
+def drain(worker):
+    """스레드를 띄우지 않고 대기열을 발화 순서대로 꺼냄."""
+    texts = []
+    while worker.pending_count():
+        texts.append(worker._take()[1])
+    return texts
+
+
+class TTSQueueTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QCoreApplication.instance() or QCoreApplication([])
+
+    def make_worker(self, **kwargs):
+        worker = TTSWorker(**kwargs)
+        self.dropped = []
+        worker.speech_dropped.connect(self.dropped.append)
+        return worker
+
+    def test_higher_priority_first_then_fifo(self):
+        worker = self.make_worker()
+        worker.enqueue("low", PRIORITY_LOW)
+        worker.enqueue("normal 1", PRIORITY_NORMAL)
+        worker.enqueue("high", PRIORITY_HIGH)
+        worker.enqueue("normal 2", PRIORITY_NORMAL)
+        self.assertEqual(drain(worker), ["high", "normal 1", "normal 2", "low"])
+
+    def test_blank_text_ignored(self):
+        worker = self.make_worker()
+        self.assertFalse(worker.enqueue("   "))
+        self.assertEqual(worker.pending_count(), 0)
+
+    def test_duplicate_not_queued_twice(self):
+        worker = self.make_worker()
+        self.assertTrue(worker.enqueue("안내 방송"))
+        self.assertTrue(worker.enqueue("  안내 방송 "))
+        self.assertEqual(worker.pending_count(), 1)
+
+    def test_duplicate_raises_priority(self):
+        worker = self.make_worker()
+        worker.enqueue("first", PRIORITY_NORMAL)
+        worker.enqueue("repeat", PRIORITY_LOW)
+        worker.enqueue("repeat", PRIORITY_HIGH)
+        self.assertEqual(drain(worker), ["repeat", "first"])
+
+    def test_queue_depth_bounded_drop_new(self):
+        worker = self.make_worker(max_queue=2, overflow=OVERFLOW_DROP)
+        worker.enqueue("a")
+        worker.enqueue("b")
+        self.assertFalse(worker.enqueue("c"))
+        self.assertEqual(worker.pending_count(), 2)
+        self.assertEqual(self.dropped, ["c"])
+        self.assertEqual(drain(worker), ["a", "b"])
+
+    def test_full_queue_makes_room_for_higher_priority(self):
+        worker = self.make_worker(max_queue=2, overflow=OVERFLOW_DROP)
+        worker.enqueue("a", PRIORITY_NORMAL)
+        worker.enqueue("b", PRIORITY_NORMAL)
+        self.assertTrue(worker.enqueue("urgent", PRIORITY_HIGH))
+        # 우선순위가 낮은 항목 중 가장 최근 것을 밀어냄
+        self.assertEqual(self.dropped, ["b"])
+        self.assertEqual(drain(worker), ["urgent", "a"])
+
+    def test_merge_appends_to_last_same_priority(self):
+        worker = self.make_worker(max_queue=2, overflow=OVERFLOW_MERGE)
+        worker.enqueue("a", PRIORITY_NORMAL)
+        worker.enqueue("b", PRIORITY_NORMAL)
+        self.assertTrue(worker.enqueue("c", PRIORITY_NORMAL))
+        self.assertEqual(self.dropped, [])
+        self.assertEqual(drain(worker), ["a", "b c"])
+
+    def test_merge_without_same_priority_falls_back_to_drop(self):
+        worker = self.make_worker(max_queue=1, overflow=OVERFLOW_MERGE)
+        worker.enqueue("a", PRIORITY_HIGH)
+        self.assertFalse(worker.enqueue("b", PRIORITY_LOW))
+        self.assertEqual(self.dropped, ["b"])
+        self.assertEqual(drain(worker), ["a"])
+
+
+class TTSWorkerThreadTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QCoreApplication.instance() or QCoreApplication([])
+
+    def test_speaks_in_priority_order_and_stops(self):
+        engine = RecordingEngine()
+        worker = TTSWorker()
+        worker.create_engine = lambda: engine
+        # 스레드 시작 전에 쌓아 두어야 순서가 결정적
+        worker.enqueue("normal", PRIORITY_NORMAL)
+        worker.enqueue("high", PRIORITY_HIGH)
+        worker.start()
+        deadline = time.monotonic() + 5
+        while len(engine.spoken) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(engine.spoken, ["high", "normal"])
+        self.assertTrue(worker.stop())
+        self.assertTrue(engine.stopped)
+        self.assertTrue(worker.isFinished())
+
+    def test_stop_interrupts_speech_and_clears_queue(self):
+        worker = TTSWorker()
+        started = threading.Event()
+        release = threading.Event()
+        engine = RecordingEngine()
+
+        def blocking_run_and_wait():
+            started.set()
+            release.wait(5)
+
+        engine.runAndWait = blocking_run_and_wait
+        engine.stop = release.set  # engine.stop() 이 발화를 끊는 것을 흉내
+        worker.create_engine = lambda: engine
+        worker.start()
+        worker.enqueue("long")
+        self.assertTrue(started.wait(5))
+        worker.enqueue("pending")
+        begin = time.monotonic()
+        self.assertTrue(worker.stop())
+        self.assertLess(time.monotonic() - begin, worker.STOP_TIMEOUT_MS / 1000)
+        self.assertEqual(worker.pending_count(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,160 @@
+# PPS_Player/ui/refresh_scheduler.py
+# ---------------------------
+# Version History
+# v0.1.0 - 2026.10.18 - 대시보드 갱신 스케줄러 (진행 중 갱신 건너뜀, 로딩/숨김 시 일시정지, 소요 시간 기반 간격 조정, 서버 명령 즉시 갱신)
+# ---------------------------
+
+import logging
+import time
+
+from PyQt6.QtCore import QEvent, QObject, QTimer
+
+from PPS_Player.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# dashboard_update() 가 Promise 를 돌려주면 끝날 때까지 기다렸다가 완료 메시지를 남김
+REFRESH_JS = '''
+(function(seq) {
+  function done(result) { console.log("PPS_REFRESH_DONE:" + seq + ":" + result); }
+  if (typeof dashboard_update !== "function") { done("missing"); return; }
+  try {
+    Promise.resolve(dashboard_update()).then(function() { done("ok"); },
+                                             function() { done("error"); });
+  } catch (e) {
+    done("error");
+  }
+})(%d);
+'''
+
+MODE_POLL = "poll"  # 간격 갱신 + 서버 명령 시 즉시 갱신
+MODE_PUSH = "push"  # 서버 명령 시에만 갱신
+
+
+class RefreshScheduler(QObject):
+    """WebViewHost 의 현재 페이지에서 dashboard_update() 를 호출하는 스케줄러.
+
+    - 이전 호출의 완료 메시지(PPS_REFRESH_DONE)를 받기 전에는 새로 호출하지 않음
+    - 페이지 로딩 중이거나 창이 숨겨짐/최소화 상태면 호출을 미루고, 풀리면 바로 한 번 실행
+    - 다음 간격 = max(기본 간격, 최근 소요 시간 평균 × slow_factor), 상한 max_interval
+    - request_now(): 서버 명령 등으로 즉시 갱신 (진행 중이면 끝난 뒤 한 번만 실행)
+    """
+
+    def __init__(self, web_host, window, interval=10000, mode=MODE_POLL, slow_factor=4.0,
+                 max_interval=120000, timeout=60000, parent=None):
+        super().__init__(parent)
+        self.web_host = web_host
+        self.window = window
+        self.interval = interval
+        self.mode = mode
+        self.slow_factor = slow_factor
+        self.max_interval = max_interval
+        self.timeout = timeout
+        self.seq = 0
+        self.pending_since = None
+        self.due = False
+        self.avg_ms = None
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.on_tick)
+        self.timeout_timer = QTimer(self)
+        self.timeout_timer.setSingleShot(True)
+        self.timeout_timer.timeout.connect(self.on_timeout)
+
+        web_host.refresh_done.connect(self.on_done)
+        web_host.loading_changed.connect(self.on_loading_changed)
+        web_host.view_changed.connect(lambda _: self.clear_pending())
+        window.installEventFilter(self)
+
+    def start(self):
+        self.schedule()
+
+    def stop(self):
+        self.timer.stop()
+        self.timeout_timer.stop()
+
+    def set_interval(self, ms):
+        self.interval = ms
+        self.schedule()
+
+    def set_mode(self, mode):
+        self.mode = mode
+        self.schedule()
+
+    def next_interval(self):
+        if self.avg_ms is None:
+            return self.interval
+        return int(min(max(self.interval, self.avg_ms * self.slow_factor), self.max_interval))
+
+    def schedule(self):
+        if self.mode == MODE_PUSH:
+            self.timer.stop()
+        else:
+            self.timer.start(self.next_interval())
+
+    def paused(self):
+        return (self.web_host.loading or not self.window.isVisible()
+                or self.window.isMinimized())
+
+    def on_tick(self):
+        self.due = True
+        self.try_refresh()
+        self.schedule()
+
+    def request_now(self):
+        self.due = True
+        self.try_refresh()
+
+    def try_refresh(self):
+        if not self.due:
+            return
+        if self.pending_since is not None:
+            metrics.inc("dashboard_refresh_skipped")
+            return
+        if self.paused():
+            metrics.inc("dashboard_refresh_paused")
+            return
+        self.due = False
+        self.seq += 1
+        self.pending_since = time.perf_counter()
+        self.timeout_timer.start(self.timeout)
+        self.web_host.run_javascript(REFRESH_JS % self.seq)
+
+    def on_done(self, seq, result):
+        if seq != self.seq or self.pending_since is None:
+            return
+        elapsed_ms = (time.perf_counter() - self.pending_since) * 1000
+        self.clear_pending()
+        if result == "missing":
+            return
+        # 지수 이동 평균으로 일시적인 지연에 과민 반응하지 않음
+        self.avg_ms = elapsed_ms if self.avg_ms is None else self.avg_ms * 0.7 + elapsed_ms * 0.3
+        metrics.observe("dashboard_update_ms", elapsed_ms)
+        if result == "error":
+            metrics.inc("dashboard_update_errors")
+        # 진행 중에 밀린 요청(서버 명령 등)은 끝난 직후 실행
+        self.try_refresh()
+
+    def on_timeout(self):
+        logger.warning("dashboard_update() 응답 없음 (%dms), 다음 갱신 허용", self.timeout)
+        metrics.inc("dashboard_update_timeouts")
+        self.clear_pending()
+        self.try_refresh()
+
+    def clear_pending(self):
+        self.pending_since = None
+        self.timeout_timer.stop()
+
+    def on_loading_changed(self, loading):
+        if loading:
+            # 새 문서가 로딩되면 이전 Promise 완료 메시지는 오지 않음
+            self.clear_pending()
+        else:
+            self.try_refresh()
+
+    def eventFilter(self, obj, event):
+        if event.type() in (QEvent.Type.Show, QEvent.Type.WindowStateChange):
+            # 이벤트 처리 후 상태가 반영되도록 다음 루프에서 확인
+            QTimer.singleShot(0, self.try_refresh)
+        return False
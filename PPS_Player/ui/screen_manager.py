@@ -0,0 +1,88 @@
+# PPS_Player/ui/screen_manager.py
+# ---------------------------
+# Version History
+# v0.1.0 - 2026.10.18 - 이벤트 기반 모니터/커서 감시 (100ms/1s 폴링 타이머 대체)
+# ---------------------------
+
+import logging
+import time
+
+from PyQt6.QtCore import QEvent, QObject, QTimer, pyqtSignal
+from PyQt6.QtGui import QGuiApplication
+
+logger = logging.getLogger(__name__)
+
+
+class ScreenManager(QObject):
+    """모니터 연결 변화와 전체화면 상단 커서 진입을 이벤트로만 감지.
+
+    - 모니터: QGuiApplication.screenAdded/screenRemoved/primaryScreenChanged
+    - 커서: 전체화면일 때만 최상위 QWindow 에 이벤트 필터를 걸어 MouseMove/Leave 확인
+    상태가 실제로 바뀔 때만 시그널을 보내므로 대기 중에는 깨어나는 일이 없다.
+    """
+    screens_changed = pyqtSignal(int)      # 현재 모니터 수
+    cursor_zone_changed = pyqtSignal(bool)  # True: 커서가 상단 영역(hot_zone) 안
+
+    def __init__(self, window, hot_zone=60, instrument=False, parent=None):
+        super().__init__(parent)
+        self.window = window
+        self.hot_zone = hot_zone
+        self.in_zone = False
+        self.watched = None
+
+        app = QGuiApplication.instance()
+        app.screenAdded.connect(self.on_screens_changed)
+        app.screenRemoved.connect(self.on_screens_changed)
+        app.primaryScreenChanged.connect(self.on_screens_changed)
+
+        # 계측 모드: 핸들러 호출(=깨어난 횟수)과 실제 상태 전환 횟수
+        self.instrument = instrument
+        self.counters = {"wakeups": 0, "transitions": 0, "screen_events": 0}
+        self.started = time.monotonic()
+        self.report_timer = None
+        if instrument:
+            self.report_timer = QTimer(self)
+            self.report_timer.timeout.connect(self.report)
+            self.report_timer.start(60000)
+
+    def stats(self):
+        elapsed = max(time.monotonic() - self.started, 1e-6)
+        stats = dict(self.counters)
+        stats["wakeups_per_sec"] = self.counters["wakeups"] / elapsed
+        return stats
+
+    def report(self):
+        logger.info("ScreenManager 계측: %s", self.stats())
+
+    def on_screens_changed(self, *args):
+        self.counters["screen_events"] += 1
+        self.counters["wakeups"] += 1
+        self.screens_changed.emit(len(QGuiApplication.screens()))
+
+    def watch_cursor(self, enabled):
+        handle = self.window.windowHandle() if enabled else None
+        if handle is self.watched:
+            return
+        if self.watched is not None:
+            self.watched.removeEventFilter(self)
+        self.watched = handle
+        if handle is not None:
+            handle.installEventFilter(self)
+        self.set_in_zone(False)
+
+    def eventFilter(self, obj, event):
+        event_type = event.type()
+        if event_type == QEvent.Type.MouseMove:
+            if self.instrument:
+                self.counters["wakeups"] += 1
+            self.set_in_zone(event.position().y() < self.hot_zone)
+        elif event_type == QEvent.Type.Leave:
+            self.set_in_zone(False)
+        return False
+
+    def set_in_zone(self, in_zone):
+        if in_zone == self.in_zone:
+            return
+        self.in_zone = in_zone
+        self.counters["transitions"] += 1
+        self.cursor_zone_changed.emit(in_zone)
@@ -2,34 +2,189 @@
 # ---------------------------
 # Version History
 # v0.3.5 - 2025.05.15 - PyQt6 전환 후 consoleMessage 대응 (QWebEnginePage 서브클래스)
+# v0.4.0 - 2026.10.18 - 하단 미디어 이미지 프리페치/캐시 설정 연결
+# v0.4.1 - 2026.10.18 - 비디오 이중 버퍼(video_double_buffer) 설정 연결
+# v0.5.0 - 2026.10.18 - TTS 를 전용 워커 스레드 대기열로 이동 (runAndWait 로 인한 UI 멈춤 제거)
+# v0.5.1 - 2026.10.18 - 합성 음성 캐시 + VoiceManager 재생, 시작 시 사전 렌더링(tts_warmup_phrases)
+# v0.6.0 - 2026.10.18 - 서버 명령 폴링(NetworkClient) 연결 및 명령 처리
+# v0.6.1 - 2026.10.18 - 서버 매니페스트 기반 미디어 동기화(MediaSync) 연결
+# v0.7.0 - 2026.10.18 - 마우스/모니터 폴링 타이머 제거, ScreenManager 이벤트 기반 처리로 전환
+# v0.8.0 - 2026.10.18 - ConfigManager 변경 시그널 구독, 재시작 없이 바뀐 설정만 반영
+# v0.9.0 - 2026.10.18 - 단계별 시작: 웹뷰 먼저 표시, TTS/멀티미디어/네트워크는 첫 페인트 이후 초기화
+# v0.9.1 - 2026.10.18 - 애니메이션 GIF 반복 횟수/프레임 캐시 설정 연결
+# v0.10.0 - 2026.10.18 - 런타임 계측(MetricsService) 시작/종료
+# v0.10.1 - 2026.10.18 - print 진단 출력을 logging 으로 전환
+# v0.11.0 - 2026.10.18 - 웹뷰를 WebViewHost 로 교체 (전용 프로필 캐시 상한, 렌더러 메모리 점검/재활용, TTS 패치 1회 설치)
+# v0.12.0 - 2026.10.18 - 고정 간격 web_refresh_timer 를 RefreshScheduler 로 교체, refresh 명령은 즉시 갱신
+# v0.13.0 - 2026.10.18 - 배경 음악(MusicPlayer) 연결, TTS/음성 재생 중 음량 낮춤
+# v0.14.0 - 2026.10.18 - media_paths 를 MediaLibrary(디렉토리/glob, 인덱스, 변경 감시)로 해석해 MediaViewer 에 전달
+# v0.15.0 - 2026.10.18 - 재생 증명(ProofOfPlay) 기록/업로드 연결
+# v0.16.0 - 2026.10.18 - 시간대/요일별 편성(Scheduler): 구간별 url/media_paths/interval 적용, 다음 구간 사전 준비, schedule 명령
+# v0.16.1 - 2026.10.18 - 설정에서 server_url/store_id 를 비우면 폴링 중지, 다시 넣으면 재개
+# v0.16.2 - 2026.10.18 - 재생 증명에 미디어 동기화 매니페스트 이름 전달
+# v0.16.3 - 2026.10.18 - 편성 전환 시 간격이 바뀐 경우에만 set_interval, 편성 규칙 소스를 미디어 인덱스에 유지
 # ---------------------------
 
-from PyQt6.QtCore import Qt, QTimer, QUrl
-from PyQt6.QtWebEngineWidgets import QWebEngineView
-from PyQt6.QtWebEngineCore import QWebEnginePage
-from PyQt6.QtWebEngineCore import QWebEngineScript
+import logging
+
+from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QPushButton, QApplication, QHBoxLayout, QMessageBox
-from PPS_Player.core.media_viewer import MediaViewer
-import pyttsx3
-
-class CustomWebPage(QWebEnginePage):
-    def javaScriptConsoleMessage(self, level, msg, line, sourceID):
-        if msg.startswith("TTS:"):
-            text = msg[4:].strip()
-            print(f"🔊 TTS 감지: {text}")
-            if self.parent() and hasattr(self.parent(), "tts_engine"):
-                self.parent().tts_engine.say(text)
-                self.parent().tts_engine.runAndWait()
+from PPS_Player.core.scheduler import Scheduler
+from PPS_Player.core.tts_worker import TTSWorker, PRIORITY_HIGH, PRIORITY_NORMAL
+from PPS_Player.ui.refresh_scheduler import RefreshScheduler
+from PPS_Player.ui.screen_manager import ScreenManager
+from PPS_Player.ui.web_view_host import WebViewHost
+from PPS_Player.utils.startup_profiler import StartupProfiler
+from PPS_Player.utils.utils import resolve_path
+# MediaViewer/VoiceManager(QtMultimedia), NetworkClient(requests) 등은 init_deferred() 에서 import
+
+logger = logging.getLogger(__name__)
 
 class MainWindow(QWidget):
-    def __init__(self, config):
+    def __init__(self, config, profiler=None):
         super().__init__()
         self.config = config
+        self.profiler = profiler or StartupProfiler()
         self.is_fullscreen = False
         self.current_screen_index = 0
-        self.tts_engine = pyttsx3.init()
+        self.deferred_started = False
+        self.bottom_viewer = None
+        self.network_client = None
+        self.media_sync = None
+        self.media_library = None
+        self.proof_of_play = None
+        self.metrics_service = None
+        self.voice_manager = None
+        self.music_player = None
+
+        # 워커 객체만 만들어 두고 스레드(pyttsx3 초기화 포함)는 첫 페인트 이후 시작.
+        # 그 전에 들어온 발화 요청은 대기열에 쌓여 있다가 처리됨
+        self.tts_worker = TTSWorker(
+            max_queue=self.config.get("tts_queue_size"),
+            overflow=self.config.get("tts_overflow"),
+        )
+        # 편성은 웹뷰 첫 URL 을 정해야 하므로 UI 보다 먼저 (타이머는 init_deferred 에서 시작)
+        self.scheduler = Scheduler(
+            self.config.get("schedule"),
+            prefetch_lead=self.config.get("schedule_prefetch_s"),
+            parent=self,
+        )
+        self.segment = self.scheduler.current_segment()
         self.init_ui()
 
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self.deferred_started:
+            self.deferred_started = True
+            self.profiler.mark("first_paint")
+            QTimer.singleShot(0, self.init_deferred)
+
+    @property
+    def center_view(self):
+        return self.web_host.view
+
+    def init_deferred(self):
+        """첫 화면이 그려진 뒤에 무거운 하위 시스템 초기화."""
+        self.init_metrics()
+        self.init_media()
+        self.profiler.mark("media_viewer")
+        self.init_tts()
+        self.profiler.mark("tts")
+        self.init_music()
+        self.profiler.mark("music")
+        self.init_network()
+        self.profiler.mark("network")
+        self.init_proof_of_play()
+        self.init_schedule()
+        self.bind_config()
+        self.profiler.report()
+
+    def init_metrics(self):
+        if not self.config.get("metrics_enabled"):
+            return
+        from PPS_Player.core.metrics import MetricsService
+
+        self.metrics_service = MetricsService(
+            port=self.config.get("metrics_port"),
+            dump_interval=self.config.get("metrics_dump_interval"),
+            heartbeat_ms=self.config.get("metrics_heartbeat_ms"),
+            page_provider=lambda: self.center_view.page(),
+            parent=self,
+        )
+        self.metrics_service.start()
+
+    def init_tts(self):
+        from PPS_Player.core.tts_cache import TTSCache
+        from PPS_Player.core.voice_manager import VoiceManager
+
+        if self.config.get("tts_cache_enabled"):
+            self.tts_worker.cache = TTSCache(resolve_path(self.config.get("tts_cache_dir")),
+                                             max_bytes=self.config.get("tts_cache_mb") * 1024 * 1024)
+        self.voice_manager = VoiceManager(parent=self)
+        self.tts_worker.play_requested.connect(self.voice_manager.play_voice)
+        self.voice_manager.finished.connect(self.tts_worker.notify_playback_finished)
+        self.tts_worker.speech_started.connect(lambda text: logger.info("🔊 TTS 시작: %s", text))
+        self.tts_worker.speech_finished.connect(lambda text: logger.info("🔇 TTS 종료: %s", text))
+        self.tts_worker.warm_up(self.config.get("tts_warmup_phrases"))
+        self.tts_worker.start()
+
+    def init_music(self):
+        from PPS_Player.core.music_player import MusicPlayer
+
+        self.music_player = MusicPlayer(
+            self.music_paths(self.config.get("music_paths")),
+            mode=self.config.get("music_mode"),
+            crossfade_ms=self.config.get("music_crossfade_ms"),
+            volume=self.config.get("music_volume"),
+            duck_volume=self.config.get("music_duck_volume"),
+            parent=self,
+        )
+        # 발화(합성 + 캐시 재생) 및 VoiceManager 재생 동안 배경 음악 음량 낮춤
+        self.tts_worker.speech_started.connect(lambda _: self.music_player.duck("tts", True))
+        self.tts_worker.speech_finished.connect(lambda _: self.music_player.duck("tts", False))
+        self.voice_manager.started.connect(lambda: self.music_player.duck("voice", True))
+        self.voice_manager.finished.connect(lambda: self.music_player.duck("voice", False))
+        self.music_player.start()
+
+    @staticmethod
+    def music_paths(paths):
+        return [resolve_path(path) for path in paths]
+
+    def on_music_paths_changed(self, paths):
+        self.music_player.set_playlist(self.music_paths(paths))
+        self.music_player.start()
+
+    def init_media(self):
+        from PPS_Player.core.media_library import MediaLibrary
+        from PPS_Player.core.media_viewer import MediaViewer
+
+        # 마지막 스캔 결과로 바로 시작하고, 변경분 확인은 백그라운드에서
+        self.media_library = MediaLibrary(
+            self.segment_media_paths(self.segment),
+            resolve_path(self.config.get("media_index_path")),
+            watch=self.config.get("media_watch"),
+            parent=self,
+        )
+        self.bottom_viewer = MediaViewer(
+            self.media_library.cached_playlist(),
+            interval=self.segment_interval(self.segment),
+            rolling=self.config.get("media_rolling"),
+            prefetch_count=self.config.get("image_prefetch_count"),
+            cache_mb=self.config.get("image_cache_mb"),
+            double_buffer=self.config.get("video_double_buffer"),
+            gif_loops=self.config.get("gif_loops"),
+            gif_cache_mb=self.config.get("gif_cache_mb"),
+        )
+        self.bottom_viewer.setFixedHeight(self.config.get("bottom_height"))
+        self.bottom_viewer.set_fullscreen(self.is_fullscreen)
+        self.main_layout.replaceWidget(self.bottom_placeholder, self.bottom_viewer)
+        self.bottom_placeholder.deleteLater()
+        self.bottom_placeholder = None
+        self.media_library.playlist_changed.connect(self.on_library_playlist)
+        self.media_library.playlist_prepared.connect(self.bottom_viewer.warm_up)
+        self.update_retained_sources()
+        self.media_library.start()
+
     def init_ui(self):
         self.resize(1024, 768)
         self.setWindowTitle("PPS 플레이어")
@@ -38,27 +193,33 @@ class MainWindow(QWidget):
         self.main_layout.setContentsMargins(0, 0, 0, 0)
         self.main_layout.setSpacing(0)
 
-        self.center_view = QWebEngineView()
-        self.center_page = CustomWebPage(self.center_view)
-        self.center_view.setPage(self.center_page)
-        self.preload_tts_patch()
-
-        url = self.config.get("url", "https://www.example.com")
-        self.center_view.load(QUrl(url))
-
-        refresh_interval = max(self.config.get("web_refresh_interval", 10000), 5000)
-        self.web_refresh_timer = QTimer()
-        self.web_refresh_timer.timeout.connect(
-            lambda: self.center_view.page().runJavaScript("if (typeof dashboard_update === 'function') dashboard_update();")
+        # 대시보드 웹뷰 (전용 프로필 + 렌더러 재활용). 현재 보이는 뷰는 center_view
+        self.web_host = WebViewHost(
+            self.segment_url(self.segment),
+            resolve_path(self.config.get("web_cache_dir")),
+            cache_mb=self.config.get("web_cache_mb"),
+            cache_mode=self.config.get("web_cache_mode"),
+            check_interval=self.config.get("web_memory_check_interval"),
+            renderer_max_mb=self.config.get("web_renderer_max_mb"),
+            recycle_hours=self.config.get("web_recycle_hours"),
+            mode=self.config.get("web_recycle_mode"),
         )
-        self.web_refresh_timer.start(refresh_interval)
+        self.web_host.tts_requested.connect(self.tts_worker.enqueue)
 
-        media_paths = self.config.get("media_paths", [])
-        media_rolling = self.config.get("media_rolling", True)
-        bottom_height = self.config.get("bottom_height", 300)
+        # dashboard_update() 호출: 진행 중/로딩 중/창 숨김 시 건너뜀, 느리면 간격 자동 확대
+        self.refresh_scheduler = RefreshScheduler(
+            self.web_host,
+            self,
+            interval=self.refresh_interval(self.config.get("web_refresh_interval")),
+            mode=self.config.get("web_refresh_mode"),
+            parent=self,
+        )
+        self.refresh_scheduler.start()
 
-        self.bottom_viewer = MediaViewer(media_paths, rolling=media_rolling)
-        self.bottom_viewer.setFixedHeight(bottom_height)
+        # 하단 미디어 영역은 첫 페인트 이후 MediaViewer 로 교체
+        self.bottom_placeholder = QWidget()
+        self.bottom_placeholder.setStyleSheet("background-color: black;")
+        self.bottom_placeholder.setFixedHeight(self.config.get("bottom_height"))
 
         self.test_button = QPushButton("🔊 테스트 음성 출력", self)
         self.test_button.setFixedSize(160, 30)
@@ -80,49 +241,15 @@ class MainWindow(QWidget):
         self.button_layout.addWidget(self.exit_fullscreen_button)
 
         self.main_layout.addLayout(self.button_layout)
-        self.main_layout.addWidget(self.center_view)
-        self.main_layout.addWidget(self.bottom_viewer)
+        self.main_layout.addWidget(self.web_host)
+        self.main_layout.addWidget(self.bottom_placeholder)
         self.setLayout(self.main_layout)
 
-        self.mouse_timer = QTimer()
-        self.mouse_timer.timeout.connect(self.check_mouse_position)
-        self.mouse_timer.start(100)
-
-        self.monitor_timer = QTimer()
-        self.monitor_timer.timeout.connect(self.check_monitor_change)
-        self.monitor_timer.start(1000)
-
-    def preload_tts_patch(self):
-        patch_js = '''
-        (function() {
-          function patchTTS() {
-            if (typeof window.speechSynthesis === "undefined") {
-              window.speechSynthesis = {
-                speak: function(u) {
-                  if (u && u.text) console.log("TTS:" + u.text);
-                }
-              };
-            }
-            if (typeof SpeechSynthesisUtterance === "undefined") {
-              window.SpeechSynthesisUtterance = function(text) {
-                console.log("TTS:" + text);
-                return { text: text };
-              };
-            }
-            console.log("✅ speech patch injected");
-          }
-          patchTTS();
-          const observer = new MutationObserver(() => patchTTS());
-          observer.observe(document.body, { childList: true, subtree: true });
-        })();
-        '''
-        script = QWebEngineScript()
-        script.setName("TTSInject")
-        script.setInjectionPoint(QWebEngineScript.InjectionPoint.DocumentReady)
-        script.setRunsOnSubFrames(True)
-        script.setWorldId(QWebEngineScript.ScriptWorldId.MainWorld)
-        script.setSourceCode(patch_js)
-        self.center_view.page().profile().scripts().insert(script)
+        # 타이머 폴링 대신 모니터 연결/커서 이동 이벤트로만 동작
+        self.screen_manager = ScreenManager(self, instrument=self.config.get("instrumentation"), parent=self)
+        self.screen_manager.screens_changed.connect(self.check_monitor_change)
+        self.screen_manager.cursor_zone_changed.connect(self.check_mouse_position)
+        QTimer.singleShot(0, self.check_monitor_change)
 
     def test_tts_console_injection(self):
         try:
@@ -138,8 +265,232 @@ class MainWindow(QWidget):
         except Exception as e:
             QMessageBox.warning(self, "TTS 테스트 실패", f"자바스크립트 실행 중 오류 발생:\n{str(e)}")
 
+    def init_network(self):
+        from PPS_Player.core.network_client import NetworkClient
+        from PPS_Player.core.media_sync import MediaSync
+
+        server_url = self.config.get("server_url")
+        store_id = self.config.get("store_id")
+        if not server_url or not store_id:
+            return
+        self.network_client = NetworkClient(
+            server_url,
+            store_id,
+            interval=self.config.get("poll_interval"),
+            timeout=self.config.get("poll_timeout"),
+            long_poll=self.config.get("poll_long_poll"),
+            long_poll_wait=self.config.get("poll_long_poll_wait"),
+            parent=self,
+        )
+        self.network_client.start_polling(self.handle_commands)
+
+        if self.config.get("media_sync_enabled"):
+            self.media_sync = MediaSync(
+                self.network_client,
+                resolve_path(self.config.get("media_store_dir")),
+                manifest_path=self.config.get("media_manifest_path"),
+                interval=self.config.get("media_sync_interval"),
+                quota_bytes=self.config.get("media_store_quota_mb") * 1024 * 1024,
+                workers=self.config.get("media_sync_workers"),
+                parent=self,
+            )
+            # 네트워크가 끊겨 있어도 마지막으로 받은 목록으로 바로 재생
+            cached = self.media_sync.load_cached_playlist()
+            if cached:
+                self.bottom_viewer.set_playlist(cached)
+            self.media_sync.playlist_ready.connect(self.bottom_viewer.set_playlist)
+            self.media_sync.start()
+
+    def init_proof_of_play(self):
+        if not self.config.get("pop_enabled"):
+            return
+        from PPS_Player.core.proof_of_play import PlayJournal, ProofOfPlay
+
+        # 서버 설정이 없어도 기록은 남기고, NetworkClient 가 생기면 그때부터 업로드
+        journal = PlayJournal(
+            resolve_path(self.config.get("pop_dir")),
+            segment_events=self.config.get("pop_segment_events"),
+            segment_seconds=self.config.get("pop_segment_seconds"),
+            fsync_interval=self.config.get("pop_fsync_interval"),
+            quota_bytes=self.config.get("pop_quota_mb") * 1024 * 1024,
+        )
+        self.proof_of_play = ProofOfPlay(
+            journal,
+            network_client=self.network_client,
+            upload_path=self.config.get("pop_upload_path"),
+            upload_interval=self.config.get("pop_upload_interval"),
+            asset_name=lambda path: self.media_sync.asset_name(path) if self.media_sync is not None else None,
+        )
+        self.bottom_viewer.media_finished.connect(self.proof_of_play.record)
+        self.proof_of_play.start()
+
+    def init_schedule(self):
+        self.scheduler.segment_changed.connect(self.on_segment_changed)
+        self.scheduler.segment_upcoming.connect(self.on_segment_upcoming)
+        self.scheduler.start()
+
+    # 편성 구간에 값이 없으면 기본 설정(url/media_paths/media_interval) 사용
+    def segment_url(self, segment):
+        rule = segment.rule
+        return rule.url if rule is not None and rule.url else self.config.get("url")
+
+    def segment_media_paths(self, segment):
+        rule = segment.rule
+        if rule is not None and rule.media_paths is not None:
+            return rule.media_paths
+        return self.config.get("media_paths")
+
+    def segment_interval(self, segment):
+        rule = segment.rule
+        return rule.interval if rule is not None and rule.interval else self.config.get("media_interval")
+
+    def on_segment_changed(self, segment):
+        self.segment = segment
+        self.apply_segment()
+
+    def apply_segment(self):
+        # 실제로 바뀐 항목만 반영 (같은 URL 재로딩/같은 소스 재스캔 없음)
+        url = self.segment_url(self.segment)
+        if url != self.web_host.url:
+            self.web_host.load(url)
+        media_paths = self.segment_media_paths(self.segment)
+        if media_paths != self.media_library.sources:
+            self.media_library.set_sources(media_paths)
+        # set_interval 은 현재 슬라이드 타이머를 다시 시작하므로 값이 바뀐 경우에만
+        interval = self.segment_interval(self.segment)
+        if interval != self.bottom_viewer.interval:
+            self.bottom_viewer.set_interval(interval)
+
+    def update_retained_sources(self):
+        # 편성 규칙이 쓰는 소스는 지금 재생 중이 아니어도 인덱스에 남겨 둠
+        sources = [rule.media_paths for rule in self.scheduler.rules if rule.media_paths is not None]
+        sources.append(self.config.get("media_paths"))
+        self.media_library.set_retained_sources(sources)
+
+    def on_media_paths_changed(self):
+        self.update_retained_sources()
+        self.apply_segment()
+
+    def on_schedule_changed(self, rules):
+        self.scheduler.set_rules(rules)
+        self.update_retained_sources()
+
+    def on_segment_upcoming(self, segment):
+        # 다음 구간 시작 전에 웹 페이지를 뒤에서 로딩하고 미디어를 probe/디코딩해 둠
+        self.web_host.prepare(self.segment_url(segment))
+        media_paths = self.segment_media_paths(segment)
+        if media_paths != self.media_library.sources:
+            self.media_library.prepare(media_paths)
+
+    def bind_config(self):
+        # 바뀐 키만 해당 구성요소에 반영 (위젯 재생성 없음)
+        self.config.subscribe("url", lambda _: self.apply_segment())
+        self.config.subscribe("web_refresh_interval",
+                              lambda ms: self.refresh_scheduler.set_interval(self.refresh_interval(ms)))
+        self.config.subscribe("web_refresh_mode", self.refresh_scheduler.set_mode)
+        self.config.subscribe("web_renderer_max_mb", lambda mb: setattr(self.web_host, "renderer_max_mb", mb))
+        self.config.subscribe("web_recycle_mode", lambda mode: setattr(self.web_host, "mode", mode))
+        self.config.subscribe("web_recycle_hours", self.web_host.set_recycle_hours)
+        self.config.subscribe("web_memory_check_interval", self.web_host.set_check_interval)
+        self.config.subscribe("bottom_height", self.bottom_viewer.setFixedHeight)
+        self.config.subscribe("media_rolling", self.bottom_viewer.set_rolling)
+        self.config.subscribe("media_interval", lambda _: self.apply_segment())
+        self.config.subscribe("image_prefetch_count", self.bottom_viewer.set_prefetch_count)
+        self.config.subscribe("gif_loops", lambda loops: setattr(self.bottom_viewer, "gif_loops", loops))
+        self.config.subscribe("media_paths", lambda _: self.on_media_paths_changed())
+        self.config.subscribe("schedule", self.on_schedule_changed)
+        self.config.subscribe("schedule_prefetch_s", self.scheduler.set_prefetch_lead)
+        self.config.subscribe("music_paths", self.on_music_paths_changed)
+        self.config.subscribe("music_mode", self.music_player.set_mode)
+        self.config.subscribe("music_crossfade_ms", self.music_player.set_crossfade)
+        self.config.subscribe("music_volume", self.music_player.set_volume)
+        self.config.subscribe("music_duck_volume", self.music_player.set_duck_volume)
+        self.config.subscribe("tts_queue_size", lambda size: setattr(self.tts_worker, "max_queue", max(1, size)))
+        self.config.subscribe("tts_overflow", lambda policy: setattr(self.tts_worker, "overflow", policy))
+        for key in ("server_url", "store_id", "poll_interval", "poll_timeout",
+                    "poll_long_poll", "poll_long_poll_wait"):
+            self.config.subscribe(key, lambda _: self.on_network_config_changed())
+
+    @staticmethod
+    def refresh_interval(ms):
+        return max(ms, 5000)
+
+    def on_library_playlist(self, playlist):
+        # 미디어 동기화 사용 중에는 서버 매니페스트가 재생 목록을 결정
+        if self.media_sync is None:
+            self.bottom_viewer.set_playlist(playlist)
+
+    def on_network_config_changed(self):
+        if self.network_client is None:
+            self.init_network()
+            if self.proof_of_play is not None:
+                self.proof_of_play.network_client = self.network_client
+            return
+        if not self.config.get("server_url") or not self.config.get("store_id"):
+            # 빈 주소로 계속 폴링하지 않음 (업로드/동기화는 server_url 이 비면 건너뜀)
+            self.network_client.stop_polling(wait=False)
+            self.network_client.update_settings(server_url="", store_id="")
+            return
+        self.network_client.update_settings(
+            server_url=self.config.get("server_url"),
+            store_id=self.config.get("store_id"),
+            interval=self.config.get("poll_interval"),
+            timeout=self.config.get("poll_timeout"),
+            long_poll=self.config.get("poll_long_poll"),
+            long_poll_wait=self.config.get("poll_long_poll_wait"),
+        )
+        self.network_client.start_polling()
+
+    def handle_commands(self, data):
+        # 서버 응답은 명령 1개(dict) 또는 명령 목록(list)
+        commands = data if isinstance(data, list) else [data]
+        for command in commands:
+            if not isinstance(command, dict):
+                continue
+            name = command.get("command")
+            logger.info("📡 서버 명령 수신: %s", name)
+            if name == "tts":
+                self.tts_worker.enqueue(command.get("text", ""),
+                                        PRIORITY_HIGH if command.get("urgent") else PRIORITY_NORMAL)
+            elif name == "reload":
+                self.center_view.reload()
+            elif name == "refresh":
+                self.refresh_scheduler.request_now()
+            elif name == "url" and command.get("url"):
+                self.web_host.load(command["url"])
+            elif name == "schedule" and isinstance(command.get("rules"), list):
+                # 설정 파일에 저장해 재시작 후에도 유지 (schedule 구독으로 타임라인 재컴파일)
+                self.config.set("schedule", command["rules"])
+            elif name == "recycle":
+                self.web_host.recycle("command")
+            elif name == "clear_cache":
+                self.cleanup_web_cache()
+            else:
+                logger.warning("⚠️ 알 수 없는 서버 명령: %s", command)
+
+    def closeEvent(self, event):
+        if self.metrics_service is not None:
+            self.metrics_service.stop()
+        if self.media_sync is not None:
+            self.media_sync.stop()
+        if self.media_library is not None:
+            self.media_library.stop()
+        if self.proof_of_play is not None:
+            # 현재 표시 중인 항목까지 기록한 뒤 저널 봉인 (업로드는 다음 실행 시)
+            self.bottom_viewer.end_play(completed=False)
+            self.proof_of_play.stop()
+        if self.network_client is not None:
+            self.network_client.close()
+        if self.music_player is not None:
+            self.music_player.stop()
+        self.tts_worker.stop()
+        self.scheduler.stop()
+        self.refresh_scheduler.stop()
+        self.web_host.shutdown()
+        super().closeEvent(event)
+
     def cleanup_web_cache(self):
-        pass
+        self.web_host.clear_cache()
 
     def update_button_position(self):
         pass
@@ -153,33 +504,30 @@ class MainWindow(QWidget):
         self.is_fullscreen = True
         self.fullscreen_button.hide()
         self.exit_fullscreen_button.hide()
-        self.bottom_viewer.set_fullscreen(True)
+        if self.bottom_viewer is not None:
+            self.bottom_viewer.set_fullscreen(True)
+        self.screen_manager.watch_cursor(True)
 
     def exit_fullscreen(self):
         self.showNormal()
         self.is_fullscreen = False
         self.fullscreen_button.show()
         self.exit_fullscreen_button.hide()
-        self.bottom_viewer.set_fullscreen(False)
+        if self.bottom_viewer is not None:
+            self.bottom_viewer.set_fullscreen(False)
+        self.screen_manager.watch_cursor(False)
 
-    def check_mouse_position(self):
-        if self.is_fullscreen:
-            cursor_y = self.mapFromGlobal(self.cursor().pos()).y()
-            if cursor_y < 60:
-                self.exit_fullscreen_button.show()
-            else:
-                self.exit_fullscreen_button.hide()
-        else:
-            self.exit_fullscreen_button.hide()
-            self.fullscreen_button.show()
+    def check_mouse_position(self, in_zone):
+        # 전체화면에서 커서가 상단 영역에 들어오거나 나갈 때만 호출됨
+        self.exit_fullscreen_button.setVisible(self.is_fullscreen and in_zone)
 
-    def check_monitor_change(self):
+    def check_monitor_change(self, *args):
         screens = QApplication.screens()
         if len(screens) > 1:
             second = screens[1]
             if self.current_screen_index != 1:
                 geo = second.geometry()
-                print("🖥️ 2번 모니터 감지됨. 전체화면 전환 중...")
+                logger.info("🖥️ 2번 모니터 감지됨. 전체화면 전환 중...")
                 self.move(geo.x(), geo.y())
                 self.resize(geo.width(), geo.height())
                 self.enter_fullscreen()
@@ -188,7 +536,7 @@ class MainWindow(QWidget):
             primary = QApplication.primaryScreen()
             if self.current_screen_index != 0:
                 geo = primary.geometry()
-                print("⬅️ 2번 모니터 사라짐. 1번으로 복귀...")
+                logger.info("⬅️ 2번 모니터 사라짐. 1번으로 복귀...")
                 self.showNormal()
                 self.move(geo.x(), geo.y())
                 self.resize(1024, 768)
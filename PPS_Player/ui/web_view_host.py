@@ -0,0 +1,336 @@
+# PPS_Player/ui/web_view_host.py
+# ---------------------------
+# Version History
+# v0.1.0 - 2026.10.18 - QtWebEngine 관리: 전용 프로필(캐시 상한), 렌더러 메모리 점검, 예비 뷰 교체로 무중단 재활용, TTS 패치 1회 설치
+# v0.1.1 - 2026.10.18 - 대시보드 갱신 완료 콘솔 메시지(PPS_REFRESH_DONE), 현재 뷰 로딩 상태 시그널
+# v0.2.0 - 2026.10.18 - prepare(): 다음 편성 URL 을 예비 뷰에서 미리 로딩, load() 시 같은 URL 이면 즉시 교체.
+#                       화면에 보이지 않는 뷰의 TTS 요청은 무시
+# v0.2.1 - 2026.10.18 - 렌더러 RSS 조회 실패 시 1회 경고, 메모리 기준 재활용 재시도 간격(지수 증가) 적용
+# v0.2.2 - 2026.10.18 - load() 시 이전 URL 로 로딩 중인 재활용 예비 뷰 취소 (로딩 완료 후 이전 페이지로 되돌아가던 문제)
+# ---------------------------
+
+import logging
+import os
+import time
+
+from PyQt6.QtCore import QTimer, QUrl, pyqtSignal
+from PyQt6.QtWebEngineCore import QWebEnginePage, QWebEngineProfile, QWebEngineScript
+from PyQt6.QtWebEngineWidgets import QWebEngineView
+from PyQt6.QtWidgets import QStackedWidget
+
+from PPS_Player.core.metrics import metrics
+from PPS_Player.core.tts_worker import PRIORITY_HIGH, PRIORITY_NORMAL
+from PPS_Player.utils.utils import process_rss_bytes
+
+logger = logging.getLogger(__name__)
+
+# 메모리 기준 재활용 후에도 계속 상한을 넘으면 재활용 간격을 2배씩 늘림 (초)
+RECYCLE_COOLDOWN = 600
+MAX_RECYCLE_COOLDOWN = 6 * 3600
+
+TTS_SCRIPT_NAME = "TTSInject"
+REFRESH_DONE_PREFIX = "PPS_REFRESH_DONE:"
+
+# 문서마다 한 번만 설치 (DOM 변경마다 다시 실행하지 않음)
+TTS_PATCH_JS = '''
+(function() {
+  if (window.__ppsTTSPatched) return;
+  window.__ppsTTSPatched = true;
+  if (typeof window.speechSynthesis === "undefined") {
+    window.speechSynthesis = {
+      speak: function(u) {
+        if (u && u.text) console.log("TTS:" + u.text);
+      }
+    };
+  }
+  if (typeof SpeechSynthesisUtterance === "undefined") {
+    window.SpeechSynthesisUtterance = function(text) {
+      console.log("TTS:" + text);
+      return { text: text };
+    };
+  }
+  console.log("✅ speech patch injected");
+})();
+'''
+
+
+class CustomWebPage(QWebEnginePage):
+    # (문장, 우선순위) - 콘솔 메시지 "TTS:..." 는 일반, "TTS!:..." 는 긴급 발화
+    tts_requested = pyqtSignal(str, int)
+    # (갱신 번호, 결과) - RefreshScheduler 가 실행한 dashboard_update() 완료 알림
+    refresh_done = pyqtSignal(int, str)
+
+    def javaScriptConsoleMessage(self, level, msg, line, sourceID):
+        if msg.startswith(REFRESH_DONE_PREFIX):
+            seq, _, result = msg[len(REFRESH_DONE_PREFIX):].partition(":")
+            if seq.isdigit():
+                self.refresh_done.emit(int(seq), result)
+        elif msg.startswith("TTS!:"):
+            text = msg[5:].strip()
+            logger.info("🔊 TTS 감지(긴급): %s", text)
+            self.tts_requested.emit(text, PRIORITY_HIGH)
+        elif msg.startswith("TTS:"):
+            text = msg[4:].strip()
+            logger.info("🔊 TTS 감지: %s", text)
+            self.tts_requested.emit(text, PRIORITY_NORMAL)
+
+
+class WebViewHost(QStackedWidget):
+    """대시보드 웹뷰를 담는 위젯. 항상 view 하나가 보이고, 재활용 시에만 예비 뷰를 추가로 만든다.
+
+    - 전용 QWebEngineProfile: cache_dir 아래 디스크(또는 메모리) HTTP 캐시, cache_mb 상한
+    - check_interval 초마다 렌더러 RSS 확인 (Qt 6.6+ renderProcessPid), renderer_max_mb 초과 시 재활용
+    - recycle_hours 마다 예약 재활용, 렌더러 비정상 종료 시 즉시 재활용
+    - 재활용: mode "swap" 은 새 페이지를 뒤에서 로딩 완료한 뒤 교체 후 이전 페이지 삭제,
+      mode "reload" 는 현재 페이지 reload()
+    - prepare(url): 다음에 표시할 URL 을 뒤에서 미리 로딩해 두고, load(url) 때 그 뷰로 바로 교체
+    """
+    tts_requested = pyqtSignal(str, int)
+    refresh_done = pyqtSignal(int, str)
+    loading_changed = pyqtSignal(bool)  # 현재 보이는 뷰의 로딩 시작/끝
+    view_changed = pyqtSignal(object)  # 새로 보이는 QWebEngineView
+
+    def __init__(self, url, cache_dir, cache_mb=50, cache_mode="disk", check_interval=60,
+                 renderer_max_mb=800, recycle_hours=24, mode="swap", parent=None):
+        super().__init__(parent)
+        self.url = url
+        self.renderer_max_mb = renderer_max_mb
+        self.mode = mode
+        self.standby = None
+        self.recycle_reason = None
+        self.prepared = None
+        self.prepared_url = None
+        self.prepared_ready = None
+        self.loading = False
+        self.rss_warned = False
+        self.memory_recycles = 0  # 상한을 넘은 상태로 연속 재활용한 횟수
+        self.next_memory_recycle = 0.0
+
+        self.profile = QWebEngineProfile("PPS_Player", self)
+        self.configure_profile(cache_dir, cache_mb, cache_mode)
+        self.install_tts_patch()
+
+        self.view = self.create_view()
+        self.addWidget(self.view)
+        self.view.load(QUrl(url))
+
+        self.memory_timer = QTimer(self)
+        self.memory_timer.timeout.connect(self.check_memory)
+        self.set_check_interval(check_interval)
+
+        self.recycle_timer = QTimer(self)
+        self.recycle_timer.timeout.connect(lambda: self.recycle("schedule"))
+        self.set_recycle_hours(recycle_hours)
+
+    # ---------- 프로필 ----------
+    def configure_profile(self, cache_dir, cache_mb, cache_mode="disk"):
+        os.makedirs(cache_dir, exist_ok=True)
+        self.profile.setCachePath(os.path.join(cache_dir, "http"))
+        self.profile.setPersistentStoragePath(os.path.join(cache_dir, "storage"))
+        cache_type = (QWebEngineProfile.HttpCacheType.MemoryHttpCache if cache_mode == "memory"
+                      else QWebEngineProfile.HttpCacheType.DiskHttpCache)
+        self.profile.setHttpCacheType(cache_type)
+        self.profile.setHttpCacheMaximumSize(max(1, cache_mb) * 1024 * 1024)
+
+    def install_tts_patch(self):
+        scripts = self.profile.scripts()
+        if scripts.find(TTS_SCRIPT_NAME):
+            return
+        script = QWebEngineScript()
+        script.setName(TTS_SCRIPT_NAME)
+        script.setInjectionPoint(QWebEngineScript.InjectionPoint.DocumentReady)
+        script.setRunsOnSubFrames(True)
+        script.setWorldId(QWebEngineScript.ScriptWorldId.MainWorld)
+        script.setSourceCode(TTS_PATCH_JS)
+        scripts.insert(script)
+
+    def clear_cache(self):
+        self.profile.clearHttpCache()
+        self.profile.clearAllVisitedLinks()
+
+    # ---------- 뷰 ----------
+    def create_view(self):
+        view = QWebEngineView(self)
+        page = CustomWebPage(self.profile, view)
+        view.setPage(page)
+        # 뒤에서 로딩 중인 예비/사전 로딩 뷰가 같은 안내를 중복 발화하지 않도록 현재 뷰만 전달
+        page.tts_requested.connect(
+            lambda text, priority, view=view: self.on_tts_requested(view, text, priority))
+        page.refresh_done.connect(self.refresh_done)
+        view.loadStarted.connect(lambda view=view: self.on_load_state(view, True))
+        view.loadFinished.connect(lambda ok, view=view: self.on_load_state(view, False))
+        page.renderProcessTerminated.connect(
+            lambda status, code, page=page: self.on_render_process_terminated(page, status, code))
+        return view
+
+    def on_tts_requested(self, view, text, priority):
+        if view is self.view:
+            self.tts_requested.emit(text, priority)
+
+    def on_load_state(self, view, loading):
+        # 뒤에서 로딩 중인 예비 뷰의 상태는 알리지 않음
+        if view is not self.view or loading == self.loading:
+            return
+        self.loading = loading
+        self.loading_changed.emit(loading)
+
+    def page(self):
+        return self.view.page()
+
+    def load(self, url):
+        if self.prepared is not None and self.prepared_url == url:
+            self.swap_prepared()
+            return
+        self.discard_prepared()
+        # 진행 중이던 재활용은 이전 URL 기준이므로 취소 (완료되면 이전 페이지로 되돌아감)
+        self.discard_standby()
+        self.url = url
+        self.view.load(QUrl(url))
+
+    def prepare(self, url):
+        """url 을 화면 뒤의 뷰에서 미리 로딩 (렌더러 1개가 추가로 뜸). 현재 URL 이면 아무것도 안 함."""
+        if not url or url == self.url or url == self.prepared_url:
+            return
+        self.discard_prepared()
+        self.prepared = self.create_view()
+        self.prepared_url = url
+        self.prepared_ready = None  # None: 로딩 중
+        self.addWidget(self.prepared)
+        self.prepared.loadFinished.connect(self.on_prepared_loaded)
+        self.prepared.load(QUrl(url))
+
+    def on_prepared_loaded(self, ok):
+        self.prepared_ready = ok
+        if not ok:
+            logger.warning("웹뷰 사전 로딩 실패, 전환 시 다시 로딩: %s", self.prepared_url)
+
+    def swap_prepared(self):
+        prepared, self.prepared = self.prepared, None
+        prepared.loadFinished.disconnect(self.on_prepared_loaded)
+        if self.prepared_ready is False:
+            prepared.load(QUrl(self.prepared_url))
+        # 진행 중이던 재활용은 이전 URL 기준이므로 취소
+        self.discard_standby()
+        self.url = self.prepared_url
+        self.prepared_url = None
+        old, self.view = self.view, prepared
+        self.setCurrentWidget(prepared)
+        self.discard(old)
+        metrics.inc("web_prepared_swaps")
+        logger.info("🔄 사전 로딩된 웹뷰로 전환: %s", self.url)
+        self.view_changed.emit(prepared)
+        # 아직 로딩 중이면 이어서 사용 (처음부터 다시 로딩하는 것보다 빠름), 끝나면 loadFinished 로 알림
+        self.on_load_state(prepared, self.prepared_ready is not True)
+
+    def discard_prepared(self):
+        if self.prepared is None:
+            return
+        self.discard(self.prepared)
+        self.prepared = None
+        self.prepared_url = None
+
+    def discard_standby(self):
+        if self.standby is None:
+            return
+        self.standby.loadFinished.disconnect(self.on_standby_loaded)
+        self.discard(self.standby)
+        self.standby = None
+
+    def reload(self):
+        self.view.reload()
+
+    def run_javascript(self, source):
+        self.view.page().runJavaScript(source)
+
+    # ---------- 점검/재활용 ----------
+    def set_check_interval(self, seconds):
+        if seconds > 0:
+            self.memory_timer.start(int(seconds * 1000))
+        else:
+            self.memory_timer.stop()
+
+    def set_recycle_hours(self, hours):
+        if hours > 0:
+            # QTimer 간격 상한(약 24일)
+            self.recycle_timer.start(min(int(hours * 3600 * 1000), 2 ** 31 - 1))
+        else:
+            self.recycle_timer.stop()
+
+    def renderer_rss_bytes(self):
+        pid = self.view.page().renderProcessPid()  # Qt 6.6+
+        return process_rss_bytes(pid) if pid else None
+
+    def check_memory(self):
+        rss = self.renderer_rss_bytes()
+        if rss is None:
+            if not self.rss_warned and self.view.page().renderProcessPid():
+                self.rss_warned = True
+                logger.warning("렌더러 메모리를 조회할 수 없어 메모리 기준 재활용을 하지 않음 (psutil 확인)")
+            return
+        metrics.set_gauge("webengine_renderer_rss_bytes", rss)
+        if not self.renderer_max_mb or rss <= self.renderer_max_mb * 1024 * 1024:
+            self.memory_recycles = 0
+            return
+        now = time.monotonic()
+        if now < self.next_memory_recycle:
+            # 재활용 직후에도 상한을 넘는 페이지를 점검 주기마다 다시 불러오지 않음
+            metrics.inc("web_recycles_deferred")
+            return
+        self.memory_recycles += 1
+        cooldown = min(RECYCLE_COOLDOWN * 2 ** (self.memory_recycles - 1), MAX_RECYCLE_COOLDOWN)
+        self.next_memory_recycle = now + cooldown
+        logger.warning("🧹 렌더러 메모리 %.0fMB > %dMB, 재활용 (다음 재활용은 %d초 이후)",
+                       rss / 1048576, self.renderer_max_mb, cooldown)
+        self.recycle("memory")
+
+    def on_render_process_terminated(self, page, status, exit_code):
+        if page is not self.view.page():
+            return
+        logger.warning("💥 렌더러 종료 (status=%s, code=%s), 재활용", status, exit_code)
+        self.recycle("crash")
+
+    def recycle(self, reason):
+        if self.standby is not None:
+            return
+        metrics.inc("web_recycles")
+        self.recycle_reason = reason
+        if self.mode == "reload" and reason != "crash":
+            self.view.reload()
+            return
+        # 새 뷰는 스택 뒤에서 로딩 → 완료되면 교체하므로 화면이 비지 않음
+        self.standby = self.create_view()
+        self.addWidget(self.standby)
+        self.standby.loadFinished.connect(self.on_standby_loaded)
+        self.standby.load(QUrl(self.url))
+
+    def on_standby_loaded(self, ok):
+        standby, self.standby = self.standby, None
+        if standby is None:
+            return
+        standby.loadFinished.disconnect(self.on_standby_loaded)
+        if not ok and self.recycle_reason != "crash":
+            logger.warning("예비 웹뷰 로딩 실패, 기존 화면 유지: %s", self.url)
+            self.discard(standby)
+            return
+        old, self.view = self.view, standby
+        self.setCurrentWidget(standby)
+        self.discard(old)
+        logger.info("🔄 웹뷰 교체 완료 (%s)", self.recycle_reason)
+        self.view_changed.emit(standby)
+        self.on_load_state(standby, False)
+
+    def shutdown(self):
+        # 프로필보다 페이지가 먼저 정리되어야 함 (종료 시 QtWebEngine 경고 방지)
+        self.memory_timer.stop()
+        self.recycle_timer.stop()
+        for view in (self.standby, self.prepared, self.view):
+            if view is not None:
+                view.page().deleteLater()
+        self.standby = None
+        self.prepared = None
+
+    def discard(self, view):
+        # 페이지를 먼저 지워야 렌더러 프로세스가 정리됨
+        self.removeWidget(view)
+        view.page().deleteLater()
+        view.deleteLater()
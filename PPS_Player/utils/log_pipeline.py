@@ -0,0 +1,353 @@
+# PPS_Player/utils/log_pipeline.py
+# ---------------------------
+# Version History
+# v0.1.0 - 2026.10.18 - 비동기 로그 파이프라인 (QueueHandler → 백그라운드 일괄 쓰기, 크기/날짜 회전, gzip 압축, 보관 기간/총 용량 제한, 반복 메시지 억제)
+# ---------------------------
+#
+# GUI 스레드는 로그 레코드를 큐에 넣기만 하고, 파일 쓰기/회전/압축/정리는 모두
+# QueueListener 스레드에서 처리한다. 파일 배치는 기존과 같이 logs/YYYY-MM/YYYY-MM-DD.log.
+
+import gzip
+import logging
+import logging.handlers
+import os
+import queue
+import shutil
+import sys
+import threading
+import time
+from datetime import datetime
+
+LOG_FORMAT = "%(asctime)s [%(levelname)s] %(message)s"
+
+_COMPRESSIBLE = (".log", ".jsonl")
+
+
+class RateLimitFilter(logging.Filter):
+    """같은 위치/형식의 메시지를 window 초 동안 burst 건까지만 통과시킴.
+
+    억제된 건수는 다음 창에서 처음 통과하는 레코드 끝에 덧붙인다.
+    여러 스레드에서 호출되므로 잠금으로 보호.
+    """
+
+    def __init__(self, burst=10, window=60.0):
+        super().__init__()
+        self.burst = burst
+        self.window = window
+        self._lock = threading.Lock()
+        self._buckets = {}  # key → [창 시작, 통과 수, 억제 수]
+
+    def filter(self, record):
+        if self.burst <= 0:
+            return True
+        key = (record.name, record.levelno, record.pathname, record.lineno, str(record.msg))
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None or now - bucket[0] >= self.window:
+                suppressed = bucket[2] if bucket is not None else 0
+                self._buckets[key] = [now, 1, 0]
+                if len(self._buckets) > 1000:
+                    self._expire(now)
+                if suppressed:
+                    record.msg = f"{record.msg} (직전 {self.window:.0f}초간 {suppressed}건 반복 억제)"
+                return True
+            if bucket[1] < self.burst:
+                bucket[1] += 1
+                return True
+            bucket[2] += 1
+            return False
+
+    def _expire(self, now):
+        for key in [k for k, b in self._buckets.items() if now - b[0] >= self.window and not b[2]]:
+            del self._buckets[key]
+
+
+class BatchFileHandler(logging.Handler):
+    """포맷된 레코드를 모았다가 한 번에 쓰는 파일 핸들러. QueueListener 스레드 전용.
+
+    - 날짜가 바뀌거나 파일이 max_bytes 를 넘으면 회전
+    - 회전 시(및 시작 시) 지난 로그/계측 파일을 gzip 으로 압축하고
+      retention_days 보다 오래된 파일, total_cap_bytes 를 넘는 오래된 파일을 삭제
+    """
+
+    def __init__(self, log_root, max_bytes=10 * 1024 * 1024, retention_days=30,
+                 total_cap_bytes=200 * 1024 * 1024, batch_size=200, flush_interval=2.0):
+        super().__init__()
+        self.log_root = log_root
+        self.max_bytes = max_bytes
+        self.retention_days = retention_days
+        self.total_cap_bytes = total_cap_bytes
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.stream = None
+        self.path = None
+        self.day = None
+        self.size = 0
+        self._buffer = []
+        self._last_write = time.monotonic()
+
+    def emit(self, record):
+        try:
+            self._buffer.append(self.format(record) + "\n")
+        except Exception:
+            self.handleError(record)
+            return
+        if (len(self._buffer) >= self.batch_size or record.levelno >= logging.ERROR
+                or time.monotonic() - self._last_write >= self.flush_interval):
+            self.flush()
+
+    def flush(self):
+        self.acquire()
+        try:
+            if self._buffer:
+                self._write("".join(self._buffer))
+                self._buffer = []
+            self._last_write = time.monotonic()
+        except OSError:
+            # 디스크 오류로 로그 때문에 앱이 멈추지 않도록 이번 묶음은 버림
+            self._buffer = []
+            self._close_stream()
+        finally:
+            self.release()
+
+    def close(self):
+        self.flush()
+        self._close_stream()
+        super().close()
+
+    def _write(self, text):
+        data = text.encode("utf-8")
+        now = datetime.now()
+        if self.stream is None or now.date() != self.day:
+            self._open(now)
+        elif self.size and self.size + len(data) > self.max_bytes:
+            self._rotate(now)
+        self.stream.write(data)
+        self.stream.flush()
+        self.size += len(data)
+
+    def _open(self, now):
+        self._close_stream()
+        self.day = now.date()
+        log_dir = os.path.join(self.log_root, now.strftime("%Y-%m"))
+        os.makedirs(log_dir, exist_ok=True)
+        self.path = os.path.join(log_dir, f"{now:%Y-%m-%d}.log")
+        self.stream = open(self.path, "ab")
+        self.size = self.stream.tell()
+        self.maintain()
+
+    def _rotate(self, now):
+        self._close_stream()
+        stem = self.path[:-len(".log")]
+        n = 1
+        while os.path.exists(f"{stem}.{n}.log") or os.path.exists(f"{stem}.{n}.log.gz"):
+            n += 1
+        os.replace(self.path, f"{stem}.{n}.log")
+        self._open(now)
+
+    def _close_stream(self):
+        if self.stream is not None:
+            try:
+                self.stream.close()
+            except OSError:
+                pass
+            self.stream = None
+
+    # ---------- 정리 ----------
+    def maintain(self):
+        try:
+            self.compress_old()
+            self.prune()
+        except OSError as e:
+            if sys.__stderr__ is not None:
+                sys.__stderr__.write(f"log maintenance failed: {e}\n")
+
+    def _files(self):
+        for root, _, names in os.walk(self.log_root):
+            for name in names:
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                yield path, stat
+
+    def _in_use(self, path):
+        # 현재 쓰는 로그와 오늘 계측 덤프(MetricsService 가 추가 중)는 건드리지 않음
+        if path == self.path:
+            return True
+        name = os.path.basename(path)
+        return name.endswith(".jsonl") and f"{datetime.now():%Y-%m-%d}" in name
+
+    def compress_old(self):
+        for path, stat in list(self._files()):
+            if not path.endswith(_COMPRESSIBLE) or self._in_use(path):
+                continue
+            tmp_path = path + ".gz.part"
+            with open(path, "rb") as src, gzip.open(tmp_path, "wb") as dst:
+                shutil.copyfileobj(src, dst)
+            # 보관 기간 계산이 원본 기준이 되도록 수정 시각 유지
+            os.utime(tmp_path, (stat.st_atime, stat.st_mtime))
+            os.replace(tmp_path, path + ".gz")
+            os.remove(path)
+
+    def prune(self):
+        files = [(stat.st_mtime, stat.st_size, path) for path, stat in self._files()]
+        cutoff = time.time() - self.retention_days * 86400
+        kept = []
+        for mtime, size, path in sorted(files):
+            if path.endswith(".part") or (self.retention_days and mtime < cutoff):
+                if not self._in_use(path):
+                    self._remove(path)
+                    continue
+            kept.append((mtime, size, path))
+        total = sum(size for _, size, _ in kept)
+        for mtime, size, path in kept:
+            if not self.total_cap_bytes or total <= self.total_cap_bytes:
+                break
+            if self._in_use(path):
+                continue
+            self._remove(path)
+            total -= size
+        self._remove_empty_dirs()
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _remove_empty_dirs(self):
+        for name in os.listdir(self.log_root):
+            path = os.path.join(self.log_root, name)
+            if os.path.isdir(path) and not os.listdir(path):
+                try:
+                    os.rmdir(path)
+                except OSError:
+                    pass
+
+
+class _BatchQueueListener(logging.handlers.QueueListener):
+    """큐가 flush_interval 동안 비어 있으면 쌓인 묶음을 내보내는 QueueListener."""
+
+    def __init__(self, log_queue, handler):
+        super().__init__(log_queue, handler, respect_handler_level=True)
+        self.batch_handler = handler
+
+    def dequeue(self, block):
+        while True:
+            try:
+                return self.queue.get(block, self.batch_handler.flush_interval)
+            except queue.Empty:
+                self.batch_handler.flush()
+
+
+class _StreamToLogger:
+    """sys.stdout/stderr 대체: 한 줄 단위로 logger 에 넘김 (print 잔여분, 외부 라이브러리 출력)."""
+
+    def __init__(self, logger, level):
+        self.logger = logger
+        self.level = level
+        self._partial = ""
+
+    def write(self, text):
+        lines = (self._partial + text).split("\n")
+        self._partial = lines.pop()
+        for line in lines:
+            if line.strip():
+                self.logger.log(self.level, line.rstrip())
+        return len(text)
+
+    def flush(self):
+        if self._partial.strip():
+            self.logger.log(self.level, self._partial.rstrip())
+        self._partial = ""
+
+    def isatty(self):
+        return False
+
+
+class LogPipeline:
+    """루트 로거에 QueueHandler 를 달고 BatchFileHandler 를 백그라운드에서 돌림.
+
+    start() 이후 configure() 로 설정을 바꿀 수 있음 (config.json 핫 리로드).
+    """
+
+    def __init__(self, log_root, level="INFO", max_bytes=10 * 1024 * 1024, retention_days=30,
+                 total_cap_bytes=200 * 1024 * 1024, rate_burst=10, rate_window=60.0,
+                 capture_stdio=False, console=False):
+        self.log_root = log_root
+        self.queue = queue.SimpleQueue()
+        self.file_handler = BatchFileHandler(log_root, max_bytes, retention_days, total_cap_bytes)
+        self.file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        self.rate_filter = RateLimitFilter(rate_burst, rate_window)
+        self.queue_handler = logging.handlers.QueueHandler(self.queue)
+        self.queue_handler.addFilter(self.rate_filter)
+        self.listener = _BatchQueueListener(self.queue, self.file_handler)
+        self.level = level
+        self.capture_stdio = capture_stdio
+        self.console = console
+        self._saved_stdio = None
+
+    def start(self):
+        os.makedirs(self.log_root, exist_ok=True)
+        root = logging.getLogger()
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+        root.addHandler(self.queue_handler)
+        if self.console and sys.__stderr__ is not None:
+            # 개발 시 콘솔 확인용 (배포 빌드는 콘솔 없음)
+            console = logging.StreamHandler(sys.__stderr__)
+            console.setFormatter(logging.Formatter(LOG_FORMAT))
+            console.addFilter(self.rate_filter)
+            root.addHandler(console)
+        self.set_level(self.level)
+        self.listener.start()
+        self.set_capture_stdio(self.capture_stdio)
+        return self
+
+    def stop(self):
+        self.set_capture_stdio(False)
+        logging.getLogger().removeHandler(self.queue_handler)
+        self.listener.stop()  # 큐에 남은 레코드 처리 후 종료
+        self.file_handler.close()
+
+    def configure(self, level=None, max_mb=None, retention_days=None, total_cap_mb=None,
+                  rate_burst=None, rate_window=None, capture_stdio=None):
+        # 정수/실수 대입은 원자적이므로 리스너 스레드와 별도 동기화 없이 반영
+        if level is not None:
+            self.set_level(level)
+        if max_mb is not None:
+            self.file_handler.max_bytes = max(1, max_mb) * 1024 * 1024
+        if retention_days is not None:
+            self.file_handler.retention_days = max(0, retention_days)
+        if total_cap_mb is not None:
+            self.file_handler.total_cap_bytes = max(0, total_cap_mb) * 1024 * 1024
+        if rate_burst is not None:
+            self.rate_filter.burst = rate_burst
+        if rate_window is not None:
+            self.rate_filter.window = rate_window
+        if capture_stdio is not None:
+            self.set_capture_stdio(capture_stdio)
+
+    def set_level(self, level):
+        value = logging.getLevelName(str(level).upper())
+        if not isinstance(value, int):
+            logging.warning("⚠️ 알 수 없는 로그 레벨: %r, INFO 사용", level)
+            value = logging.INFO
+        self.level = level
+        logging.getLogger().setLevel(value)
+
+    def set_capture_stdio(self, enabled):
+        if enabled and self._saved_stdio is None:
+            self._saved_stdio = (sys.stdout, sys.stderr)
+            sys.stdout = _StreamToLogger(logging.getLogger("stdout"), logging.INFO)
+            sys.stderr = _StreamToLogger(logging.getLogger("stderr"), logging.ERROR)
+        elif not enabled and self._saved_stdio is not None:
+            for stream in (sys.stdout, sys.stderr):
+                if isinstance(stream, _StreamToLogger):
+                    stream.flush()
+            sys.stdout, sys.stderr = self._saved_stdio
+            self._saved_stdio = None
+        self.capture_stdio = enabled
@@ -0,0 +1,32 @@
+# PPS_Player/utils/startup_profiler.py
+# ---------------------------
+# Version History
+# v0.1.0 - 2026.10.18 - 시작 단계별 소요 시간 측정 (--startup-profile)
+# ---------------------------
+
+import logging
+import time
+
+
+class StartupProfiler:
+    """시작 단계별 경과 시간을 기록해 로그에 남김. 비활성화 시 mark() 는 아무 일도 하지 않음."""
+
+    def __init__(self, enabled=False, started=None):
+        self.enabled = enabled
+        self.started = started if started is not None else time.perf_counter()
+        self.last = self.started
+        self.phases = []
+
+    def mark(self, phase):
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.phases.append((phase, now - self.last, now - self.started))
+        self.last = now
+
+    def report(self):
+        if not self.enabled:
+            return
+        logging.info("⏱️ 시작 프로파일 (%d 단계)", len(self.phases))
+        for phase, delta, total in self.phases:
+            logging.info("⏱️   %-24s +%8.1fms  누적 %8.1fms", phase, delta * 1000, total * 1000)
@@ -2,9 +2,90 @@
 # ---------------------------
 # Version History
 # v0.0.1 - 2025.04.25 - 최초 작성: 파일 존재 확인 유틸리티 추가 예정
+# v0.1.0 - 2026.10.18 - base 경로/상대 경로 해석 함수 추가 (캐시 디렉토리용)
+# v0.2.0 - 2026.10.18 - 프로세스 메모리(RSS) 조회 함수 추가 (벤치마크/계측용)
+# v0.2.1 - 2026.10.18 - 월별 로그 디렉토리 경로 함수 추가
+# v0.2.2 - 2026.10.18 - psutil 이 없을 때 Win32 API 로 다른 프로세스(웹엔진 렌더러) RSS 도 조회
 # ---------------------------
 
 import os
+import sys
+from datetime import datetime
+
+try:
+    import psutil
+except ImportError:  # 선택 의존성
+    psutil = None
 
 def file_exists(path):
-    return os.path.isfile(path)
\ No newline at end of file
+    return os.path.isfile(path)
+
+def get_base_path():
+    # PyInstaller 실행 시 exe 위치, 개발 시 PPS_Player 패키지 위치
+    if getattr(sys, 'frozen', False):
+        return os.path.dirname(sys.executable)
+    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def resolve_path(path):
+    # config.json 의 상대 경로는 base 경로 기준으로 해석
+    if os.path.isabs(path):
+        return path
+    return os.path.join(get_base_path(), path)
+
+def get_log_dir(when=None):
+    # logs/YYYY-MM (없으면 생성)
+    when = when or datetime.now()
+    log_dir = os.path.join(get_base_path(), "logs", when.strftime("%Y-%m"))
+    os.makedirs(log_dir, exist_ok=True)
+    return log_dir
+
+def process_rss_bytes(pid=None):
+    """프로세스 RSS(byte). 조회할 수 없으면 None. psutil(requirements) 이 없으면 /proc 또는 Win32 API 사용."""
+    pid = pid or os.getpid()
+    if psutil is not None:
+        try:
+            return psutil.Process(pid).memory_info().rss
+        except Exception:
+            return None
+    status_path = f"/proc/{pid}/status"
+    if os.path.exists(status_path):
+        with open(status_path, "r") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+        return None
+    if sys.platform == "win32":
+        return _win32_rss(pid)
+    return None
+
+def _win32_rss(pid):
+    import ctypes
+    from ctypes import wintypes
+
+    class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+        _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD),
+                    ("PeakWorkingSetSize", ctypes.c_size_t), ("WorkingSetSize", ctypes.c_size_t),
+                    ("QuotaPeakPagedPoolUsage", ctypes.c_size_t), ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t), ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                    ("PagefileUsage", ctypes.c_size_t), ("PeakPagefileUsage", ctypes.c_size_t)]
+
+    counters = PROCESS_MEMORY_COUNTERS()
+    counters.cb = ctypes.sizeof(counters)
+    kernel32 = ctypes.windll.kernel32
+    if pid == os.getpid():
+        handle = kernel32.GetCurrentProcess()
+        opened = False
+    else:
+        # PROCESS_QUERY_LIMITED_INFORMATION | PROCESS_VM_READ
+        kernel32.OpenProcess.restype = wintypes.HANDLE
+        handle = kernel32.OpenProcess(0x1000 | 0x0010, False, pid)
+        if not handle:
+            return None
+        opened = True
+    try:
+        if not ctypes.windll.psapi.GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):
+            return None
+        return counters.WorkingSetSize
+    finally:
+        if opened:
+            kernel32.CloseHandle(handle)
@@ -12,6 +12,7 @@ pyinstaller PPS_Player/app.py ^
   --windowed ^
   --exclude-module PyQt5.QtWebKit ^
   --exclude-module tests ^
+  --exclude-module PPS_Player.bench ^
   --add-data "config.json;." ^
   --add-data "resources;resources"
 